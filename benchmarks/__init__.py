@@ -0,0 +1,4 @@
+"""
+Micro-benchmarks for the lottery system. Run each module with
+`python -m benchmarks.<name> -h` from the repository root.
+"""
@@ -0,0 +1,60 @@
+"""
+Bytes-on-the-wire versus CPU tradeoff of streaming response compression.
+
+Generates one response per ticket count, draws its numbers up front so only
+serialization and compression are timed, then encodes it with every
+encoding/level combination:
+
+    python -m benchmarks.compression_benchmark -n 1000 100000
+"""
+import argparse
+import time
+
+from src.server.presentation import GenerateTicketController, ResponseEncoder
+
+CASES = [
+    ("identity", 6),
+    ("zlib", 1),
+    ("zlib", 6),
+    ("zlib", 9),
+    ("gzip", 1),
+    ("gzip", 6),
+]
+
+
+def measure(generationResponse, encoding, level, repeat):
+    best = None
+    for _ in range(repeat):
+        encoder = ResponseEncoder(encoding, level)
+        started = time.process_time()
+        size = sum(len(data) for data in encoder.encode(generationResponse.iterChunks()))
+        elapsed = time.process_time() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return size, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare response encodings by size and CPU time.")
+    parser.add_argument("-n", "--counts", type=int, nargs="+", default=[1000, 100000],
+                        help="Ticket counts to benchmark")
+    parser.add_argument("-t", "--type", default="max", choices=["max", "grand", "lottario"])
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per case; the fastest is kept")
+    args = parser.parse_args()
+
+    for count in args.counts:
+        generationResponse = GenerateTicketController("bench", args.type, count).execute()
+        for ticket in generationResponse.tickets:
+            ticket.numbers
+
+        rawSize, _ = measure(generationResponse, "identity", 6, 1)
+        print(f"\n{count} {args.type} tickets, {rawSize / 1024:.1f} KiB uncompressed")
+        print(f"{'encoding':<10} {'level':>5} {'bytes':>12} {'ratio':>7} {'cpu ms':>9} {'MiB/s in':>9}")
+        for encoding, level in CASES:
+            size, elapsed = measure(generationResponse, encoding, level, args.repeat)
+            throughput = rawSize / (1024 * 1024) / elapsed if elapsed else float("inf")
+            print(f"{encoding:<10} {level if encoding != 'identity' else '-':>5} {size:>12} "
+                  f"{rawSize / size:>6.1f}x {elapsed * 1000:>9.1f} {throughput:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Scaling of ThreadPoolTicketExecutor with the number of threads.
+
+Generates the same request on 1, 2, 4, ... threads and reports wall time,
+tickets per second and the speed-up over one thread. On a free-threaded
+build (python3.13t, GIL disabled) throughput should grow with the cores;
+with the GIL enabled the threads are forced on with ignoreGil, so the
+table shows the overhead the executor's fallback avoids:
+
+    python -m benchmarks.threading_benchmark -n 200000 --threads 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+from src.server.models.randomness import GENERATORS
+from src.server.services.converters import LotteryTypeConverter
+from src.server.services.parallel import ThreadPoolTicketExecutor, gilEnabled
+
+
+def measure(executor, ticketType, count, generator, seed, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        tickets = executor.generateTickets(ticketType, count, generator, seed)
+        for ticket in tickets:
+            ticket.numbers
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure ticket generation throughput by thread count.")
+    parser.add_argument("-n", "--count", type=int, default=200000, help="Tickets per request")
+    parser.add_argument("-t", "--type", default="max", choices=["max", "grand", "lottario"])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="Thread counts to benchmark")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Tickets per task")
+    parser.add_argument("--rng", choices=sorted(GENERATORS), default="mt")
+    parser.add_argument("--seed", help="Generate a seeded batch instead (counter-based generator)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per case; the fastest is kept")
+    args = parser.parse_args()
+
+    ticketType = LotteryTypeConverter().toTransient(args.type)
+    generator = GENERATORS[args.rng]()
+    source = f"seed {args.seed}" if args.seed is not None else args.rng
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gilEnabled() else 'disabled'}, "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"{args.count} {args.type} tickets from {source}, {args.chunk_size} per task")
+    print(f"{'threads':>7} {'seconds':>9} {'tickets/s':>11} {'speed-up':>9}")
+
+    baseline = None
+    for threads in args.threads:
+        executor = ThreadPoolTicketExecutor(threads, args.chunk_size, ignoreGil=True)
+        try:
+            elapsed = measure(executor, ticketType, args.count, generator, args.seed, args.repeat)
+        finally:
+            executor.close()
+        baseline = baseline or elapsed
+        print(f"{threads:>7} {elapsed:>9.3f} {args.count / elapsed:>11.0f} {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Loopback benchmark comparing the socket daemon's transports.
+
+Starts an in-process SocketDaemon (without daemonizing) for each transport
+and measures sequential request round trips from the matching client
+transport:
+
+    python -m benchmarks.transport_benchmark -r 2000 -n 1
+"""
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from src.server.presentation.socket import SocketDaemon
+from src.server.presentation.socket import transports as serverTransports
+from src.client import transports as clientTransports
+
+
+def startDaemon(transport):
+    daemon = SocketDaemon("nobody", "nogroup", pidFile=os.devnull, transport=transport)
+    thread = threading.Thread(target=daemon.run, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    return daemon, thread
+
+
+def stopDaemon(daemon, thread):
+    daemon._daemonRunning = False
+    daemon.sock.close()
+    thread.join(timeout=5)
+
+
+def roundTrip(transport, payload):
+    sock = transport.connect()
+    try:
+        sock.sendall(payload)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        sock.close()
+
+
+def measure(name, serverTransport, clientTransport, requests, count):
+    daemon, thread = startDaemon(serverTransport)
+    payload = json.dumps({"type": "max", "requestId": "bench", "count": count}).encode() + b"\n"
+    try:
+        for _ in range(min(100, requests)):
+            roundTrip(clientTransport, payload)
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            response = roundTrip(clientTransport, payload)
+            latencies.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+    finally:
+        stopDaemon(daemon, thread)
+
+    if response.startswith(b"[Error]"):
+        raise RuntimeError(response.decode())
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return (f"{name:<16} {requests / elapsed:>10.0f} req/s   "
+          f"p50 {statistics.median(latencies) * 1e6:>8.1f} us   "
+          f"p99 {p99 * 1e6:>8.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare TCP and Unix domain socket transports.")
+    parser.add_argument("-r", "--requests", type=int, default=2000, help="Round trips per transport")
+    parser.add_argument("-n", "--count", type=int, default=1, help="Tickets per request")
+    parser.add_argument("--port", type=int, default=50600, help="First TCP port to use")
+    args = parser.parse_args()
+
+    socketPath = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    cases = [
+        ("tcp",
+         serverTransports.TcpTransport(args.port),
+         clientTransports.TcpTransport(args.port)),
+        ("tcp+nodelay",
+         serverTransports.TcpTransport(args.port + 1, noDelay=True),
+         clientTransports.TcpTransport(args.port + 1, noDelay=True)),
+        ("unix",
+         serverTransports.UnixTransport(socketPath, mode=0o600),
+         clientTransports.UnixTransport(socketPath)),
+    ]
+
+    print(f"{args.requests} sequential requests of {args.count} ticket(s) each")
+    for name, serverTransport, clientTransport in cases:
+        # The daemon logs every connection to stdout; keep the report readable.
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = measure(name, serverTransport, clientTransport, args.requests, args.count)
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
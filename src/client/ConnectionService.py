@@ -1,72 +1,188 @@
 import socket
 import json
 import sys
+import time
+import zlib
+from .transports import TcpTransport
+
+# Asked for in the "trailer" field of every request; the daemon ends an
+# uncompressed response with it. This is the only definition of the marker.
+RESPONSE_TRAILER = b"\n[End]\n"
 
 class ConnectionService:
     """
-    Handles establishing a persistent connection to a local IPv6 server
+    Handles establishing a persistent connection to a local server
     with optional port reuse and robust retry logic.
+
+    By default it connects over IPv6 TCP to a port prompted from the user;
+    a transport (e.g. a Unix domain socket) can be supplied instead. With
+    acceptEncoding set, the server is asked to compress the response and
+    the service decompresses it transparently while receiving. Responses
+    cut short by a dropped connection raise ConnectionError: compressed ones
+    miss the end of their stream, uncompressed ones the trailer the request
+    asked the daemon to append.
+
+    With a RetryPolicy the service never prompts: request() reconnects with
+    exponential backoff and jitter, and an optional CircuitBreaker fails
+    fast while the daemon is known to be down. Only attempts that failed
+    before the whole request was sent are retried: the daemon does not
+    deduplicate requests, so one that reached it may already be served.
     """
 
-    def __init__(self, loggingService):
+    def __init__(self, loggingService, transport=None, acceptEncoding=None,
+                 retryPolicy=None, circuitBreaker=None, tcpOptions=None):
         """
         Initialize the ConnectionService.
 
         Args:
             loggingService (LoggingService): An instance of the logging service used for output.
+            transport (ITransport, optional): Transport used to reach the server.
+                                              If None, IPv6 TCP to a prompted port is used.
+            acceptEncoding (str, optional): "gzip" or "zlib" to request a compressed response.
+            retryPolicy (RetryPolicy, optional): Enables non-interactive retries in request().
+            circuitBreaker (CircuitBreaker, optional): Refuses requests while the daemon is down.
+            tcpOptions (dict, optional): TcpTransport keyword arguments (noDelay, sendBufferSize,
+                                         receiveBufferSize, fastOpen) used when no transport
+                                         is configured and connect() builds one for a port.
         """
+        if acceptEncoding not in (None, "gzip", "zlib"):
+            raise ValueError(f"Unsupported encoding: '{acceptEncoding}'")
         self.logger = loggingService
+        self.transport = transport
+        self.acceptEncoding = acceptEncoding
+        self.retryPolicy = retryPolicy
+        self.circuitBreaker = circuitBreaker
+        self.tcpOptions = dict(tcpOptions or {})
         self.socket = None
+        self.requestSent = False
 
     def sendJson(self, body, payloadLength=8192):
         """
         Send a JSON-encoded request body to the connected server and receive a response.
+        requestSent tells afterwards whether the whole request was sent.
 
         Args:
             body (dict): The dictionary to serialize and send as JSON.
-            payloadLength (int): Max bytes to receive from server. Default is 8192.
+            payloadLength (int): Bytes to receive from the server per read. Default is 8192.
 
         Returns:
             str: The decoded response from the server.
 
         Raises:
-            Exception: If any communication or socket error occurs.
+            ConnectionError: If the connection closed before the response ended.
+            Exception: If any other communication or socket error occurs.
         """
+        self.requestSent = False
         try:
             if self.socket is None:
                 raise RuntimeError("Socket is not connected. Call connect() first.")
 
-            jsonPayload = json.dumps(body)
+            body = dict(body, trailer=RESPONSE_TRAILER.decode())
+            if self.acceptEncoding:
+                body["accept_encoding"] = self.acceptEncoding
+            # The newline lets the daemon notice if the client goes away.
+            jsonPayload = json.dumps(body) + "\n"
             self.socket.sendall(jsonPayload.encode())
+            self.requestSent = True
             self.logger.printInfo("Request sent. Awaiting response...")
 
-            response = self.socket.recv(payloadLength).decode()
-            return response
+            # The server closes the connection after the response, which may
+            # span many reads.
+            chunks = []
+            decompressor = None
+            while True:
+                chunk = self.socket.recv(payloadLength)
+                if not chunk:
+                    break
+                if self.acceptEncoding and not chunks and decompressor is None \
+                        and not chunk.startswith(b"[Error]"):
+                    # wbits 32 + MAX_WBITS accepts both gzip and zlib headers.
+                    decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+                if decompressor is not None:
+                    chunk = decompressor.decompress(chunk)
+                chunks.append(chunk)
+
+            if decompressor is not None:
+                chunks.append(decompressor.flush())
+                if not decompressor.eof:
+                    raise ConnectionError("Response truncated: the compressed stream did not end")
+                return b"".join(chunks).decode()
+
+            response = b"".join(chunks)
+            if not response:
+                raise ConnectionError("The server closed the connection without a response")
+            if not response.endswith(RESPONSE_TRAILER):
+                raise ConnectionError("Response truncated: the connection closed before its end")
+            return response[:-len(RESPONSE_TRAILER)].decode()
 
         except Exception as e:
             self.logger.printError(f"Error while communicating with server: {e}")
             raise
         finally:
-            self.socket.close()
+            if self.socket is not None:
+                self.socket.close()
             self.socket = None
 
+    def request(self, body, payloadLength=8192):
+        """
+        Connect, send a request and receive its response, retrying under the
+        retry policy without any user interaction.
+
+        Failures to connect or to send the request are retried. Once the
+        whole request was sent, a timeout or a connection dropped before the
+        response ended is raised without retrying: the daemon does not
+        deduplicate requests, so it may already have generated the tickets.
+        A response starting with "[Error]" is a valid answer and is returned.
+
+        Args:
+            body (dict): The dictionary to serialize and send as JSON.
+            payloadLength (int): Bytes to receive from the server per read.
+
+        Returns:
+            str: The decoded response from the server.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker refuses the attempt.
+            ValueError: If no transport is configured.
+            OSError: The last failure once every attempt has failed, or the
+                     failure of an attempt that had sent the request.
+        """
+        def exchange():
+            self.__open()
+            return self.sendJson(body, payloadLength)
+
+        return self.__withRetries(exchange)
+
     def connect(self, port=None):
         """
-        Attempt to establish a TCP connection to IPv6 localhost.
+        Attempt to establish a connection to the server, over the configured
+        transport or TCP to IPv6 localhost.
         Keeps retrying until successful or the user cancels with Ctrl+C.
 
+        With a retry policy it never prompts: it retries with backoff and
+        raises once the attempts are exhausted.
+
         Args:
-            port (int, optional): The port number to use. If None, the user will be prompted.
+            port (int, optional): The port number to use when no transport is configured.
+                                  If None, the user will be prompted.
         """
+        if self.retryPolicy is not None:
+            if self.transport is None and port is not None:
+                self.transport = TcpTransport(port, **self.tcpOptions)
+            self.__withRetries(self.__open)
+            self.logger.printInfo(f"Connected to {self.transport.describe()}.\n")
+            return
+
         while True:
             try:
                 self.logger.clear()
-                if port is None:
-                    port = self.__getValidPort()
-                ip = "localhost"
-                self.socket = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-                self.logger.printInfo(f"Connecting to [{ip}]:{port} ...")
-                self.socket.connect((ip, port))
+                transport = self.transport
+                if transport is None:
+                    if port is None:
+                        port = self.__getValidPort()
+                    transport = TcpTransport(port, **self.tcpOptions)
+                self.logger.printInfo(f"Connecting to {transport.describe()} ...")
+                self.socket = transport.connect()
                 self.logger.printInfo("Connected successfully.\n")
                 return
 
@@ -84,6 +200,51 @@ class ConnectionService:
                 self.logger.printInfo("\nCancelled by user.")
                 sys.exit(1)
 
+    def __open(self):
+        if self.retryPolicy is not None:
+            self.socket = self.transport.connect(self.retryPolicy.connectTimeout)
+            self.socket.settimeout(self.retryPolicy.readTimeout)
+        else:
+            self.socket = self.transport.connect()
+
+    def __withRetries(self, operation):
+        """
+        Run an operation under the retry policy and circuit breaker; a
+        failure after the operation sent its request is not retried.
+        """
+        if self.transport is None:
+            raise ValueError("A transport (port or Unix socket) is required for non-interactive requests.")
+        attempts = self.retryPolicy.maxAttempts if self.retryPolicy else 1
+
+        for attempt in range(attempts):
+            if self.circuitBreaker is not None:
+                self.circuitBreaker.before()
+            self.requestSent = False
+            try:
+                result = operation()
+            except OSError as e:
+                if self.socket is not None:
+                    self.socket.close()
+                    self.socket = None
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordFailure()
+                if attempt + 1 == attempts:
+                    raise
+                if self.requestSent:
+                    self.logger.printError(f"Not retrying: the request reached {self.transport.describe()} "
+                                           f"and may already have been served")
+                    raise
+                delay = self.retryPolicy.delay(attempt)
+                self.logger.printError(
+                    f"Attempt {attempt + 1}/{attempts} to reach {self.transport.describe()} failed: {e}; "
+                    f"retrying in {delay * 1000:.0f} ms"
+                )
+                time.sleep(delay)
+            else:
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordSuccess()
+                return result
+
     def __getValidPort(self):
         """
         Prompt the user for a valid port number in the range 1024–65535.
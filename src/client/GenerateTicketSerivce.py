@@ -1,5 +1,8 @@
 import os
 import sys
+from .sinks import FileResponseSink
+
+DEFAULT_RESPONSE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'responses')
 
 class GenerateTicketService:
     """
@@ -7,14 +10,19 @@ class GenerateTicketService:
     including user prompts and saving the server response.
     """
 
-    def __init__(self, loggerService):
+    def __init__(self, loggerService, sink=None):
         """
         Initialize the service with a logger.
 
         Args:
             loggerService (LoggingService): Logger for output.
+            sink (IResponseSink, optional): Where successful responses are stored.
+                                            Defaults to one ticket_<requestId>.txt file
+                                            per response in the "responses" folder.
         """
         self.loggerService = loggerService
+        self.sink = sink if sink is not None else FileResponseSink(DEFAULT_RESPONSE_DIR)
+        self._buffered = []
 
     def promptRequest(self):
         """
@@ -38,9 +46,12 @@ class GenerateTicketService:
 
     def handleResponse(self, request, response):
         """
-        Handle the server response. If it's valid, save it to a file named 
-        ticket_<requestId>.txt inside a "responses" folder located in the same directory as this file.
-        Otherwise, print an error message.
+        Handle the server response. If it's valid, hand it to the response sink
+        (by default a file named ticket_<requestId>.txt inside a "responses" folder
+        located in the same directory as this file).
+        Otherwise (an "[Error]" or an empty response), print an error message.
+        A response buffered by the sink is only reported as saved once the sink
+        has stored it.
 
         Args:
             request (dict): The original request object containing 'requestId'.
@@ -55,17 +66,37 @@ class GenerateTicketService:
         requestId = request["requestId"]
         response = response.strip()
 
-        if response.startswith("[Error]"):
+        if not response:
+            self.loggerService.printError("No file was created: the server closed the connection without a response.")
+        elif response.startswith("[Error]"):
             message = response[len("[Error]"):].strip()
             self.loggerService.printError("No file was created due to server-side error:")
             self.loggerService.printError(message)
         else:
-            currentDir = os.path.dirname(os.path.abspath(__file__))
-            responseDir = os.path.join(currentDir, 'responses')
-            if not os.path.exists(responseDir):
-                os.makedirs(responseDir)
-            filename = f"ticket_{requestId}.txt"
-            filepath = os.path.join(responseDir, filename)
-            with open(filepath, "w") as f:
-                f.write(response)
-            self.loggerService.printInfo(f"Response saved to {filepath}")
+            self._buffered.append(requestId)
+            try:
+                location = self.sink.write(requestId, response)
+            except Exception:
+                self._buffered.pop()
+                raise
+            if location is not None:
+                self.__reportSaved(location)
+
+    def close(self):
+        """
+        Flush any responses still buffered by the sink and report them as
+        saved, or as lost if the sink fails.
+        """
+        try:
+            self.sink.close()
+        except OSError as e:
+            for requestId in self._buffered:
+                self.loggerService.printError(f"Response {requestId} was not saved: {e}")
+            self._buffered = []
+            return
+        self.__reportSaved(self.sink.describe())
+
+    def __reportSaved(self, location):
+        for requestId in self._buffered:
+            self.loggerService.printInfo(f"Response {requestId} saved to {location}")
+        self._buffered = []
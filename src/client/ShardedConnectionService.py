@@ -0,0 +1,207 @@
+import threading
+import time
+from .ConnectionService import ConnectionService
+from .sharding import HashRing
+
+
+class NoEndpointError(ConnectionError):
+    """
+    Raised when no endpoint could be sent a request, which makes it safe to
+    try the request again.
+    """
+
+
+class ShardedConnectionService:
+    """
+    Spreads requests across several daemon instances without user interaction.
+
+    Each request is routed by a consistent hash of its requestId, so a retry
+    of the same request reaches the same daemon. Endpoints that fail to
+    connect or answer are marked unhealthy; a request that could not be sent
+    to one fails over to the next endpoint on the ring. A background thread
+    re-probes unhealthy endpoints every probeInterval seconds and brings
+    them back once they accept connections.
+
+    With a RetryPolicy, a request that no endpoint could be sent is retried
+    as a whole with backoff, and an optional CircuitBreaker fails fast while
+    such rounds keep failing. A request that failed after it was sent (a
+    read timeout or a truncated response) is neither failed over nor
+    retried: the daemons do not deduplicate requests, so it may already
+    have been served.
+
+    It offers the same connect()/sendJson() interface as ConnectionService.
+    """
+
+    def __init__(self, loggingService, transports, acceptEncoding=None, connectTimeout=3.0,
+                 readTimeout=None, probeInterval=5.0, virtualNodes=160,
+                 retryPolicy=None, circuitBreaker=None):
+        """
+        Initialize the ShardedConnectionService.
+
+        Args:
+            loggingService (LoggingService): An instance of the logging service used for output.
+            transports (List[ITransport]): One transport per daemon instance.
+            acceptEncoding (str, optional): "gzip" or "zlib" to request a compressed response.
+            connectTimeout (float): Seconds allowed to connect to an endpoint.
+            readTimeout (float, optional): Seconds a single receive may block. None blocks.
+            probeInterval (float): Seconds between re-probes of unhealthy endpoints.
+            virtualNodes (int): Hash ring points per endpoint.
+            retryPolicy (RetryPolicy, optional): Attempts and backoff of failover rounds.
+            circuitBreaker (CircuitBreaker, optional): Fails fast after repeated failed rounds.
+
+        Raises:
+            ValueError: If no transports are given or two describe the same address.
+        """
+        self.logger = loggingService
+        self.transports = list(transports)
+        self.acceptEncoding = acceptEncoding
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.probeInterval = probeInterval
+        self.retryPolicy = retryPolicy
+        self.circuitBreaker = circuitBreaker
+        self.ring = HashRing([transport.describe() for transport in self.transports], virtualNodes)
+
+        self._healthy = [True] * len(self.transports)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._prober = None
+
+    def connect(self):
+        """
+        Probe every endpoint once and start the background re-probing.
+        Unlike ConnectionService.connect, it never prompts or blocks on input.
+        """
+        for position in range(len(self.transports)):
+            self.__probe(position)
+        healthy = sum(self._healthy)
+        self.logger.printInfo(f"{healthy} of {len(self.transports)} endpoint(s) reachable.\n")
+
+        if self._prober is None:
+            self._prober = threading.Thread(target=self.__probeLoop, name="endpoint-prober", daemon=True)
+            self._prober.start()
+
+    def sendJson(self, body, payloadLength=8192):
+        """
+        Send a request to the endpoint owning its requestId, failing over
+        along the ring while the request cannot be sent.
+
+        Healthy endpoints are tried first in ring order; endpoints already
+        marked unhealthy are tried last rather than not at all. Under a
+        retry policy, the whole round is retried with backoff.
+
+        Args:
+            body (dict): The request; its "requestId" is the routing key.
+            payloadLength (int): Bytes to receive from the server per read.
+
+        Returns:
+            str: The decoded response from the server.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker refuses the attempt.
+            NoEndpointError: If no endpoint could be sent the request.
+            OSError: If the request failed after it was sent to an endpoint.
+        """
+        attempts = self.retryPolicy.maxAttempts if self.retryPolicy else 1
+        for attempt in range(attempts):
+            if self.circuitBreaker is not None:
+                self.circuitBreaker.before()
+            try:
+                response = self.__failover(body, payloadLength)
+            except OSError as e:
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordFailure()
+                if attempt + 1 == attempts or not isinstance(e, NoEndpointError):
+                    raise
+                delay = self.retryPolicy.delay(attempt)
+                self.logger.printError(f"Attempt {attempt + 1}/{attempts} failed on every endpoint; "
+                                       f"retrying in {delay * 1000:.0f} ms")
+                time.sleep(delay)
+            else:
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordSuccess()
+                return response
+
+    def __failover(self, body, payloadLength):
+        """
+        Try the endpoints once, in failover order, until one was sent the request.
+
+        Raises:
+            NoEndpointError: If no endpoint could be sent the request.
+            OSError: If the request failed after it was sent to an endpoint.
+        """
+        order = list(self.ring.preference(str(body.get("requestId", ""))))
+        with self._lock:
+            order.sort(key=lambda position: not self._healthy[position])
+
+        errors = []
+        for position in order:
+            transport = self.transports[position]
+            service = ConnectionService(self.logger, transport, self.acceptEncoding)
+            try:
+                service.socket = transport.connect(self.connectTimeout)
+                service.socket.settimeout(self.readTimeout)
+                self.logger.printInfo(f"Routing request to {transport.describe()} ...")
+                response = service.sendJson(body, payloadLength)
+            except OSError as e:
+                self.__markUnhealthy(position, e)
+                if service.requestSent:
+                    raise
+                errors.append(f"{transport.describe()}: {e}")
+                continue
+            self.__markHealthy(position)
+            return response
+
+        raise NoEndpointError("No endpoint could serve the request (" + "; ".join(errors) + ")")
+
+    def healthy(self):
+        """
+        Returns:
+            List[str]: Descriptions of the endpoints currently considered healthy.
+        """
+        with self._lock:
+            return [transport.describe() for transport, healthy in zip(self.transports, self._healthy) if healthy]
+
+    def close(self):
+        """
+        Stop the background re-probing.
+        """
+        self._stopped.set()
+        if self._prober is not None:
+            self._prober.join()
+            self._prober = None
+
+    def __probeLoop(self):
+        while not self._stopped.wait(self.probeInterval):
+            with self._lock:
+                unhealthy = [position for position, healthy in enumerate(self._healthy) if not healthy]
+            for position in unhealthy:
+                if self._stopped.is_set():
+                    return
+                self.__probe(position)
+
+    def __probe(self, position):
+        """
+        A probe only opens and closes a connection; the daemon recognizes
+        the empty connection as a probe and does not log it.
+        """
+        try:
+            self.transports[position].connect(self.connectTimeout).close()
+        except OSError as e:
+            self.__markUnhealthy(position, e)
+        else:
+            self.__markHealthy(position)
+
+    def __markUnhealthy(self, position, error):
+        with self._lock:
+            changed = self._healthy[position]
+            self._healthy[position] = False
+        if changed:
+            self.logger.printError(f"Endpoint {self.transports[position].describe()} unhealthy: {error}")
+
+    def __markHealthy(self, position):
+        with self._lock:
+            changed = not self._healthy[position]
+            self._healthy[position] = True
+        if changed:
+            self.logger.printInfo(f"Endpoint {self.transports[position].describe()} is healthy again.")
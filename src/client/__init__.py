@@ -4,9 +4,15 @@ Exports service classes for the client of lottery system.
 from .ConnectionService import ConnectionService
 from .GenerateTicketSerivce import GenerateTicketService
 from .LoggingService import LoggingService
+from .ShardedConnectionService import NoEndpointError, ShardedConnectionService
+from .aio import AsyncTicketClient, TicketRequestError
 
 __all__ = [
     "ConnectionService",
     "GenerateTicketService",
-    "LoggingService"
+    "LoggingService",
+    "ShardedConnectionService",
+    "NoEndpointError",
+    "AsyncTicketClient",
+    "TicketRequestError"
 ]
\ No newline at end of file
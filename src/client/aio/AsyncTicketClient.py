@@ -0,0 +1,186 @@
+import asyncio
+import json
+from .HttpConnection import HttpConnection
+
+
+class TicketRequestError(ValueError):
+    """
+    Raised when the gateway rejects a request, e.g. with 400 for an
+    invalid ticket type.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncTicketClient:
+    """
+    asyncio client for the HTTP gateway, for embedding in async services.
+
+    Requests are sent over a pool of persistent keep-alive connections: up
+    to maxConnections requests are in flight at once, each on its own
+    connection, and further requests wait for a connection to be returned.
+    Idle connections are reused for idleTimeout seconds, which should stay
+    below the gateway's --keep-alive. A request that finds its reused
+    connection already closed by the server, before writing any of its
+    bytes, is sent on a new connection instead. Once written, a request is
+    never resent: the gateway does not deduplicate requests, so it may
+    already have been served, and the failure is raised.
+
+    The client never prints, prompts or exits; failures surface as
+    exceptions:
+
+        async with AsyncTicketClient("localhost", 8080) as client:
+            text = await client.generate("max", "order-17", 3)
+    """
+
+    def __init__(self, host="localhost", port=8080, maxConnections=8, connectTimeout=3.0,
+                 readTimeout=30.0, idleTimeout=10.0, acceptEncoding=None):
+        """
+        Initialize the client. No connection is opened until the first request.
+
+        Args:
+            host (str): Gateway host name or address. Default is "localhost".
+            port (int): Gateway port. Default is 8080.
+            maxConnections (int): Largest number of concurrent requests and open connections.
+            connectTimeout (float): Seconds allowed to open a connection.
+            readTimeout (float, optional): Seconds allowed for a whole request/response
+                                           exchange. None waits forever.
+            idleTimeout (float): Seconds an idle connection is kept for reuse.
+            acceptEncoding (str, optional): "gzip" or "deflate" to have responses compressed.
+
+        Raises:
+            ValueError: If maxConnections is not positive or the encoding is unknown.
+        """
+        if maxConnections < 1:
+            raise ValueError("'maxConnections' must be at least 1.")
+        if acceptEncoding not in (None, "gzip", "deflate"):
+            raise ValueError(f"Unsupported encoding: '{acceptEncoding}'")
+
+        self.host = host
+        self.port = port
+        self.maxConnections = maxConnections
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.idleTimeout = idleTimeout
+        self.acceptEncoding = acceptEncoding
+
+        self._slots = asyncio.Semaphore(maxConnections)
+        self._idle = []
+        self._closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def generate(self, type: str, requestId: str, count: int = 1) -> str:
+        """
+        Generate tickets.
+
+        Args:
+            type (str): "max", "grand" or "lottario".
+            requestId (str): Identifier of the request.
+            count (int): Number of tickets. Default is 1.
+
+        Returns:
+            str: The formatted generation response.
+
+        Raises:
+            TicketRequestError: If the gateway rejects the request.
+            OSError: If the gateway cannot be reached or the connection fails.
+            TimeoutError: If connecting or the exchange takes too long.
+        """
+        return await self.request({"type": type, "requestId": requestId, "count": count})
+
+    async def request(self, body: dict) -> str:
+        """
+        Send any request the gateway accepts, e.g. a seeded page, a wheel or
+        a {"batch": [...]} request, and return the response body as text.
+
+        Raises:
+            TicketRequestError: If the gateway rejects the request.
+            OSError: If the gateway cannot be reached or the connection fails.
+            TimeoutError: If connecting or the exchange takes too long.
+        """
+        status, data = await self.__send("POST", "/tickets", json.dumps(body).encode())
+        text = data.decode()
+        if status != 200:
+            raise TicketRequestError(status, self.__errorMessage(text, status))
+        return text
+
+    async def health(self) -> bool:
+        """
+        Returns True when the gateway answers its health probe.
+        """
+        try:
+            status, _ = await self.__send("GET", "/health")
+        except OSError:
+            return False
+        return status == 200
+
+    async def close(self):
+        """
+        Close the idle connections. Requests still in flight close their
+        connection when they finish.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            connection.close()
+
+    async def __send(self, method, target, body=b""):
+        if self._closed:
+            raise RuntimeError("AsyncTicketClient is closed.")
+        headers = {"Content-Type": "application/json"}
+        if self.acceptEncoding:
+            headers["Accept-Encoding"] = self.acceptEncoding
+
+        async with self._slots:
+            while True:
+                connection, reused = await self.__acquire()
+                try:
+                    status, _, data = await asyncio.wait_for(
+                        connection.exchange(method, target, body, headers), self.readTimeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    connection.close()
+                    if reused and not connection.sent:
+                        continue
+                    if isinstance(e, asyncio.IncompleteReadError):
+                        raise ConnectionError("Connection closed before the response was complete")
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                self.__release(connection)
+                return status, data
+
+    async def __acquire(self):
+        """
+        Returns:
+            tuple: (connection, True if it was reused from the pool)
+        """
+        now = asyncio.get_running_loop().time()
+        while self._idle:
+            connection, idleSince = self._idle.pop()
+            if now - idleSince < self.idleTimeout and not connection.closed:
+                return connection, True
+            connection.close()
+        connection = await HttpConnection.open(self.host, self.port, self.connectTimeout)
+        return connection, False
+
+    def __release(self, connection):
+        if self._closed or not connection.keepAlive or connection.closed:
+            connection.close()
+        else:
+            self._idle.append((connection, asyncio.get_running_loop().time()))
+
+    @staticmethod
+    def __errorMessage(text, status):
+        try:
+            return json.loads(text)["error"]
+        except (ValueError, KeyError, TypeError):
+            return text.strip() or f"HTTP {status}"
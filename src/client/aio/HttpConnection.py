@@ -0,0 +1,136 @@
+import asyncio
+import zlib
+
+
+class HttpConnection:
+    """
+    One persistent HTTP/1.1 connection to the gateway, used by a single
+    request at a time.
+
+    Responses are read by their framing rather than by whatever a single
+    read returns: a Content-Length body is read exactly, a chunked body
+    chunk by chunk until the last chunk, and a body without either until
+    the server closes. gzip and deflate bodies are decompressed.
+
+    `sent` tells whether the last exchange got as far as writing its request.
+    """
+
+    def __init__(self, reader, writer, host, maxHeadBytes=16 * 1024):
+        """
+        Args:
+            reader (asyncio.StreamReader): Stream of the open connection.
+            writer (asyncio.StreamWriter): Stream of the open connection.
+            host (str): Value of the Host header.
+            maxHeadBytes (int): Largest accepted response head.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+        self.maxHeadBytes = maxHeadBytes
+        self.keepAlive = True
+        self.sent = False
+
+    @classmethod
+    async def open(cls, host, port, timeout=None):
+        """
+        Connect to the gateway.
+
+        Raises:
+            OSError: If the connection fails.
+            TimeoutError: If it takes longer than timeout seconds.
+        """
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        return cls(reader, writer, host)
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    async def exchange(self, method, target, body=b"", headers=None):
+        """
+        Send one request and read its complete response.
+
+        Args:
+            method (str): Request method.
+            target (str): Request target, e.g. "/tickets".
+            body (bytes): Request body.
+            headers (dict, optional): Extra request headers.
+
+        Returns:
+            tuple: (status code, lower-cased response headers, decoded body bytes)
+
+        Raises:
+            ConnectionError: If the server closed or reset the connection.
+            asyncio.IncompleteReadError: If the response was cut short.
+            ValueError: If the response is not valid HTTP/1.1.
+        """
+        self.sent = False
+        # Lets the loop process a close by the server that already arrived,
+        # so it is noticed before any byte of the request is written.
+        await asyncio.sleep(0)
+        if self.closed:
+            raise ConnectionResetError("The server closed the connection")
+
+        self.sent = True
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        try:
+            head = await self.reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise ValueError("Response head too large")
+        status, responseHeaders = self.__parseHead(head)
+
+        self.keepAlive = responseHeaders.get("connection", "").lower() != "close"
+        if responseHeaders.get("transfer-encoding", "").lower() == "chunked":
+            data = await self.__readChunked()
+        elif "content-length" in responseHeaders:
+            data = await self.reader.readexactly(int(responseHeaders["content-length"]))
+        else:
+            self.keepAlive = False
+            data = await self.reader.read()
+
+        if responseHeaders.get("content-encoding", "").lower() in ("gzip", "deflate"):
+            # wbits 32 + MAX_WBITS accepts both gzip and zlib headers.
+            decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+            data = decompressor.decompress(data) + decompressor.flush()
+        return status, responseHeaders, data
+
+    def close(self):
+        self.keepAlive = False
+        self.writer.close()
+
+    async def __readChunked(self):
+        parts = []
+        while True:
+            sizeLine = await self.reader.readuntil(b"\r\n")
+            try:
+                size = int(sizeLine.split(b";", 1)[0], 16)
+            except ValueError:
+                raise ValueError(f"Invalid chunk size: {sizeLine[:32]!r}")
+            if size == 0:
+                # Skip any trailers up to the blank line ending the body.
+                while await self.reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(parts)
+            parts.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def __parseHead(self, head):
+        if len(head) > self.maxHeadBytes:
+            raise ValueError("Response head too large")
+        statusLine, *headerLines = head.decode("latin-1").split("\r\n")
+        version, _, rest = statusLine.partition(" ")
+        if not version.startswith("HTTP/1.") or not rest[:3].isdigit():
+            raise ValueError(f"Malformed status line: '{statusLine}'")
+
+        headers = {}
+        for line in headerLines:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        if version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+            headers["connection"] = "close"
+        return int(rest[:3]), headers
@@ -0,0 +1,12 @@
+"""
+Exports the asyncio client of the HTTP gateway.
+"""
+
+from .AsyncTicketClient import AsyncTicketClient, TicketRequestError
+from .HttpConnection import HttpConnection
+
+__all__ = [
+    "AsyncTicketClient",
+    "TicketRequestError",
+    "HttpConnection"
+]
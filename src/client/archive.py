@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Command-line access to a response archive written with `--sink archive`.
+
+Examples:
+    python -m src.client.archive list
+    python -m src.client.archive extract abc123
+    python -m src.client.archive extract abc123 def456 -o extracted/
+"""
+import os
+import sys
+import argparse
+from .sinks import ResponseArchive
+from .GenerateTicketSerivce import DEFAULT_RESPONSE_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up responses stored in a response archive.")
+    parser.add_argument("--dir", default=DEFAULT_RESPONSE_DIR,
+                        help="Archive directory (default is the client's responses folder)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List archived request IDs with their location")
+
+    extract = commands.add_parser("extract", help="Print or extract archived responses")
+    extract.add_argument("requestIds", nargs="+", metavar="REQUEST_ID")
+    extract.add_argument("-o", "--output", metavar="DIR",
+                         help="Write ticket_<requestId>.txt files to DIR instead of printing")
+
+    args = parser.parse_args()
+    archive = ResponseArchive(args.dir)
+
+    if args.command == "list":
+        for requestId, (segment, offset, length) in archive.entries().items():
+            print(f"{requestId}\tarchive-{segment:06d}.dat\t{offset}\t{length}")
+        return
+
+    missing = False
+    for requestId in args.requestIds:
+        try:
+            response = archive.lookup(requestId)
+        except KeyError:
+            print(f"Request ID not found in archive: {requestId}", file=sys.stderr)
+            missing = True
+            continue
+
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            with open(os.path.join(args.output, f"ticket_{requestId}.txt"), "w") as f:
+                f.write(response)
+        else:
+            print(response)
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
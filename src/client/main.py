@@ -38,6 +38,32 @@
 #        - The number of tickets to generate
 #        - The port number to connect to (optional, can be prompted)
 #
+#    Optional command-line arguments select the transport:
+#        --port : TCP port of the daemon (skips the port prompt)
+#        --unix : path of the daemon's Unix domain socket (instead of TCP)
+#        --nodelay / --fastopen : TCP_NODELAY and TCP Fast Open on the connection
+#        --sndbuf / --rcvbuf : TCP send/receive buffer sizes in bytes
+#                    (these four also apply to a prompted port and to TCP endpoints)
+#        --compress : ask the daemon for a gzip or zlib compressed response
+#        --endpoint : one daemon instance ("PORT", "HOST:PORT", "[ADDR]:PORT" or
+#                     "unix:PATH"); repeat it to shard requests across daemons by
+#                     requestId, with automatic failover and no connection prompts
+#
+#    and how failures are retried without user interaction:
+#        --retries : attempts per request with exponential backoff and jitter
+#                    (requires --port, --unix or --endpoint; the port is never prompted;
+#                    with --endpoint every attempt fails over across all endpoints)
+#        --connect-timeout / --read-timeout : socket timeouts in seconds
+#        --backoff-base / --backoff-max : first and largest retry delay in seconds
+#        --breaker-threshold / --breaker-reset : open a circuit breaker after this many
+#                    consecutive failures and fail fast for this many seconds
+#
+#    and where responses are stored:
+#        --sink files : one `responses/ticket_<requestId>.txt` per response (default)
+#        --sink archive : append to rolling archive segments in --archive-dir
+#                         (read them back with `python -m src.client.archive`)
+#        --archive-fsync : fsync archive batches before reporting them saved
+#
 #    If the request is successful, the returned ticket(s) are saved to a file named
 #    `ticket_<requestId>.txt` inside a `responses/` directory. If the server returns
 #    an error, the client displays the error message instead.
@@ -47,6 +73,9 @@
 #        - `ConnectionService`: handles connecting to the server, sending the request,
 #                               and receiving the response.
 #
+#        - `ShardedConnectionService`: routes each request to one of several daemons
+#                               by a consistent hash of its requestId.
+#
 #        - `GenerateTicketService`: handles user prompts and saves the response to disk.
 #
 #        - `LoggingService`: provides styled terminal output for info and error messages.
@@ -66,22 +95,131 @@
 #   Known Bugs: None
 #
 #==============================================================================
+import argparse
 from . import *
+from .transports import TcpTransport, UnixTransport
+from .sinks import ArchiveResponseSink
+from .resilience import RetryPolicy, CircuitBreaker
+from .GenerateTicketSerivce import DEFAULT_RESPONSE_DIR
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description="OLG Lottery Ticket Client")
+    parser.add_argument("--port", type=int, help="TCP port of the daemon (prompted if omitted)")
+    parser.add_argument("--unix", metavar="PATH", help="Connect over the Unix domain socket at PATH")
+    parser.add_argument("--nodelay", action="store_true", help="Set TCP_NODELAY on the connection")
+    parser.add_argument("--fastopen", action="store_true", help="Use TCP Fast Open (Linux only)")
+    parser.add_argument("--sndbuf", type=int, help="TCP send buffer size in bytes")
+    parser.add_argument("--rcvbuf", type=int, help="TCP receive buffer size in bytes")
+    parser.add_argument("--endpoint", action="append", default=[], metavar="ADDRESS",
+                        help='Daemon address ("PORT", "HOST:PORT", "[ADDR]:PORT" or "unix:PATH"); '
+                             "repeat to shard requests across several daemons")
+    parser.add_argument("--compress", choices=["gzip", "zlib"],
+                        help="Ask the daemon to compress the response (decompressed transparently)")
+    parser.add_argument("--retries", type=int, metavar="N",
+                        help="Retry up to N attempts with backoff instead of prompting (needs --port, --unix or --endpoint)")
+    parser.add_argument("--connect-timeout", type=float, default=2.0,
+                        help="Seconds allowed to connect when retrying (default is 2)")
+    parser.add_argument("--read-timeout", type=float, default=30.0,
+                        help="Seconds a receive may block when retrying (default is 30)")
+    parser.add_argument("--backoff-base", type=float, default=0.05,
+                        help="Upper bound of the first retry delay in seconds (default is 0.05)")
+    parser.add_argument("--backoff-max", type=float, default=1.0,
+                        help="Largest retry delay in seconds (default is 1)")
+    parser.add_argument("--breaker-threshold", type=int,
+                        help="Consecutive failures that open the circuit breaker (default is no breaker)")
+    parser.add_argument("--breaker-reset", type=float, default=2.0,
+                        help="Seconds the open circuit breaker fails fast before a trial (default is 2)")
+    parser.add_argument("--sink", choices=["files", "archive"], default="files",
+                        help="Store each response in its own file (default) or in a rolling archive")
+    parser.add_argument("--archive-dir", default=DEFAULT_RESPONSE_DIR,
+                        help="Directory of the response archive (default is the responses folder)")
+    parser.add_argument("--archive-fsync", action="store_true",
+                        help="fsync every batch written to the archive before reporting it saved")
+    args = parser.parse_args()
+    if args.endpoint and (args.port is not None or args.unix):
+        parser.error("--endpoint cannot be combined with --port or --unix.")
+    if args.unix and (args.nodelay or args.sndbuf or args.rcvbuf or args.fastopen):
+        parser.error("--nodelay, --sndbuf, --rcvbuf and --fastopen cannot be combined with --unix.")
+    if args.retries is not None and not (args.port is not None or args.unix or args.endpoint):
+        parser.error("--retries requires --port, --unix or --endpoint.")
+    try:
+        args.endpoint = [parseEndpoint(address, args) for address in args.endpoint]
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+def parseEndpoint(address, args):
+    if address.startswith("unix:"):
+        return UnixTransport(address[len("unix:"):])
+    host, separator, port = address.rpartition(":")
+    if not port.isdigit() or not 1 <= int(port) <= 65535:
+        raise ValueError(f"Invalid endpoint: '{address}'")
+    host = host.strip("[]") if separator else "localhost"
+    return TcpTransport(int(port), host or "localhost", **tcpOptions(args))
+
+def tcpOptions(args):
+    return {"noDelay": args.nodelay, "sendBufferSize": args.sndbuf,
+            "receiveBufferSize": args.rcvbuf, "fastOpen": args.fastopen}
+
+def createTransport(args):
+    if args.unix:
+        return UnixTransport(args.unix)
+    if args.port is not None:
+        return TcpTransport(args.port, **tcpOptions(args))
+    return None
+
+def createRetryPolicy(args):
+    if args.retries is None:
+        return None
+    return RetryPolicy(
+        maxAttempts=args.retries,
+        baseDelay=args.backoff_base,
+        maxDelay=args.backoff_max,
+        connectTimeout=args.connect_timeout,
+        readTimeout=args.read_timeout
+    )
 
 def main():
+    args = parseArgs()
     loggerService = LoggingService()
-    connectionService = ConnectionService(loggerService)
-    ticketService = GenerateTicketService(loggerService)
+    try:
+        retryPolicy = createRetryPolicy(args)
+        breaker = CircuitBreaker(args.breaker_threshold, args.breaker_reset) if args.breaker_threshold else None
+    except ValueError as e:
+        loggerService.printError(str(e))
+        return
+
+    if args.endpoint:
+        timeouts = {"connectTimeout": retryPolicy.connectTimeout,
+                    "readTimeout": retryPolicy.readTimeout} if retryPolicy else {}
+        connectionService = ShardedConnectionService(loggerService, args.endpoint, args.compress, **timeouts,
+                                                     retryPolicy=retryPolicy, circuitBreaker=breaker)
+    else:
+        connectionService = ConnectionService(
+            loggerService, createTransport(args), args.compress, retryPolicy, breaker, tcpOptions(args)
+        )
+    sink = ArchiveResponseSink(args.archive_dir, fsync=args.archive_fsync) if args.sink == "archive" else None
+    ticketService = GenerateTicketService(loggerService, sink)
 
     loggerService.printInfo("OLG Lottery Ticket Client")
-    connectionService.connect()
+    nonInteractive = retryPolicy is not None and not args.endpoint
+    # Connect only once the request is known: the daemon closes connections
+    # that stay idle past its read deadline while the user types.
     request = ticketService.promptRequest()
 
     try:
-        response = connectionService.sendJson(request)
+        if nonInteractive:
+            response = connectionService.request(request)
+        else:
+            connectionService.connect()
+            response = connectionService.sendJson(request)
         ticketService.handleResponse(request, response)
     except Exception as e:
         loggerService.printError(f"Error while communicating with server: {e}")
+    finally:
+        ticketService.close()
+        if isinstance(connectionService, ShardedConnectionService):
+            connectionService.close()
 
 if __name__ == "__main__":
     main()
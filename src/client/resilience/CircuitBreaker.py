@@ -0,0 +1,93 @@
+import threading
+import time
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of contacting a daemon that is known to be down.
+    """
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the daemon is down.
+
+    After `failureThreshold` consecutive failures the breaker opens and
+    every call is refused for `resetTimeout` seconds. Then it half-opens
+    and lets a single trial through: success closes it again, failure
+    re-opens it for another resetTimeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failureThreshold=5, resetTimeout=2.0):
+        """
+        Args:
+            failureThreshold (int): Consecutive failures that open the breaker.
+            resetTimeout (float): Seconds the breaker stays open before a trial.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if failureThreshold < 1 or resetTimeout <= 0:
+            raise ValueError("'failureThreshold' must be at least 1 and 'resetTimeout' positive.")
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.failures = 0
+        self.openedAt = None
+        self._trialRunning = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self.__state()
+
+    def before(self) -> None:
+        """
+        Call before contacting the daemon.
+
+        Raises:
+            CircuitOpenError: While the breaker is open, or a half-open trial is running.
+        """
+        with self._lock:
+            state = self.__state()
+            if state == self.OPEN or (state == self.HALF_OPEN and self._trialRunning):
+                retryIn = max(self.openedAt + self.resetTimeout - time.monotonic(), 0)
+                raise CircuitOpenError(
+                    f"Circuit open after {self.failures} failure(s); next trial in {retryIn:.2f}s"
+                )
+            if state == self.HALF_OPEN:
+                self._trialRunning = True
+
+    def recordSuccess(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.openedAt = None
+            self._trialRunning = False
+
+    def recordFailure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trialRunning = False
+            if self.openedAt is not None or self.failures >= self.failureThreshold:
+                self.openedAt = time.monotonic()
+
+    def remaining(self) -> float:
+        """
+        Returns:
+            float: Seconds until the open breaker allows a trial (0 if it is not open).
+        """
+        with self._lock:
+            if self.openedAt is None:
+                return 0.0
+            return max(self.openedAt + self.resetTimeout - time.monotonic(), 0.0)
+
+    def __state(self):
+        if self.openedAt is None:
+            return self.CLOSED
+        if time.monotonic() - self.openedAt < self.resetTimeout:
+            return self.OPEN
+        return self.HALF_OPEN
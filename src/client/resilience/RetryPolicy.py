@@ -0,0 +1,52 @@
+import random
+
+
+class RetryPolicy:
+    """
+    How the client retries a request while the daemon is unreachable.
+
+    Attempt n (counting from 0) is followed by a delay drawn uniformly from
+    [0, min(maxDelay, baseDelay * multiplier ** n)] ("full jitter"), so
+    many clients restarting together do not reconnect in lockstep, while a
+    low maxDelay keeps the client close behind a daemon that comes back.
+    """
+
+    def __init__(self, maxAttempts=5, baseDelay=0.05, maxDelay=1.0, multiplier=2.0,
+                 connectTimeout=2.0, readTimeout=30.0, rng=None):
+        """
+        Initialize the policy.
+
+        Args:
+            maxAttempts (int): Attempts per request, the first one included.
+            baseDelay (float): Upper bound of the first delay, in seconds.
+            maxDelay (float): Largest delay between attempts, in seconds.
+            multiplier (float): Growth of the delay bound per attempt.
+            connectTimeout (float): Seconds allowed to establish a connection.
+            readTimeout (float, optional): Seconds a single receive may block. None blocks.
+            rng (random.Random, optional): Source of the jitter.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if maxAttempts < 1:
+            raise ValueError("'maxAttempts' must be at least 1.")
+        if baseDelay < 0 or maxDelay < baseDelay or multiplier < 1:
+            raise ValueError("Delays must satisfy 0 <= baseDelay <= maxDelay and multiplier >= 1.")
+        if connectTimeout <= 0 or (readTimeout is not None and readTimeout <= 0):
+            raise ValueError("Timeouts must be positive.")
+
+        self.maxAttempts = maxAttempts
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.multiplier = multiplier
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.rng = rng if rng is not None else random.Random()
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns:
+            float: Seconds to wait after the given failed attempt (0-based).
+        """
+        bound = min(self.maxDelay, self.baseDelay * self.multiplier ** attempt)
+        return self.rng.uniform(0, bound)
@@ -0,0 +1,12 @@
+"""
+Exports the client's retry policy and circuit breaker.
+"""
+
+from .RetryPolicy import RetryPolicy
+from .CircuitBreaker import CircuitBreaker, CircuitOpenError
+
+__all__ = [
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError"
+]
@@ -0,0 +1,63 @@
+import bisect
+import hashlib
+from typing import Iterator, List
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping request keys to endpoints.
+
+    Every endpoint is placed on the ring at `virtualNodes` points so keys
+    spread evenly, and adding or removing an endpoint only moves the keys
+    that hashed next to its points. The same key always yields the same
+    preference order, so a retried requestId reaches the same daemon.
+    """
+
+    def __init__(self, endpoints: List[str], virtualNodes: int = 160):
+        """
+        Initialize the ring.
+
+        Args:
+            endpoints (List[str]): Unique endpoint names, e.g. transport descriptions.
+            virtualNodes (int): Ring points per endpoint.
+
+        Raises:
+            ValueError: If no endpoints are given, names repeat or virtualNodes < 1.
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required.")
+        if len(set(endpoints)) != len(endpoints):
+            raise ValueError("Endpoint names must be unique.")
+        if virtualNodes < 1:
+            raise ValueError("'virtualNodes' must be at least 1.")
+
+        self.endpoints = list(endpoints)
+        points = sorted(
+            (self.hash(f"{endpoint}#{replica}"), position)
+            for position, endpoint in enumerate(self.endpoints)
+            for replica in range(virtualNodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [position for _, position in points]
+
+    @staticmethod
+    def hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def preference(self, key: str) -> Iterator[int]:
+        """
+        Yield the positions of all endpoints in the order a key should try
+        them: its owner first, then the following distinct endpoints on the ring.
+
+        Args:
+            key (str): The routing key, e.g. the requestId.
+        """
+        start = bisect.bisect(self._hashes, self.hash(key))
+        seen = set()
+        for offset in range(len(self._owners)):
+            owner = self._owners[(start + offset) % len(self._owners)]
+            if owner not in seen:
+                seen.add(owner)
+                yield owner
+                if len(seen) == len(self.endpoints):
+                    return
@@ -0,0 +1,9 @@
+"""
+Exports the consistent-hash ring used to shard requests across daemons.
+"""
+
+from .HashRing import HashRing
+
+__all__ = [
+    "HashRing"
+]
@@ -0,0 +1,153 @@
+import os
+import re
+import json
+from .IResponseSink import IResponseSink
+
+try:
+    import fcntl
+except ImportError:  # Windows: single writer per archive directory
+    fcntl = None
+
+SEGMENT_PATTERN = re.compile(r"^archive-(\d{6})\.dat$")
+RECORD_SEPARATOR = b"\n\n"
+
+
+def segmentPaths(directory: str, number: int):
+    """
+    Returns:
+        tuple: (data file path, index file path) of archive segment `number`.
+    """
+    base = os.path.join(directory, f"archive-{number:06d}")
+    return f"{base}.dat", f"{base}.idx"
+
+
+def listSegments(directory: str):
+    """
+    Returns:
+        List[int]: Numbers of the archive segments in `directory`, ascending.
+    """
+    if not os.path.isdir(directory):
+        return []
+    numbers = []
+    for name in os.listdir(directory):
+        match = SEGMENT_PATTERN.match(name)
+        if match:
+            numbers.append(int(match.group(1)))
+    return sorted(numbers)
+
+
+class ArchiveResponseSink(IResponseSink):
+    """
+    Appends responses to rolling archive segments instead of one file each.
+
+    Layout of `directory`:
+        archive-000001.dat   response bytes, each followed by a blank line so the
+                             segment also reads as a plain-text journal
+        archive-000001.idx   one line per response: <offset>\\t<length>\\t<JSON requestId>
+
+    Responses are buffered in memory and written in batches; write() only
+    reports a location once the batch holding the response was written.
+    With fsync enabled, every batch is made durable before its index
+    entries are written. A segment is rolled over once it would exceed
+    maxSegmentBytes. Writers take an exclusive lock on the segment while
+    flushing, so several client processes can share one archive.
+    """
+
+    def __init__(self, directory: str, maxSegmentBytes: int = 256 * 1024 * 1024,
+                 flushBytes: int = 1024 * 1024, flushCount: int = 1000, fsync: bool = False):
+        """
+        Args:
+            directory (str): Folder holding the archive segments. Created if missing.
+            maxSegmentBytes (int): Size after which a new segment is started.
+            flushBytes (int): Buffered bytes that trigger a flush.
+            flushCount (int): Buffered responses that trigger a flush.
+            fsync (bool): fsync data and index after every flushed batch. Off by
+                          default: it costs two disk flushes per batch.
+        """
+        if maxSegmentBytes < 1 or flushBytes < 1 or flushCount < 1:
+            raise ValueError("Archive sizes and flush thresholds must be positive.")
+
+        self.directory = directory
+        self.maxSegmentBytes = maxSegmentBytes
+        self.flushBytes = flushBytes
+        self.flushCount = flushCount
+        self.fsync = fsync
+
+        self._pending = []
+        self._pendingBytes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, requestId: str, response: str):
+        data = response.encode()
+        self._pending.append((str(requestId), data))
+        self._pendingBytes += len(data)
+
+        if self._pendingBytes >= self.flushBytes or len(self._pending) >= self.flushCount:
+            self.flush()
+            return self.describe()
+        return None
+
+    def describe(self) -> str:
+        return f"archive {self.directory}"
+
+    def flush(self) -> None:
+        """
+        Write all buffered responses to the archive.
+        """
+        while self._pending:
+            segments = listSegments(self.directory)
+            number = segments[-1] if segments else 1
+            dataPath, indexPath = segmentPaths(self.directory, number)
+
+            with open(dataPath, "ab") as dataFile:
+                self.__lock(dataFile)
+                offset = dataFile.seek(0, os.SEEK_END)
+                # Another writer may have rolled over while we waited for the lock.
+                if listSegments(self.directory)[-1] != number:
+                    continue
+                if offset >= self.maxSegmentBytes:
+                    open(segmentPaths(self.directory, number + 1)[0], "ab").close()
+                    continue
+                written = self.__writeBatch(dataFile, indexPath, offset)
+
+            del self._pending[:written]
+            self._pendingBytes = sum(len(data) for _, data in self._pending)
+
+    def __writeBatch(self, dataFile, indexPath, offset):
+        """
+        Write as many pending responses as fit into the current segment
+        (at least one) while holding the segment lock.
+
+        Returns:
+            int: Number of pending responses written.
+        """
+        chunks = []
+        indexLines = []
+        position = offset
+        for requestId, data in self._pending:
+            if chunks and position + len(data) > self.maxSegmentBytes:
+                break
+            chunks.append(data)
+            chunks.append(RECORD_SEPARATOR)
+            indexLines.append(f"{position}\t{len(data)}\t{json.dumps(requestId)}\n")
+            position += len(data) + len(RECORD_SEPARATOR)
+
+        dataFile.write(b"".join(chunks))
+        dataFile.flush()
+        if self.fsync:
+            os.fsync(dataFile.fileno())
+
+        # The index is written after the data is durable, so every index
+        # entry always points at complete bytes.
+        with open(indexPath, "a") as indexFile:
+            indexFile.write("".join(indexLines))
+            indexFile.flush()
+            if self.fsync:
+                os.fsync(indexFile.fileno())
+
+        return len(indexLines)
+
+    @staticmethod
+    def __lock(file):
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
@@ -0,0 +1,29 @@
+import os
+from .IResponseSink import IResponseSink
+
+
+class FileResponseSink(IResponseSink):
+    """
+    Stores every response in its own file named ticket_<requestId>.txt.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Folder the response files are written to. Created on first use.
+        """
+        self.directory = directory
+        self._directoryReady = False
+
+    def describe(self) -> str:
+        return self.directory
+
+    def write(self, requestId: str, response: str) -> str:
+        if not self._directoryReady:
+            os.makedirs(self.directory, exist_ok=True)
+            self._directoryReady = True
+
+        filepath = os.path.join(self.directory, f"ticket_{requestId}.txt")
+        with open(filepath, "w") as f:
+            f.write(response)
+        return filepath
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+
+class IResponseSink(ABC):
+    """
+    Abstract base class for a destination of successful server responses.
+    """
+
+    @abstractmethod
+    def write(self, requestId: str, response: str) -> str:
+        """
+        Store a response.
+
+        Args:
+            requestId (str): The request identifier the response belongs to.
+            response (str): The response text.
+
+        Returns:
+            str | None: A description of where the response was stored, or None
+                        while it is only buffered. Buffered responses are stored
+                        by a later write (which then also returns the location),
+                        flush() or close().
+        """
+        pass
+
+    def describe(self) -> str:
+        """
+        Returns:
+            str: A description of where responses are stored.
+        """
+        return type(self).__name__
+
+    def flush(self) -> None:
+        """
+        Store all buffered responses.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Flush buffered responses and release resources.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
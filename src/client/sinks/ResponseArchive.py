@@ -0,0 +1,63 @@
+import json
+from .ArchiveResponseSink import listSegments, segmentPaths
+
+
+class ResponseArchive:
+    """
+    Read access to an archive written by ArchiveResponseSink.
+
+    The small per-segment index files are loaded once into a dictionary of
+    requestId -> (segment, offset, length); a lookup is then a single seek
+    and read. When a requestId was archived more than once the latest entry wins.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Folder holding the archive segments.
+        """
+        self.directory = directory
+        self._entries = None
+
+    def entries(self) -> dict:
+        """
+        Returns:
+            dict: requestId -> (segment number, offset, length).
+        """
+        if self._entries is None:
+            self._entries = {}
+            for number in listSegments(self.directory):
+                _, indexPath = segmentPaths(self.directory, number)
+                try:
+                    with open(indexPath) as indexFile:
+                        for line in indexFile:
+                            parts = line.rstrip("\n").split("\t", 2)
+                            if len(parts) != 3:
+                                continue  # torn write at the end of the index
+                            try:
+                                requestId = json.loads(parts[2])
+                            except json.JSONDecodeError:
+                                continue
+                            self._entries[requestId] = (number, int(parts[0]), int(parts[1]))
+                except FileNotFoundError:
+                    continue
+        return self._entries
+
+    def lookup(self, requestId: str) -> str:
+        """
+        Return the archived response for a request.
+
+        Args:
+            requestId (str): The request identifier.
+
+        Returns:
+            str: The response text.
+
+        Raises:
+            KeyError: If the request is not in the archive.
+        """
+        number, offset, length = self.entries()[requestId]
+        dataPath, _ = segmentPaths(self.directory, number)
+        with open(dataPath, "rb") as dataFile:
+            dataFile.seek(offset)
+            return dataFile.read(length).decode()
@@ -0,0 +1,15 @@
+"""
+Exports response sinks and the archive reader for the client of lottery system.
+"""
+
+from .IResponseSink import IResponseSink
+from .FileResponseSink import FileResponseSink
+from .ArchiveResponseSink import ArchiveResponseSink
+from .ResponseArchive import ResponseArchive
+
+__all__ = [
+    "IResponseSink",
+    "FileResponseSink",
+    "ArchiveResponseSink",
+    "ResponseArchive"
+]
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class ITransport(ABC):
+    """
+    Abstract base class for a client transport.
+
+    A transport knows how to open a connected socket to the ticket daemon,
+    hiding whether TCP or a Unix domain socket is used.
+    """
+
+    @abstractmethod
+    def connect(self, timeout: float = None):
+        """
+        Open a connection to the server.
+
+        Args:
+            timeout (float, optional): Connect timeout in seconds. None blocks.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> str:
+        """
+        Returns:
+            str: A human-readable description of the server address.
+        """
+        pass
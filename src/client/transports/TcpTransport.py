@@ -0,0 +1,53 @@
+import socket
+from .ITransport import ITransport
+
+# Linux value of TCP_FASTOPEN_CONNECT, not exported by every Python build.
+TCP_FASTOPEN_CONNECT = getattr(socket, "TCP_FASTOPEN_CONNECT", 30)
+
+
+class TcpTransport(ITransport):
+    """
+    IPv6 TCP client transport with tunable socket options.
+    """
+
+    def __init__(self, port: int, host: str = "localhost", noDelay: bool = False,
+                 sendBufferSize: int = None, receiveBufferSize: int = None, fastOpen: bool = False):
+        """
+        Initialize the TCP transport.
+
+        Args:
+            port (int): Server port.
+            host (str): Server host name or address. Default is "localhost".
+            noDelay (bool): Set TCP_NODELAY on the connection.
+            sendBufferSize (int, optional): SO_SNDBUF size in bytes.
+            receiveBufferSize (int, optional): SO_RCVBUF size in bytes.
+            fastOpen (bool): Send the request in the SYN when the server supports
+                             TCP_FASTOPEN (Linux only).
+        """
+        self.port = port
+        self.host = host
+        self.noDelay = noDelay
+        self.sendBufferSize = sendBufferSize
+        self.receiveBufferSize = receiveBufferSize
+        self.fastOpen = fastOpen
+
+    def connect(self, timeout: float = None):
+        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+        try:
+            if self.noDelay:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.sendBufferSize:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sendBufferSize)
+            if self.receiveBufferSize:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receiveBufferSize)
+            if self.fastOpen:
+                sock.setsockopt(socket.IPPROTO_TCP, TCP_FASTOPEN_CONNECT, 1)
+            sock.settimeout(timeout)
+            sock.connect((self.host, self.port))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def describe(self) -> str:
+        return f"[{self.host}]:{self.port}"
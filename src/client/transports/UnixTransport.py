@@ -0,0 +1,30 @@
+import socket
+from .ITransport import ITransport
+
+
+class UnixTransport(ITransport):
+    """
+    Unix domain socket client transport for daemons on the same host.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the Unix domain socket transport.
+
+        Args:
+            path (str): Filesystem path of the daemon's socket.
+        """
+        self.path = path
+
+    def connect(self, timeout: float = None):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(self.path)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def describe(self) -> str:
+        return f"unix:{self.path}"
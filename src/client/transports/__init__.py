@@ -0,0 +1,13 @@
+"""
+Exports client transports for the lottery system.
+"""
+
+from .ITransport import ITransport
+from .TcpTransport import TcpTransport
+from .UnixTransport import UnixTransport
+
+__all__ = [
+    "ITransport",
+    "TcpTransport",
+    "UnixTransport"
+]
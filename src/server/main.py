@@ -41,6 +41,12 @@
 #
 #       1. **Console** — one-time execution mode using command-line arguments.
 #       2. **SocketDaemon** — a persistent TCP daemon that listens for client requests over IPv6.
+#       3. **HttpGateway** — an HTTP/1.1 server (POST /tickets) for load balancers
+#                            and service meshes, with keep-alive and chunked responses.
+#       4. **Check** — scores issued tickets (response journals or a binary index)
+#                      against the winning numbers of a draw.
+#       5. **Simulate** — estimates prize-tier odds with a Monte Carlo simulation.
+#       6. **Validate** — tests that a generation backend draws every game uniformly.
 #
 #    Both modes delegate ticket generation to a shared controller class:
 #    `GenerateTicketController`. This controller encapsulates common presentation logic such as:
@@ -59,21 +65,98 @@
 #                    -t : type of lottery ("max", "grand", or "lottario") [required]
 #                    --id : request identifier [required]
 #                    -n : number of tickets to generate (default = 1) [optional]
+#                    --rng : random generator, "mt" or "crypto" (default = mt) [optional]
+#                    --seed / --offset : reproducible tickets; ticket i depends only on (seed, i)
+#                    --threads : draw the tickets on N threads on a free-threaded (GIL-disabled) Python
+#                    --wheel / --match / --if : a wheel over chosen numbers with a k-if-m guarantee
+#                    --batch : JSONL/CSV file (or "-" for stdin) of many {type, requestId, count}
+#                              requests served in one process, replacing -t/--id/-n
+#                    --output-dir / -o : per-request files or one combined output for --batch
+#                    --export : stream the tickets to a columnar .npy file with a .json sidecar
 #
 #            Socket Mode:
-#                JSON request sent over IPv6 socket containing:
+#                Optional command-line arguments:
+#                    --read-header-timeout : seconds until the first request byte (default = 5)
+#                    --request-timeout : seconds until the full request is read (default = 10)
+#                    --write-timeout : seconds a single send may block (default = 10)
+#                    --response-timeout : seconds allowed to send a whole response (default = 300)
+#                    --min-rate : minimum bytes/second for large responses (default = 65536)
+#                    --workers : number of connections served concurrently (default = 8)
+#                    --generation-timeout : seconds allowed to generate one request (default = no limit)
+#                    --generators : threads generating ticket chunks for all requests (default = 2)
+#                    --chunk-size : tickets generated per scheduling turn (default = 1000)
+#                    --schedule : "round-robin" or "shortest-first" chunk scheduling
+#                    --trace-dir : export request traces as Chrome trace-event JSON into this directory
+#                    --trace-sample : fraction of requests traced from the start (default = 0.01)
+#                    --trace-slow-ms : also export traces of requests slower than this
+#                    --port : TCP port to listen on (prompted if neither --port nor --unix is given)
+#                    --unix : listen on a Unix domain socket at this path instead of TCP
+#                    --unix-mode : octal permissions of the Unix socket file (default = 660)
+#                    --nodelay : set TCP_NODELAY on accepted connections
+#                    --sndbuf / --rcvbuf : TCP send/receive buffer sizes in bytes
+#                    --fastopen : TCP_FASTOPEN queue length
+#                    --rng : random generator, "mt" or "crypto" (default = mt)
+#                    --access-log : JSON-lines access log path (default = /tmp/ticket_daemon_access.log)
+#                    --access-log-sample : fraction of successful requests logged (default = 1.0)
+#                    --access-log-max-bytes : size at which the access log rotates (default = 64 MiB)
+#
+#                JSON request sent over IPv6 socket (a trailing newline is optional),
+#                containing:
 #                    {
 #                      "type": "max" | "grand" | "lottario",
 #                      "requestId": "<string>",
 #                      "count": <integer>
 #                    }
 #
+#                or a batch of such requests answered in one round trip:
+#                    { "batch": [ { "type": ..., "requestId": ..., "count": ... }, ... ] }
+#
+#                Either form may add "accept_encoding": "zlib" | "gzip" to receive
+#                a response compressed while it is streamed, and "trailer": "<text>"
+#                to have an uncompressed response end with that text (the client
+#                sends "\n[End]\n" to detect responses cut short).
+#
+#                Adding "seed" (and optionally "offset"/"limit") makes ticket i a pure
+#                function of (seed, i), so pages of a huge batch can be requested separately.
+#
+#                A "wheel": {"numbers": [...], "match": t, "if": m} object instead asks for
+#                the smallest set of tickets found guaranteeing t matches if m are drawn.
+#
+#            HTTP Mode:
+#                POST /tickets with the same JSON body as Socket Mode.
+#                Optional command-line arguments: --host, --port (default = 8080),
+#                --keep-alive (idle seconds, default = 15), --rng, --threads (threads
+#                drawing one request's tickets on a free-threaded Python, default = 1).
+#
+#            Simulate Mode:
+#                -t : type of lottery [required]
+#                --draws : simulated draws (default = 1000)
+#                --tickets : random tickets scored against every draw (default = 100000)
+#                --workers : worker processes (default = CPU count)
+#                --seed : seed of the run (default = 0)
+#
+#            Validate Mode:
+#                -t : types of lottery (default = max grand lottario)
+#                --tickets : tickets generated per game (default = 1000000)
+#                --backend : "mt", "crypto" or "counter" (seeded) (default = mt)
+#                --alpha : chance of failing a uniform backend, per game (default = 0.01)
+#                --workers / --seed : as in Simulate Mode
+#
 #        Output:
 #            Console Mode:
 #                - Ticket(s) printed to the terminal.
 #
 #            Socket Mode:
-#                - Response sent back to client.
+#                - Response sent back to client (a JSON document with one result
+#                  or error per sub-request for batch requests).
+#                  An uncompressed response ends with the request's "trailer", if any.
+#
+#            HTTP Mode:
+#                - 200 text/plain response, chunked when large; 4xx with a JSON
+#                  {"error": ...} body for invalid requests.
+#
+#            Validate Mode:
+#                - A pass/fail report per game; exit status 1 when any game fails.
 #
 #    Algorithm:
 #        The program maps the selected lottery type to a specific factory class.
@@ -89,35 +172,202 @@
 import sys
 import argparse
 from .presentation.console import Console
-from .presentation.socket import SocketDaemon
+from .presentation.socket import SocketDaemon, ConnectionDeadlines
+from .presentation.http import HttpGateway
+from .presentation import AccessLogger
+from .presentation.socket.transports import TcpTransport, UnixTransport
+from .models.randomness import GENERATORS
+from .services.scheduling import GenerationScheduler, POLICIES
+from .services.tracing import Tracer
+from .services.parallel import ThreadPoolTicketExecutor
+
+def parseSocketArgs(argv):
+    parser = argparse.ArgumentParser(description="Run the lottery ticket socket daemon.")
+    parser.add_argument("--read-header-timeout", type=float, default=5.0,
+                        help="Seconds to wait for the first byte of a request (default is 5)")
+    parser.add_argument("--request-timeout", type=float, default=10.0,
+                        help="Seconds to wait for the complete request (default is 10)")
+    parser.add_argument("--write-timeout", type=float, default=10.0,
+                        help="Seconds a single send may block on a slow client (default is 10)")
+    parser.add_argument("--response-timeout", type=float, default=300.0,
+                        help="Seconds allowed to send a whole response (default is 300)")
+    parser.add_argument("--min-rate", type=int, default=64 * 1024,
+                        help="Minimum bytes/second a client must read large responses at (default is 65536)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Number of connections served concurrently (default is 8)")
+    parser.add_argument("--generation-timeout", type=float,
+                        help="Seconds allowed to generate the tickets of one request (default is no limit)")
+    parser.add_argument("--generators", type=int, default=2,
+                        help="Number of threads generating tickets for all requests (default is 2)")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="Tickets generated per scheduling turn (default is 1000)")
+    parser.add_argument("--schedule", choices=POLICIES, default="round-robin",
+                        help="Order in which active requests get chunks: round-robin (default) or shortest-first")
+    parser.add_argument("--port", type=int,
+                        help="TCP port to listen on (prompted if neither --port nor --unix is given)")
+    parser.add_argument("--unix", metavar="PATH",
+                        help="Listen on a Unix domain socket at PATH instead of TCP")
+    parser.add_argument("--unix-mode", type=lambda value: int(value, 8), default=0o660,
+                        help="Octal permissions of the Unix socket file (default is 660)")
+    parser.add_argument("--nodelay", action="store_true",
+                        help="Set TCP_NODELAY on accepted TCP connections")
+    parser.add_argument("--sndbuf", type=int, help="TCP send buffer size in bytes")
+    parser.add_argument("--rcvbuf", type=int, help="TCP receive buffer size in bytes")
+    parser.add_argument("--fastopen", type=int, metavar="QLEN",
+                        help="Enable TCP_FASTOPEN with the given queue length")
+    parser.add_argument("--rng", choices=sorted(GENERATORS), default="mt",
+                        help="Random generator: mt (Mersenne Twister) or crypto (buffered os.urandom); default is mt")
+    parser.add_argument("--access-log", default="/tmp/ticket_daemon_access.log",
+                        help="JSON-lines access log path; 'none' disables it (default is /tmp/ticket_daemon_access.log)")
+    parser.add_argument("--access-log-sample", type=float, default=1.0,
+                        help="Fraction of successful requests written to the access log (default is 1.0)")
+    parser.add_argument("--access-log-max-bytes", type=int, default=64 * 1024 * 1024,
+                        help="Size in bytes at which the access log is rotated (default is 64 MiB)")
+    parser.add_argument("--trace-dir", metavar="DIR",
+                        help="Export request traces as Chrome trace-event JSON files into DIR")
+    parser.add_argument("--trace-sample", type=float, default=0.01,
+                        help="Fraction of requests traced from the start (default is 0.01)")
+    parser.add_argument("--trace-slow-ms", type=float,
+                        help="Also export the trace of every request slower than this many ms")
+    args = parser.parse_args(argv)
+
+    tcpOptions = args.nodelay or args.sndbuf or args.rcvbuf or args.fastopen
+    if tcpOptions and (args.port is None or args.unix):
+        parser.error("--nodelay, --sndbuf, --rcvbuf and --fastopen require --port (TCP).")
+    return args
+
+def parseHttpArgs(argv):
+    parser = argparse.ArgumentParser(description="Run the lottery ticket HTTP gateway.")
+    parser.add_argument("--host", default="localhost", help="Address to bind to (default is localhost)")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port to listen on (default is 8080)")
+    parser.add_argument("--keep-alive", type=float, default=15.0,
+                        help="Seconds an idle keep-alive connection stays open (default is 15)")
+    parser.add_argument("--rng", choices=sorted(GENERATORS), default="mt",
+                        help="Random generator: mt (Mersenne Twister) or crypto (buffered os.urandom); default is mt")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="Threads drawing the tickets of one request on a free-threaded (GIL-disabled) "
+                             "Python; ignored while the GIL is enabled (default is 1)")
+    args = parser.parse_args(argv)
+    if args.threads < 1:
+        parser.error("--threads must be at least 1.")
+    return args
+
+def createAccessLog(socketArgs):
+    if socketArgs.access_log.lower() == "none":
+        return None
+    return AccessLogger(
+        socketArgs.access_log,
+        maxBytes=socketArgs.access_log_max_bytes,
+        sampleRate=socketArgs.access_log_sample
+    )
+
+def createTracer(socketArgs):
+    if not socketArgs.trace_dir:
+        return None
+    return Tracer(
+        socketArgs.trace_dir,
+        sampleRate=socketArgs.trace_sample,
+        slowThresholdMs=socketArgs.trace_slow_ms
+    )
+
+def createTransport(socketArgs):
+    if socketArgs.unix:
+        return UnixTransport(socketArgs.unix, mode=socketArgs.unix_mode)
+    if socketArgs.port is None:
+        return None
+    return TcpTransport(
+        socketArgs.port,
+        noDelay=socketArgs.nodelay,
+        sendBufferSize=socketArgs.sndbuf,
+        receiveBufferSize=socketArgs.rcvbuf,
+        fastOpen=socketArgs.fastopen
+    )
 
 def main():
     initial_parser = argparse.ArgumentParser(add_help=False)
-    initial_parser.add_argument("-m", "--mode", choices=["console", "socket"])
+    initial_parser.add_argument("-m", "--mode", choices=["console", "socket", "http", "check", "simulate", "validate"])
     args, remaining_args = initial_parser.parse_known_args()
 
     if args.mode is None:
         print("Usage:")
         print("  -m console   Run in command-line mode")
         print("  -m socket    Run as a TCP socket daemon")
+        print("  -m http      Run as an HTTP/1.1 gateway (POST /tickets)")
+        print("  -m check     Score issued tickets against winning numbers")
+        print("  -m simulate  Estimate prize-tier odds with a Monte Carlo simulation")
+        print("  -m validate  Test that a generation backend draws uniformly")
         print("\nExamples:")
         print("  python3 -m src.server.main -m console -t max --id abc123 -n 2")
+        print("  python3 -m src.server.main -m console --batch requests.jsonl --output-dir responses/")
+        print("  python3 -m src.server.main -m console -t max --id abc123 -n 1000000 --export tickets.npy")
+        print('  python3 -m src.server.main -m console -t max --id w1 --wheel "1 5 9 12 17 23 28 31 36 44" --match 4')
         print("  python3 -m src.server.main -m socket")
+        print("  python3 -m src.server.main -m socket --unix /tmp/ticket_daemon.sock")
+        print("  python3 -m src.server.main -m http --port 8080")
+        print('  python3 -m src.server.main -m check -t grand -w "1 2 3 4 5" -w 7 --journal ticket_abc123.txt')
+        print("  python3 -m src.server.main -m simulate -t max --draws 1000 --tickets 100000")
+        print("  python3 -m src.server.main -m validate --backend crypto --tickets 10000000")
         sys.exit(0)
 
     if args.mode == "console":
         Console().createTicket(remaining_args)
 
+    elif args.mode == "http":
+        httpArgs = parseHttpArgs(remaining_args)
+        try:
+            HttpGateway(
+                host=httpArgs.host,
+                port=httpArgs.port,
+                generator=GENERATORS[httpArgs.rng](),
+                keepAliveTimeout=httpArgs.keep_alive,
+                ticketExecutor=ThreadPoolTicketExecutor(httpArgs.threads) if httpArgs.threads > 1 else None
+            ).start()
+        except OSError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\n❌ User cancelled.")
+            sys.exit(1)
+
+    elif args.mode == "check":
+        Console().checkTickets(remaining_args)
+
+    elif args.mode == "simulate":
+        Console().simulateDraws(remaining_args)
+
+    elif args.mode == "validate":
+        Console().validateGenerator(remaining_args)
+
     elif args.mode == "socket":
+        socketArgs = parseSocketArgs(remaining_args)
         try:
+            deadlines = ConnectionDeadlines(
+                readHeaderTimeout=socketArgs.read_header_timeout,
+                requestTimeout=socketArgs.request_timeout,
+                writeTimeout=socketArgs.write_timeout,
+                responseTimeout=socketArgs.response_timeout,
+                minTransferRate=socketArgs.min_rate,
+                generationTimeout=socketArgs.generation_timeout
+            )
             daemon = SocketDaemon(
                 username="nobody",
                 groupname="nogroup",
-                pidFile="/tmp/ticket_daemon.pid"
+                pidFile="/tmp/ticket_daemon.pid",
+                deadlines=deadlines,
+                maxWorkers=socketArgs.workers,
+                transport=createTransport(socketArgs),
+                generator=GENERATORS[socketArgs.rng](),
+                accessLog=createAccessLog(socketArgs),
+                scheduler=GenerationScheduler(
+                    workers=socketArgs.generators,
+                    chunkSize=socketArgs.chunk_size,
+                    policy=socketArgs.schedule
+                ),
+                tracer=createTracer(socketArgs)
             )
             daemon.start()
 
-        except RuntimeError as e:
+        except (RuntimeError, ValueError) as e:
             print(f"❌ {e}")
             sys.exit(1)
         except KeyboardInterrupt:
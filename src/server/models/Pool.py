@@ -1,12 +1,15 @@
 from typing import List
-import random
+from .randomness import IRandomGenerator, MersenneTwisterGenerator
+
+DEFAULT_GENERATOR = MersenneTwisterGenerator()
 
 class Pool:
     """
     Represents a lottery number pool.
     """
 
-    def __init__(self, name: str, startNumber: int, endNumber: int, pickCount: int):
+    def __init__(self, name: str, startNumber: int, endNumber: int, pickCount: int,
+                 generator: IRandomGenerator = None):
         """
         Initializes a Pool object and performs validation.
 
@@ -15,6 +18,7 @@ class Pool:
             startNumber: smallest possible number (inclusive)
             endNumber: largest possible number (inclusive)
             pick_count: how many unique numbers to pick
+            generator: source of randomness (default: the module-level Mersenne Twister)
 
         Raises:
             ValueError: if configuration is invalid
@@ -33,6 +37,7 @@ class Pool:
         self.startNumber = startNumber
         self.endNumber = endNumber
         self.pickCount = pickCount
+        self.generator = generator if generator is not None else DEFAULT_GENERATOR
 
     def selectRandomly(self) -> List[int]:
         """
@@ -45,7 +50,7 @@ class Pool:
         selected = []
 
         for _ in range(self.pickCount):
-            index = random.randint(0, len(pool) - 1)
+            index = self.generator.randbelow(len(pool))
             selected.append(pool.pop(index))
 
         return selected
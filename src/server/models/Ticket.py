@@ -4,7 +4,7 @@ from .Pool import Pool
 class Ticket:
     """
     Lottery ticket class for multi-pool games.
-    Holds the pool configurations and generates numbers when printed.
+    Holds the pool configurations and draws each pool's numbers once, on first use.
     """
 
     def __init__(self, pools: List[Pool]):
@@ -17,6 +17,42 @@ class Ticket:
         if not pools:
             raise ValueError("Ticket must contain at least one pool.")
         self.pools = pools
+        self._numbers = None
+
+    @classmethod
+    def fromNumbers(cls, pools: List[Pool], numbers: List[List[int]]) -> "Ticket":
+        """
+        Create a ticket whose numbers were chosen rather than drawn, e.g. by a wheel.
+
+        Args:
+            pools: List of Pool objects defining the pools for this ticket.
+            numbers: The numbers of each pool, in pool order.
+
+        Raises:
+            ValueError: If the numbers do not fit the pools.
+        """
+        if len(numbers) != len(pools):
+            raise ValueError(f"Expected numbers for {len(pools)} pool(s), got {len(numbers)}.")
+        for pool, selected in zip(pools, numbers):
+            if len(set(selected)) != pool.pickCount or \
+                    not all(pool.startNumber <= number <= pool.endNumber for number in selected):
+                raise ValueError(f"{pool.name} needs {pool.pickCount} unique numbers "
+                                 f"from {pool.startNumber} to {pool.endNumber}.")
+        ticket = cls(pools)
+        ticket._numbers = [sorted(selected) for selected in numbers]
+        return ticket
+
+    @property
+    def numbers(self) -> List[List[int]]:
+        """
+        The sorted numbers drawn for each pool, in pool order.
+
+        The numbers are drawn on first access and then kept, so printing,
+        exporting and scoring a ticket all see the same numbers.
+        """
+        if self._numbers is None:
+            self._numbers = [sorted(pool.selectRandomly()) for pool in self.pools]
+        return self._numbers
 
     def __str__(self) -> str:
         """
@@ -26,8 +62,6 @@ class Ticket:
             str: Pool names and sorted numbers.
         """
         lines = []
-        for pool in self.pools:
-            numbers = pool.selectRandomly()
-            numbers.sort()
+        for pool, numbers in zip(self.pools, self.numbers):
             lines.append(f"{pool.name}: {' '.join(str(num) for num in numbers)}")
         return "\n".join(lines)
@@ -19,7 +19,7 @@ class DailyGrandTicketFactory(ITicketFactory):
             Ticket: A ticket with two pools: main numbers and grand number.
         """
         pools = [
-            Pool("Main Numbers", 1, 49, 5),
-            Pool("Grand Number", 1, 7, 1)
+            Pool("Main Numbers", 1, 49, 5, self.generator),
+            Pool("Grand Number", 1, 7, 1, self.generator)
         ]
         return Ticket(pools)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from ..Ticket import Ticket
+from ..randomness import IRandomGenerator
 
 class ITicketFactory(ABC):
     """
@@ -8,6 +9,14 @@ class ITicketFactory(ABC):
     A factory is responsible for generating a complete Ticket for a specific lottery game.
     """
 
+    def __init__(self, generator: IRandomGenerator = None):
+        """
+        Args:
+            generator: source of randomness for the ticket's pools
+                       (default: the module-level Mersenne Twister)
+        """
+        self.generator = generator
+
     @abstractmethod
     def createTicket(self) -> Ticket:
         """
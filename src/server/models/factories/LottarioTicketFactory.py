@@ -17,5 +17,5 @@ class LottarioTicketFactory(ITicketFactory):
         Returns:
             Ticket: A ticket with one pool for Lottario numbers.
         """
-        pools = [Pool("Lottario Numbers", 1, 45, 6)]
+        pools = [Pool("Lottario Numbers", 1, 45, 6, self.generator)]
         return Ticket(pools)
@@ -17,5 +17,5 @@ class LottoMaxTicketFactory(ITicketFactory):
         Returns:
             Ticket: A ticket with one pool for Lotto Max numbers.
         """
-        pools = [Pool("Lotto Max Numbers", 1, 50, 7)]
+        pools = [Pool("Lotto Max Numbers", 1, 50, 7, self.generator)]
         return Ticket(pools)
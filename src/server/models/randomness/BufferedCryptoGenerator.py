@@ -0,0 +1,99 @@
+import os
+import threading
+import weakref
+from .IRandomGenerator import IRandomGenerator
+
+_instances = weakref.WeakSet()
+
+
+def _resetAfterFork():
+    # A forked child must never replay entropy already buffered by its parent.
+    for instance in list(_instances):
+        instance._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_resetAfterFork)
+
+
+class BufferedCryptoGenerator(IRandomGenerator):
+    """
+    Cryptographically secure generator reading os.urandom in large blocks.
+
+    One urandom call fills `blockSize` bytes, so the syscall cost is shared
+    by tens of thousands of numbers. For bounds up to 256 a whole block is
+    turned into unbiased values at once with bytes.translate: bytes at or
+    above the largest multiple of the bound are deleted (rejection sampling)
+    and the rest are mapped to `byte % bound`, all in C. Larger bounds use
+    masked multi-byte rejection sampling from the shared raw block.
+
+    Instances are thread-safe and reset their buffers in forked children.
+    """
+
+    def __init__(self, blockSize: int = 64 * 1024):
+        """
+        Args:
+            blockSize: number of bytes requested from os.urandom per refill
+        """
+        if blockSize < 64:
+            raise ValueError("blockSize must be at least 64 bytes.")
+        self.blockSize = blockSize
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._reset()
+        _instances.add(self)
+
+    def spawn(self) -> "BufferedCryptoGenerator":
+        return BufferedCryptoGenerator(self.blockSize)
+
+    def _reset(self):
+        self._samples = {}
+        self._raw = b""
+        self._rawPosition = 0
+
+    def randbelow(self, n: int) -> int:
+        with self._lock:
+            try:
+                return next(self._samples[n])
+            except (KeyError, StopIteration):
+                pass
+
+            if n <= 0:
+                raise ValueError("n must be positive.")
+            if n > 256:
+                return self.__largeBelow(n)
+
+            table, rejected = self.__translation(n)
+            values = b""
+            while not values:
+                values = os.urandom(self.blockSize).translate(table, rejected)
+            samples = iter(values)
+            self._samples[n] = samples
+            return next(samples)
+
+    def __largeBelow(self, n):
+        bits = n.bit_length()
+        width = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        while True:
+            if self._rawPosition + width > len(self._raw):
+                self._raw = os.urandom(self.blockSize)
+                self._rawPosition = 0
+            value = int.from_bytes(self._raw[self._rawPosition:self._rawPosition + width], "little") & mask
+            self._rawPosition += width
+            if value < n:
+                return value
+
+    def __translation(self, n):
+        """
+        Returns:
+            tuple: (translation table mapping byte -> byte % n,
+                    bytes rejected to keep the result unbiased)
+        """
+        cached = self._tables.get(n)
+        if cached is None:
+            limit = 256 - (256 % n)
+            table = bytes(value % n for value in range(256))
+            cached = (table, bytes(range(limit, 256)))
+            self._tables[n] = cached
+        return cached
@@ -0,0 +1,78 @@
+import hashlib
+from .IRandomGenerator import IRandomGenerator
+
+
+class CounterGenerator(IRandomGenerator):
+    """
+    Seeded, counter-based generator: the numbers drawn for ticket i depend
+    only on (seed, i).
+
+    Ticket i reads a keystream of BLAKE2b blocks keyed by the seed, where
+    block j is the hash of (i, j). Any ticket can therefore be produced
+    directly, without generating the ones before it. This makes it possible
+    to serve offset/limit pages of a huge batch, to split a batch between
+    workers without coordination, and to reproduce runs bit for bit.
+    Values are unbiased by masked rejection sampling.
+
+    Use at() to get the generator of one ticket. An instance is not
+    thread-safe, but separate instances share nothing.
+    """
+
+    def __init__(self, seed, counter: int = 0):
+        """
+        Args:
+            seed: any value; its string form keys the generator, so 42 and "42" are the same seed
+            counter: index of the ticket this generator draws for
+        """
+        self.seed = seed
+        self.key = hashlib.blake2b(str(seed).encode(), digest_size=32).digest()
+        self.counter = counter
+        self._block = 0
+        self._buffer = b""
+        self._position = 0
+
+    def at(self, counter: int) -> "CounterGenerator":
+        """
+        Return a fresh generator for ticket `counter` under the same seed.
+        """
+        generator = CounterGenerator.__new__(CounterGenerator)
+        generator.seed = self.seed
+        generator.key = self.key
+        generator.counter = counter
+        generator._block = 0
+        generator._buffer = b""
+        generator._position = 0
+        return generator
+
+    def spawn(self) -> "CounterGenerator":
+        # Seeded numbers must not depend on the drawing thread, so a spawned
+        # generator replays this ticket from its start.
+        return self.at(self.counter)
+
+    def randbelow(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("n must be positive.")
+        mask = (1 << (n - 1).bit_length()) - 1
+        if mask < 256:
+            while True:
+                if self._position >= len(self._buffer):
+                    self.__refill()
+                value = self._buffer[self._position] & mask
+                self._position += 1
+                if value < n:
+                    return value
+
+        width = (mask.bit_length() + 7) // 8
+        while True:
+            if self._position + width > len(self._buffer):
+                self.__refill()
+            value = int.from_bytes(self._buffer[self._position:self._position + width], "little") & mask
+            self._position += width
+            if value < n:
+                return value
+
+    def __refill(self):
+        message = self.counter.to_bytes(8, "little") + self._block.to_bytes(8, "little")
+        self._buffer = hashlib.blake2b(message, key=self.key).digest()
+        self._position = 0
+        self._block += 1
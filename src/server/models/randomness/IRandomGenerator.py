@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class IRandomGenerator(ABC):
+    """
+    Abstract base class for a source of random integers used by Pool.
+    """
+
+    @abstractmethod
+    def randbelow(self, n: int) -> int:
+        """
+        Return a uniformly distributed integer in the range [0, n).
+
+        Args:
+            n: exclusive upper bound, must be positive
+
+        Returns:
+            int: the random integer
+        """
+        pass
+
+    def spawn(self) -> "IRandomGenerator":
+        """
+        Return an independent generator of the same kind, sharing no state
+        with this one, for use by another thread.
+        """
+        return type(self)()
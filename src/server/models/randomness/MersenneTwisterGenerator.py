@@ -0,0 +1,27 @@
+import random
+from .IRandomGenerator import IRandomGenerator
+
+
+class MersenneTwisterGenerator(IRandomGenerator):
+    """
+    Generator backed by a Mersenne Twister, by default the module-level one
+    of `random`.
+
+    Fast but predictable; this is the historical behaviour of Pool and is
+    not suitable for tickets that carry real value.
+    """
+
+    def __init__(self, rng: random.Random = None):
+        """
+        Args:
+            rng: Mersenne Twister to draw from (default: the module-level one of `random`)
+        """
+        self.rng = rng if rng is not None else random
+
+    def randbelow(self, n: int) -> int:
+        return self.rng.randint(0, n - 1)
+
+    def spawn(self) -> "MersenneTwisterGenerator":
+        # A private twister seeded from os.urandom, so threads never share
+        # (or contend on) the module-level state.
+        return MersenneTwisterGenerator(random.Random())
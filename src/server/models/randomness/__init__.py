@@ -0,0 +1,23 @@
+"""
+Exports the random number generators available to lottery pools.
+"""
+
+from .IRandomGenerator import IRandomGenerator
+from .MersenneTwisterGenerator import MersenneTwisterGenerator
+from .BufferedCryptoGenerator import BufferedCryptoGenerator
+from .CounterGenerator import CounterGenerator
+
+# Generator names accepted on the command line. CounterGenerator needs a seed
+# and is selected by the "seed" request field instead.
+GENERATORS = {
+    "mt": MersenneTwisterGenerator,
+    "crypto": BufferedCryptoGenerator
+}
+
+__all__ = [
+    "IRandomGenerator",
+    "MersenneTwisterGenerator",
+    "BufferedCryptoGenerator",
+    "CounterGenerator",
+    "GENERATORS"
+]
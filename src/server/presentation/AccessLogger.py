@@ -0,0 +1,219 @@
+import os
+import json
+import time
+import queue
+import random
+import threading
+
+_STOP = object()
+
+
+class AccessLogger:
+    """
+    Structured access log written off the request path.
+
+    Request handlers call log() with a dict; the record is only put on a
+    bounded in-memory queue. A background thread drains the queue in
+    batches, writes one JSON object per line through a buffered file and
+    rotates the file by size (path, path.1, ... path.<backupCount>).
+
+    Successful requests are sampled with sampleRate; records whose status is
+    not "ok" are always kept. When the queue is full the record is dropped
+    and counted instead of blocking the request, and the writer reports the
+    number of dropped records in the log itself.
+
+    A failing write (full disk, removed directory, ...) never stops the
+    writer: the error is counted in writeErrors and printed, the records of
+    the failed batch count as dropped, and the file is reopened for the
+    next batch. The file is created with mode 0640, whatever the umask.
+    """
+
+    def __init__(self, path, maxBytes=64 * 1024 * 1024, backupCount=5, queueSize=10000,
+                 sampleRate=1.0, flushInterval=1.0):
+        """
+        Args:
+            path (str): Log file path. Resolved to an absolute path because the
+                        daemon changes directory to "/".
+            maxBytes (int): Size at which the log file is rotated.
+            backupCount (int): Number of rotated files kept.
+            queueSize (int): Maximum number of records waiting to be written.
+            sampleRate (float): Fraction of successful requests that are logged.
+            flushInterval (float): Maximum seconds a written record stays in the file buffer.
+
+        Raises:
+            ValueError: If a size or the sample rate is out of range.
+        """
+        if maxBytes < 1 or queueSize < 1 or backupCount < 0:
+            raise ValueError("Access log sizes must be positive.")
+        if not 0.0 <= sampleRate <= 1.0:
+            raise ValueError("Access log sample rate must be between 0 and 1.")
+
+        self.path = os.path.abspath(path)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.sampleRate = sampleRate
+        self.flushInterval = flushInterval
+
+        self.written = 0
+        self.dropped = 0
+        self.sampledOut = 0
+        self.writeErrors = 0
+        self._reportedDropped = 0
+        self._failing = False
+        self._queue = queue.Queue(maxsize=queueSize)
+        self._closing = threading.Event()
+        self._countersLock = threading.Lock()
+        self._sampler = random.Random()
+        self._thread = None
+        self._file = None
+
+    def start(self):
+        """
+        Start the writer thread. Must be called in the process that logs,
+        i.e. after the daemon has forked.
+        """
+        if self._thread is None:
+            self._closing.clear()
+            self._thread = threading.Thread(target=self.__drain, name="access-log", daemon=True)
+            self._thread.start()
+
+    def log(self, record: dict) -> None:
+        """
+        Queue a record without blocking.
+
+        Args:
+            record (dict): JSON-serializable fields; "status" other than "ok"
+                           bypasses sampling.
+        """
+        if record.get("status") == "ok" and self.sampleRate < 1.0 \
+                and self._sampler.random() >= self.sampleRate:
+            with self._countersLock:
+                self.sampledOut += 1
+            return
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._countersLock:
+                self.dropped += 1
+
+    def close(self, timeout=10.0):
+        """
+        Write all queued records and stop the writer thread.
+
+        Never blocks on a full queue: the writer then stops once it has
+        emptied it.
+
+        Args:
+            timeout (float): Seconds to wait for the writer before giving up on it.
+        """
+        if self._thread is not None:
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                self._closing.set()
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                print(f"Access log writer did not finish within {timeout}s; queued records are lost")
+            self._thread = None
+
+    def __drain(self):
+        lastFlush = time.monotonic()
+        try:
+            while True:
+                try:
+                    record = self._queue.get(timeout=self.flushInterval)
+                except queue.Empty:
+                    record = None
+
+                stop = record is _STOP
+                batch = [] if record is None or stop else [record]
+                while not stop and len(batch) < 1000:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is _STOP:
+                        stop = True
+                    else:
+                        batch.append(record)
+                # Closing with a full queue: no stop marker, so stop once it is empty.
+                if self._closing.is_set() and self._queue.empty():
+                    stop = True
+
+                self.__writeBatch(batch)
+                if self._file is not None and (stop or time.monotonic() - lastFlush >= self.flushInterval):
+                    try:
+                        self._file.flush()
+                    except OSError as e:
+                        self.__writeFailed(e)
+                    lastFlush = time.monotonic()
+                if stop:
+                    return
+        finally:
+            self.__closeFile()
+
+    def __writeBatch(self, batch):
+        with self._countersLock:
+            dropped = self.dropped
+        reported = dropped != self._reportedDropped
+        if reported:
+            batch.append({"event": "access_log_dropped", "dropped": dropped - self._reportedDropped,
+                          "totalDropped": dropped, "time": time.time()})
+        if not batch:
+            return
+
+        try:
+            if self._file is None:
+                self._file = self.__open()
+            self._file.write("".join(json.dumps(record, default=str) + "\n" for record in batch))
+        except OSError as e:
+            self.__writeFailed(e, lost=len(batch) - reported)
+            return
+        self.written += len(batch)
+        self._failing = False
+        if reported:
+            self._reportedDropped = dropped
+
+        try:
+            if self._file.tell() >= self.maxBytes:
+                self.__rotate()
+        except OSError as e:
+            self.__writeFailed(e)
+
+    def __writeFailed(self, error, lost=0):
+        """
+        Count a failed write and close the file, which the next batch reopens.
+        Only the first of consecutive failures is printed.
+        """
+        with self._countersLock:
+            self.writeErrors += 1
+            self.dropped += lost
+        if not self._failing:
+            print(f"Access log write to {self.path} failed: {error}")
+            self._failing = True
+        self.__closeFile()
+
+    def __open(self):
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o640)
+        return os.fdopen(fd, "a", buffering=64 * 1024)
+
+    def __closeFile(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def __rotate(self):
+        self.__closeFile()
+        if self.backupCount > 0:
+            for number in range(self.backupCount - 1, 0, -1):
+                source = f"{self.path}.{number}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{number + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = self.__open()
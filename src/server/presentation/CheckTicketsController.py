@@ -0,0 +1,53 @@
+from ..services import WinningCheckService
+from ..services.converters import LotteryTypeConverter
+from ..services.scoring import TicketIndex
+from ..services.export import ColumnarTicketReader
+
+
+class CheckTicketsController:
+    """
+    Presentation controller responsible for scoring issued tickets against a draw.
+
+    It maps the lottery type string, collects the tickets from text journals,
+    a binary ticket index or a columnar .npy export, optionally saves the combined index for
+    faster re-checks, and returns a CheckResult.
+    """
+
+    def __init__(self, type, winningNumbers, journalPaths=(), indexPath=None, saveIndexPath=None, columnsPath=None):
+        self.type = type
+        self.winningNumbers = winningNumbers
+        self.journalPaths = list(journalPaths)
+        self.indexPath = indexPath
+        self.saveIndexPath = saveIndexPath
+        self.columnsPath = columnsPath
+
+    def execute(self):
+        sources = sum(bool(source) for source in (self.journalPaths, self.indexPath, self.columnsPath))
+        if not sources:
+            raise ValueError("At least one journal, ticket index or columnar export is required.")
+        if sources > 1:
+            raise ValueError("Check either journals, a ticket index or a columnar export, not several.")
+
+        ticketType = LotteryTypeConverter().toTransient(self.type)
+        service = WinningCheckService()
+
+        if self.indexPath:
+            index = TicketIndex.load(self.indexPath)
+        elif self.columnsPath:
+            pickCounts = [pool.pickCount for pool in service.poolsFor(ticketType)]
+            with ColumnarTicketReader(self.columnsPath) as reader:
+                if reader.columns != sum(pickCounts):
+                    raise ValueError(f"{self.columnsPath} does not hold {self.type} tickets.")
+                index = service.indexTickets(ticketType, reader.iterNumbers(pickCounts))
+        else:
+            index = service.indexJournal(ticketType, self.__journalLines())
+
+        if self.saveIndexPath:
+            index.save(self.saveIndexPath)
+
+        return service.check(ticketType, index, self.winningNumbers)
+
+    def __journalLines(self):
+        for path in self.journalPaths:
+            with open(path) as journal:
+                yield from journal
@@ -0,0 +1,99 @@
+from ..services import TicketService
+from ..services.converters import LotteryTypeConverter
+from ..services.transients import GenerationResponse, BatchGenerationResponse
+from .GenerateTicketController import GenerateTicketController
+
+MAX_BATCH_ITEMS = 1000
+
+
+class GenerateBatchController:
+    """
+    Presentation controller responsible for a batch of generation requests
+    answered in a single round trip.
+
+    A batch request looks like:
+    {
+        "batch": [
+            {"type": "max", "requestId": "a1", "count": 3},
+            {"type": "grand", "requestId": "b7", "count": 2},
+            ...
+        ]
+    }
+
+    Every sub-request is validated like a single request. Valid sub-requests
+    are generated in one pass grouped by LotteryType, so each game's factory
+    is set up once per batch; invalid ones become per-item errors without
+    failing the rest of the batch.
+    """
+
+    def __init__(self, items, generator=None):
+        self.items = items
+        self.generator = generator
+
+    @classmethod
+    def isBatch(cls, request):
+        """
+        Returns:
+            bool: True when a decoded request is a batch request.
+        """
+        return isinstance(request, dict) and "batch" in request
+
+    @classmethod
+    def fromRequest(cls, request, generator=None):
+        """
+        Validate the envelope of a batch request.
+
+        Raises:
+            ValueError: If "batch" is not a non-empty list of at most MAX_BATCH_ITEMS items.
+        """
+        items = request.get("batch")
+        if not isinstance(items, list) or not items:
+            raise ValueError("'batch' must be a non-empty list")
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ValueError(f"'batch' must not contain more than {MAX_BATCH_ITEMS} requests")
+        return cls(items, generator)
+
+    def execute(self):
+        converter = LotteryTypeConverter()
+        controllers = [None] * len(self.items)
+        errors = [None] * len(self.items)
+        groups = {}
+
+        for position, item in enumerate(self.items):
+            try:
+                controller = GenerateTicketController.fromRequest(item, self.generator)
+                ticketType = converter.toTransient(controller.type)
+            except ValueError as e:
+                requestId = item.get("requestId") if isinstance(item, dict) else None
+                errors[position] = (None if requestId is None else str(requestId), str(e))
+                continue
+            controllers[position] = controller
+            if controller.seed is None:
+                groups.setdefault(ticketType, []).append(position)
+
+        service = TicketService(self.generator)
+        responses = [None] * len(self.items)
+        for position, controller in enumerate(controllers):
+            # Seeded tickets depend on their own index, so they are never pooled.
+            if controller is not None and controller.seed is not None:
+                responses[position] = controller.execute()
+        for ticketType, positions in groups.items():
+            total = sum(controllers[position].amount for position in positions)
+            tickets = service.generateTickets(ticketType, total)
+            ticketTypeStr = converter.toString(ticketType)
+
+            start = 0
+            for position in positions:
+                controller = controllers[position]
+                responses[position] = GenerationResponse(
+                    controller.id, ticketTypeStr, tickets[start:start + controller.amount]
+                )
+                start += controller.amount
+
+        batchResponse = BatchGenerationResponse()
+        for response, error in zip(responses, errors):
+            if response is not None:
+                batchResponse.addResult(response)
+            else:
+                batchResponse.addError(*error)
+        return batchResponse
@@ -1,6 +1,9 @@
 from ..services import TicketService
 from ..services.converters import LotteryTypeConverter
 from ..services.transients.GenerationResponse import GenerationResponse
+from ..services.transients.ScheduledGenerationResponse import ScheduledGenerationResponse
+from ..services.export import ColumnarTicketWriter
+from ..services.tracing import span
 
 class GenerateTicketController:
     """
@@ -13,21 +16,151 @@ class GenerateTicketController:
         - Generating ticket(s)
         - Creating a GenerationResponse
 
-    It accepts a request ID, lottery type string, and the number of tickets to generate.
+    It accepts a request ID, lottery type string, and the number of tickets to generate,
+    plus an optional random generator (IRandomGenerator) for the ticket pools.
+
+    With a seed, ticket i is a pure function of (seed, i) and the controller
+    generates tickets offset .. offset + amount - 1 of that seeded batch.
     """
 
-    def __init__(self, id, type, amount):
+    def __init__(self, id, type, amount, generator=None, seed=None, offset=0):
         self.id = id
         self.type = type
         self.amount = amount
+        self.generator = generator
+        self.seed = seed
+        self.offset = offset
+
+    @classmethod
+    def fromRequest(cls, request, generator=None):
+        """
+        Validate a decoded JSON request and create a controller for it.
+
+        Requests look like:
+        {
+            "type": "max" | "grand" | "lottario",
+            "requestId": "<string>",
+            "count": <number of tickets>  (optional, default = 1)
+            "seed": <integer or string>  (optional, reproducible tickets)
+            "offset": <first ticket>  (optional, default = 0, needs a seed)
+            "limit": <page size>  (optional, default = the rest of the batch, needs a seed)
+        }
+
+        With a seed, "count" is the size of the whole seeded batch and the
+        response holds tickets offset .. min(offset + limit, count) - 1 of it.
+
+        Raises:
+            ValueError: If a field is missing or invalid.
+        """
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        if "type" not in request:
+            raise ValueError("Missing field: 'type'")
+        if "requestId" not in request:
+            raise ValueError("Missing field: 'requestId'")
+        if "wheel" in request:
+            raise ValueError("A 'wheel' request must be sent on its own, not inside a ticket or batch request")
+
+        typeStr = request["type"]
+        if not isinstance(typeStr, str):
+            raise ValueError("'type' must be a string")
+        requestId = str(request["requestId"]).strip()
+        if not requestId:
+            raise ValueError("'requestId' must not be empty")
+
+        count = request.get("count", 1)
+        try:
+            count = int(count)
+        except (ValueError, TypeError):
+            raise ValueError("'count' must be an integer")
+
+        if count < 1:
+            raise ValueError("'count' must be at least 1")
+
+        seed = request.get("seed")
+        if seed is None:
+            if "offset" in request or "limit" in request:
+                raise ValueError("'offset' and 'limit' require a 'seed'")
+            return cls(requestId, typeStr, count, generator)
+
+        if not isinstance(seed, (int, str)) or isinstance(seed, bool):
+            raise ValueError("'seed' must be an integer or a string")
+
+        try:
+            offset = int(request.get("offset", 0))
+            limit = int(request.get("limit", count))
+        except (ValueError, TypeError):
+            raise ValueError("'offset' and 'limit' must be integers")
+
+        if offset < 0 or offset >= count:
+            raise ValueError(f"'offset' must be between 0 and {count - 1}")
+        if limit < 1:
+            raise ValueError("'limit' must be at least 1")
+
+        return cls(requestId, typeStr, min(limit, count - offset), generator, seed, offset)
+
+    def execute(self, executor=None):
+        """
+        Generate the tickets and wrap them in a GenerationResponse.
 
-    def execute(self):
+        Args:
+            executor (ThreadPoolTicketExecutor, optional): Draws the tickets on a
+                                                           thread pool instead of
+                                                           the calling thread.
+        """
         ticketTypeConverter = LotteryTypeConverter()
         ticketType = ticketTypeConverter.toTransient(self.type)
         ticketTypeStr = ticketTypeConverter.toString(ticketType)
 
-        service = TicketService()
-        tickets = [service.generateTicket(ticketType) for _ in range(self.amount)]
+        with span("GenerateTicketController.execute", requestId=self.id, count=self.amount):
+            if executor is None:
+                service = TicketService(self.generator)
+                tickets = service.generateTickets(ticketType, self.amount, self.seed, self.offset)
+            else:
+                tickets = executor.generateTickets(ticketType, self.amount, self.generator,
+                                                   self.seed, self.offset)
 
-        generationRequest = GenerationResponse(self.id, ticketTypeStr, tickets)
+            generationRequest = GenerationResponse(self.id, ticketTypeStr, tickets)
         return generationRequest
+
+    def schedule(self, scheduler, timeout=None):
+        """
+        Generate the tickets on a GenerationScheduler, chunk by chunk and
+        interleaved with other requests, instead of all at once.
+
+        Args:
+            scheduler (GenerationScheduler): The scheduler to submit to.
+            timeout (float, optional): Seconds after which generation is cancelled.
+
+        Returns:
+            ScheduledGenerationResponse: Streams the tickets as they are generated.
+        """
+        ticketTypeConverter = LotteryTypeConverter()
+        ticketType = ticketTypeConverter.toTransient(self.type)
+        ticketTypeStr = ticketTypeConverter.toString(ticketType)
+
+        job = scheduler.submit(ticketType, self.amount, self.generator, timeout, self.seed, self.offset)
+        return ScheduledGenerationResponse(self.id, ticketTypeStr, job)
+
+    def export(self, path):
+        """
+        Stream the tickets straight into a columnar .npy export instead of
+        building a GenerationResponse, so memory use stays flat however many
+        tickets are requested.
+
+        Returns:
+            int: Number of tickets written.
+        """
+        ticketTypeConverter = LotteryTypeConverter()
+        ticketType = ticketTypeConverter.toTransient(self.type)
+        ticketTypeStr = ticketTypeConverter.toString(ticketType)
+
+        service = TicketService(self.generator)
+        tickets = service.iterTickets(ticketType, self.amount, self.seed, self.offset)
+        first = next(tickets)
+
+        metadata = {"requestId": self.id, "lotteryType": ticketTypeStr}
+        with ColumnarTicketWriter(path, first.pools, metadata) as writer:
+            writer.write(first)
+            writer.writeTickets(tickets)
+        return writer.rows
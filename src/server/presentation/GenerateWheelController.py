@@ -0,0 +1,106 @@
+from math import comb
+from ..services import WheelService
+from ..services.converters import LotteryTypeConverter
+from ..services.transients import WheelResponse
+
+MAX_TIME_BUDGET = 30.0
+# Seconds allowed to build a wheel search and find its first wheel, before
+# the time budget is spent improving it.
+MAX_SEARCH_SECONDS = 5.0
+# Largest C(numbers, match) * C(numbers, if) served: the size in bits of the
+# search's incidence bitsets (16 MiB), which also bounds its build time.
+MAX_WHEEL_BITS = 2 ** 27
+
+
+class GenerateWheelController:
+    """
+    Presentation controller responsible for lottery wheels.
+
+    A wheel request looks like:
+    {
+        "type": "max" | "grand" | "lottario",
+        "requestId": "<string>",
+        "wheel": {
+            "numbers": [3, 8, 11, ...],   numbers of the game's first pool to wheel
+            "match": 4,                   numbers guaranteed to match on one ticket
+            "if": 5,                      (optional, default = match) drawn numbers among them
+            "timeBudget": 2.0,            (optional) seconds spent improving the wheel
+            "seed": <integer or string>   (optional) seed of the search
+        }
+    }
+    """
+
+    def __init__(self, id, type, numbers, match, ifDrawn=None, timeBudget=2.0, seed=0, generator=None):
+        self.id = id
+        self.type = type
+        self.numbers = numbers
+        self.match = match
+        self.ifDrawn = ifDrawn
+        self.timeBudget = timeBudget
+        self.seed = seed
+        self.generator = generator
+
+    @classmethod
+    def isWheel(cls, request):
+        """
+        Returns:
+            bool: True when a decoded request asks for a wheel.
+        """
+        return isinstance(request, dict) and "wheel" in request
+
+    @classmethod
+    def fromRequest(cls, request, generator=None):
+        """
+        Validate a decoded wheel request and create a controller for it.
+
+        Raises:
+            ValueError: If a field is missing or invalid.
+        """
+        if "type" not in request or not isinstance(request["type"], str):
+            raise ValueError("Missing field: 'type'")
+        requestId = str(request.get("requestId", "")).strip()
+        if not requestId:
+            raise ValueError("'requestId' must not be empty")
+
+        wheel = request["wheel"]
+        if not isinstance(wheel, dict):
+            raise ValueError("'wheel' must be a JSON object")
+        numbers = wheel.get("numbers")
+        if not isinstance(numbers, list) or not numbers:
+            raise ValueError("'wheel.numbers' must be a non-empty list")
+        if "match" not in wheel:
+            raise ValueError("Missing field: 'wheel.match'")
+
+        try:
+            numbers = [int(number) for number in numbers]
+            match = int(wheel["match"])
+            ifDrawn = int(wheel["if"]) if "if" in wheel else None
+            timeBudget = float(wheel.get("timeBudget", 2.0))
+        except (ValueError, TypeError):
+            raise ValueError("'wheel' numbers, 'match', 'if' and 'timeBudget' must be numeric")
+
+        if len(set(numbers)) != len(numbers):
+            raise ValueError("'wheel.numbers' must not repeat")
+        if match < 1:
+            raise ValueError("'wheel.match' must be at least 1")
+        if not 0 <= timeBudget <= MAX_TIME_BUDGET:
+            raise ValueError(f"'wheel.timeBudget' must be between 0 and {MAX_TIME_BUDGET} seconds")
+        drawn = match if ifDrawn is None else ifDrawn
+        if comb(len(numbers), match) * comb(len(numbers), drawn) > MAX_WHEEL_BITS:
+            raise ValueError(f"A {match}-if-{drawn} wheel of {len(numbers)} numbers is too large; "
+                             f"wheel fewer numbers or ask for a smaller guarantee")
+
+        return cls(requestId, request["type"], numbers, match, ifDrawn, timeBudget,
+                   wheel.get("seed", 0), generator)
+
+    def execute(self):
+        ticketTypeConverter = LotteryTypeConverter()
+        ticketType = ticketTypeConverter.toTransient(self.type)
+        ticketTypeStr = ticketTypeConverter.toString(ticketType)
+
+        service = WheelService(self.generator)
+        tickets, guarantee = service.generateWheel(
+            ticketType, self.numbers, self.match, self.ifDrawn, self.timeBudget, self.seed,
+            MAX_SEARCH_SECONDS
+        )
+        return WheelResponse(self.id, ticketTypeStr, tickets, guarantee)
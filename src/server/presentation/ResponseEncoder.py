@@ -0,0 +1,100 @@
+import zlib
+
+# wbits selecting the container format of each supported encoding.
+WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "zlib": zlib.MAX_WBITS
+}
+
+
+class ResponseEncoder:
+    """
+    Encodes a response, given as successive text chunks, into bytes with an
+    optional streaming compression.
+
+    Ticket responses repeat the same pool names and digits on every line, so
+    they compress 5–10x. Compression happens chunk by chunk while the
+    response is serialized, so the first compressed bytes can be sent before
+    the last ticket is formatted and the whole response is never held in
+    compressed and uncompressed form at once.
+
+    Supported encodings: "identity" (no compression), "zlib" and "gzip".
+
+    An uncompressed response can end with a trailer chosen by the client,
+    which lets it tell a complete response from one cut short by a dropped
+    connection; compressed streams carry their own end marker and checksum.
+    """
+
+    # Longest trailer a client may ask for, in characters.
+    MAX_TRAILER = 64
+
+    ENCODINGS = ("identity", "zlib", "gzip")
+
+    def __init__(self, encoding: str = "identity", level: int = 6, trailer: str = None):
+        """
+        Args:
+            encoding (str): One of ENCODINGS. Default is "identity".
+            level (int): zlib compression level, 1 (fastest) to 9 (smallest). Default is 6.
+            trailer (str, optional): Text ending an uncompressed response.
+
+        Raises:
+            ValueError: If the encoding, level or trailer is not supported.
+        """
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unsupported encoding: '{encoding}'")
+        if not 1 <= level <= 9:
+            raise ValueError("Compression level must be between 1 and 9.")
+        if trailer is not None and (not isinstance(trailer, str) or not 0 < len(trailer) <= self.MAX_TRAILER):
+            raise ValueError(f"'trailer' must be a string of 1 to {self.MAX_TRAILER} characters")
+        self.encoding = encoding
+        self.level = level
+        self.trailer = trailer
+
+    @classmethod
+    def fromRequest(cls, request, level: int = 6):
+        """
+        Create the encoder requested by the optional "accept_encoding" field
+        of a JSON request: an encoding name, or a list of names in order of
+        preference of which the first supported one is used. The optional
+        "trailer" field sets the text ending an uncompressed response.
+
+        Raises:
+            ValueError: If none of the requested encodings is supported or
+                        the trailer is invalid.
+        """
+        if not isinstance(request, dict):
+            request = {}
+        trailer = request.get("trailer")
+        accepted = request.get("accept_encoding", "identity")
+        if isinstance(accepted, str):
+            accepted = [accepted]
+        if not isinstance(accepted, list) or not accepted:
+            raise ValueError("'accept_encoding' must be a string or a non-empty list of strings")
+
+        for encoding in accepted:
+            if isinstance(encoding, str) and encoding.lower() in cls.ENCODINGS:
+                return cls(encoding.lower(), level, trailer)
+        raise ValueError(f"Unsupported 'accept_encoding': {accepted}; "
+                         f"supported are {', '.join(cls.ENCODINGS)}")
+
+    def encode(self, chunks):
+        """
+        Yields the encoded bytes of the text chunks. Chunks the compressor
+        buffers internally produce no output until enough input has arrived.
+
+        Args:
+            chunks (Iterable[str]): The response text in pieces.
+        """
+        if self.encoding == "identity":
+            for chunk in chunks:
+                yield chunk.encode()
+            if self.trailer is not None:
+                yield self.trailer.encode()
+            return
+
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[self.encoding])
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode())
+            if data:
+                yield data
+        yield compressor.flush()
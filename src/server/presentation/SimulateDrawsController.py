@@ -0,0 +1,23 @@
+from ..services import SimulationService
+from ..services.converters import LotteryTypeConverter
+
+
+class SimulateDrawsController:
+    """
+    Presentation controller responsible for Monte Carlo draw simulations.
+
+    It maps the lottery type string and returns the SimulationResult of
+    `draws` draws, each scored against `ticketsPerDraw` random tickets.
+    """
+
+    def __init__(self, type, draws, ticketsPerDraw, workers=None, seed=0):
+        self.type = type
+        self.draws = draws
+        self.ticketsPerDraw = ticketsPerDraw
+        self.workers = workers
+        self.seed = seed
+
+    def execute(self):
+        ticketType = LotteryTypeConverter().toTransient(self.type)
+        service = SimulationService(self.workers)
+        return service.simulate(ticketType, self.draws, self.ticketsPerDraw, self.seed)
@@ -0,0 +1,25 @@
+from ..services import ValidationService
+from ..services.converters import LotteryTypeConverter
+
+
+class ValidateGeneratorController:
+    """
+    Presentation controller responsible for statistical validation of a
+    generation backend.
+
+    It maps the lottery type string and returns the ValidationReport of
+    `tickets` tickets drawn with `backend`.
+    """
+
+    def __init__(self, type, tickets, backend="mt", workers=None, seed=0, alpha=0.01):
+        self.type = type
+        self.tickets = tickets
+        self.backend = backend
+        self.workers = workers
+        self.seed = seed
+        self.alpha = alpha
+
+    def execute(self):
+        ticketType = LotteryTypeConverter().toTransient(self.type)
+        service = ValidationService(self.workers)
+        return service.validate(ticketType, self.tickets, self.backend, self.seed, self.alpha)
@@ -3,7 +3,21 @@ Exports controller classes for the lottery system.
 """
 
 from .GenerateTicketController import GenerateTicketController
+from .CheckTicketsController import CheckTicketsController
+from .GenerateBatchController import GenerateBatchController
+from .GenerateWheelController import GenerateWheelController
+from .SimulateDrawsController import SimulateDrawsController
+from .ValidateGeneratorController import ValidateGeneratorController
+from .ResponseEncoder import ResponseEncoder
+from .AccessLogger import AccessLogger
 
 __all__ = [
-    "GenerateTicketController"
+    "GenerateTicketController",
+    "CheckTicketsController",
+    "GenerateBatchController",
+    "GenerateWheelController",
+    "SimulateDrawsController",
+    "ValidateGeneratorController",
+    "ResponseEncoder",
+    "AccessLogger"
 ]
\ No newline at end of file
@@ -1,5 +1,17 @@
+import os
+import re
+import sys
+import csv
+import json
 import argparse
 from ..GenerateTicketController import GenerateTicketController
+from ..CheckTicketsController import CheckTicketsController
+from ..GenerateWheelController import GenerateWheelController
+from ..SimulateDrawsController import SimulateDrawsController
+from ..ValidateGeneratorController import ValidateGeneratorController
+from ...models.randomness import GENERATORS
+from ...services.parallel import ThreadPoolTicketExecutor
+from ...services.validation import BACKENDS
 
 
 class Console:
@@ -8,6 +20,9 @@ class Console:
 
     This class handles user input via argparse, maps the selected game type,
     and delegates ticket generation to the TicketService.
+
+    In batch mode many requests are read from a JSONL or CSV file (or stdin)
+    and served by a single process, paying interpreter start-up once.
     """
 
     def createTicket(self, argv):
@@ -16,12 +31,28 @@ class Console:
         lottery tickets using the appropriate OLG game logic.
 
         Command-line arguments:
-            -t : Type of lottery game (max, grand, or lottario) [required]
-            --id : Identifier for the ticket generation request [required]
+            -t : Type of lottery game (max, grand, or lottario) [required without --batch]
+            --id : Identifier for the ticket generation request [required without --batch]
             -n : Number of tickets to generate (default = 1) [optional]
+            --rng : Random generator, "mt" or "crypto" (default = mt) [optional]
+            --seed : Make ticket i a pure function of (seed, i), reproducible across runs [optional]
+            --offset : Index of the first seeded ticket, for paging (default = 0) [optional]
+            --threads : Draw the tickets on N threads when the GIL is disabled (default = 1) [optional]
+            --wheel : Numbers to wheel instead of drawing tickets at random [optional]
+            --match / --if : Wheel guarantee, "match" numbers on one ticket if "if" are drawn
+            --time-budget : Seconds spent improving the wheel (default = 2)
+            --batch : JSONL or CSV file of {type, requestId, count} requests, "-" for stdin
+            --format : Batch file format, "jsonl", "csv" or "auto" (default = auto)
+            --output-dir : Write each batch response to <dir>/ticket_<requestId>.txt; characters
+                           other than letters, digits, "_", "." and "-" become "_"
+            -o : Write all batch responses to one file instead of stdout
+            --export : Stream the tickets to a columnar .npy file (plus a .json sidecar)
 
         Output:
-            Prints the generated ticket(s) as part of a GenerationRequest.
+            Prints the generated ticket(s) as part of a GenerationRequest, or a
+            one-line summary when --export is given.
+            In batch mode, invalid entries are reported on stderr with their
+            line number and the remaining entries are still processed.
         """
         parser = argparse.ArgumentParser(
             description="Generate random lottery tickets for OLG games: Lotto Max, Daily Grand, or Lottario."
@@ -30,8 +61,7 @@ class Console:
         parser.add_argument(
             "-t",
             choices=["max", "grand", "lottario"],
-            required=True,
-            help="Type of lottery to generate: max, grand, or lottario (required)"
+            help="Type of lottery to generate: max, grand, or lottario (required without --batch)"
         )
 
         parser.add_argument(
@@ -44,16 +74,419 @@ class Console:
         parser.add_argument(
             "--id",
             type=str,
-            required=True,
-            help="Identifier for the ticket generation request (required)"
+            help="Identifier for the ticket generation request (required without --batch)"
+        )
+
+        parser.add_argument(
+            "--rng",
+            choices=sorted(GENERATORS),
+            default="mt",
+            help="Random generator: mt (Mersenne Twister) or crypto (buffered os.urandom); default is mt"
+        )
+
+        parser.add_argument(
+            "--seed",
+            help="Seed of a reproducible batch: ticket i depends only on (seed, i); overrides --rng"
+        )
+
+        parser.add_argument(
+            "--offset",
+            type=int,
+            default=0,
+            help="Index of the first ticket of a seeded batch (default is 0; requires --seed)"
+        )
+
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Draw the tickets on this many threads on a free-threaded (GIL-disabled) Python; "
+                 "ignored while the GIL is enabled (default is 1)"
+        )
+
+        parser.add_argument(
+            "--wheel",
+            metavar="NUMBERS",
+            help='Build a wheel over these numbers of the first pool, e.g. --wheel "3 8 11 19 24 30 33 41 45"'
+        )
+
+        parser.add_argument(
+            "--match",
+            type=int,
+            help="Numbers guaranteed to match on one wheel ticket (required with --wheel)"
+        )
+
+        parser.add_argument(
+            "--if",
+            dest="if_drawn",
+            type=int,
+            help="Drawn numbers among the wheeled ones the guarantee assumes (default is --match)"
+        )
+
+        parser.add_argument(
+            "--time-budget",
+            type=float,
+            default=2.0,
+            help="Seconds spent looking for a smaller wheel (default is 2)"
+        )
+
+        parser.add_argument(
+            "--batch",
+            metavar="FILE",
+            help='JSONL or CSV file of {type, requestId, count} requests; "-" reads stdin'
+        )
+
+        parser.add_argument(
+            "--format",
+            choices=["auto", "jsonl", "csv"],
+            default="auto",
+            help="Format of the batch file; auto picks jsonl when the first entry starts with '{'"
+        )
+
+        output = parser.add_mutually_exclusive_group()
+        output.add_argument(
+            "--export",
+            metavar="FILE",
+            help="Stream the tickets to FILE as a NumPy .npy array (one row per ticket) "
+                 "with a FILE.json metadata sidecar, instead of printing them"
+        )
+        output.add_argument(
+            "--output-dir",
+            metavar="DIR",
+            help="Write each batch response to DIR/ticket_<requestId>.txt"
+                 " (characters other than letters, digits, '_', '.' and '-' become '_')"
+        )
+        output.add_argument(
+            "-o",
+            metavar="FILE",
+            help="Write all batch responses to FILE instead of stdout"
         )
 
         args = parser.parse_args(argv)
+        generator = GENERATORS[args.rng]()
 
+        if args.batch:
+            if args.t or args.id:
+                parser.error("-t and --id cannot be combined with --batch.")
+            if args.export:
+                parser.error("--export cannot be combined with --batch.")
+            if args.seed is not None or args.offset:
+                parser.error('--seed and --offset cannot be combined with --batch; use the "seed" field.')
+            try:
+                failures = self.__runBatch(args, generator)
+            except OSError as e:
+                parser.error(str(e))
+            sys.exit(1 if failures else 0)
+
+        if args.t is None or args.id is None:
+            parser.error("-t and --id are required unless --batch is given.")
         if args.n < 1:
             parser.error("The number of tickets (-n) must be at least 1.")
+        if args.offset < 0 or (args.offset and args.seed is None):
+            parser.error("--offset must be 0 or more and requires --seed.")
+        if args.threads < 1:
+            parser.error("--threads must be at least 1.")
+
+        if args.wheel:
+            if args.match is None:
+                parser.error("--match is required with --wheel.")
+            try:
+                numbers = [int(number) for number in args.wheel.replace(",", " ").split()]
+                wheelController = GenerateWheelController.fromRequest({
+                    "type": args.t, "requestId": args.id,
+                    "wheel": {"numbers": numbers, "match": args.match, "timeBudget": args.time_budget,
+                              **({"if": args.if_drawn} if args.if_drawn is not None else {})}
+                }, generator)
+                print(wheelController.execute())
+            except ValueError as e:
+                parser.error(str(e))
+            return
 
-        generateTicketController = GenerateTicketController(args.id, args.t, args.n)
-        generationResponse = generateTicketController.execute()
+        generateTicketController = GenerateTicketController(
+            args.id, args.t, args.n, generator, args.seed, args.offset
+        )
+        if args.export:
+            try:
+                written = generateTicketController.export(args.export)
+            except OSError as e:
+                parser.error(str(e))
+            print(f"Exported {written} ticket(s) to {args.export}")
+            return
+
+        executor = ThreadPoolTicketExecutor(args.threads) if args.threads > 1 else None
+        try:
+            generationResponse = generateTicketController.execute(executor)
+        finally:
+            if executor is not None:
+                executor.close()
 
         print(generationResponse)
+
+    def __runBatch(self, args, generator):
+        """
+        Serve every request of a batch file with the same validation as the
+        socket daemon, streaming each response as it is serialized.
+
+        With --output-dir, a request whose file an earlier entry already
+        wrote is reported as an error instead of overwriting it.
+
+        Returns:
+            int: Number of entries that failed.
+        """
+        source = sys.stdin if args.batch == "-" else open(args.batch, newline="")
+        combined = None
+        if args.o:
+            combined = open(args.o, "w")
+        elif not args.output_dir:
+            combined = sys.stdout
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+
+        failures = 0
+        written = 0
+        fileLines = {}
+        try:
+            for lineNumber, request in self.__readBatch(source, args.format):
+                try:
+                    if isinstance(request, Exception):
+                        raise request
+                    controller = GenerateTicketController.fromRequest(request, generator)
+                    if args.output_dir:
+                        # The requestId is client data: keep it from naming a path.
+                        safeId = re.sub(r"[^A-Za-z0-9_.-]", "_", str(controller.id))[:64]
+                        name = f"ticket_{safeId}.txt"
+                        if name in fileLines:
+                            raise ValueError(f"Duplicate requestId '{controller.id}': {name} "
+                                             f"was already written for line {fileLines[name]}")
+                        fileLines[name] = lineNumber
+
+                    chunks = controller.execute().iterChunks()
+                    if args.output_dir:
+                        with open(os.path.join(args.output_dir, name), "w") as f:
+                            f.writelines(chunks)
+                    else:
+                        if written:
+                            combined.write("\n\n")
+                        combined.writelines(chunks)
+                    written += 1
+                except (ValueError, OSError) as e:
+                    failures += 1
+                    print(f"[Error] line {lineNumber}: {e}", file=sys.stderr)
+
+            if combined is not None and written:
+                combined.write("\n")
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if combined is not None and combined is not sys.stdout:
+                combined.close()
+        return failures
+
+    @staticmethod
+    def __readBatch(source, format):
+        """
+        Yields (line number, request dict) for every entry of a JSONL or CSV
+        stream, or (line number, ValueError) for entries that cannot be parsed.
+        CSV input needs a header row naming the type, requestId and count columns.
+        """
+        lines = iter(source)
+        first = ""
+        skipped = 0
+        for first in lines:
+            if first.strip():
+                break
+            skipped += 1
+        else:
+            return
+
+        if format == "auto":
+            format = "jsonl" if first.lstrip().startswith("{") else "csv"
+
+        def remaining():
+            yield first
+            yield from lines
+
+        if format == "jsonl":
+            for lineNumber, line in enumerate(remaining(), skipped + 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield lineNumber, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield lineNumber, ValueError(f"Invalid JSON: {e}")
+            return
+
+        reader = csv.DictReader(remaining())
+        for row in reader:
+            if not any(value and value.strip() for value in row.values() if isinstance(value, str)):
+                continue
+            # Empty cells fall back to the request defaults (e.g. count = 1).
+            request = {key.strip(): value.strip() for key, value in row.items()
+                       if key and isinstance(value, str) and value.strip()}
+            yield skipped + reader.line_num, request
+
+    def checkTickets(self, argv):
+        """
+        Parses command-line arguments and scores issued tickets against the
+        winning numbers of a draw.
+
+        Command-line arguments:
+            -t : Type of lottery game (max, grand, or lottario) [required]
+            -w : Winning numbers of one pool, repeated once per pool in ticket order [required]
+            --journal : Generation response text files or client archive segments
+            --index : Binary ticket index written by --save-index
+            --columns : Columnar .npy export written by the generator's --export
+            --save-index : Write the tickets read from the journals to a binary index
+
+        Output:
+            Prints the prize-tier tallies and per-pool match histograms.
+        """
+        parser = argparse.ArgumentParser(
+            description="Score issued OLG lottery tickets against the winning numbers of a draw."
+        )
+
+        parser.add_argument(
+            "-t",
+            choices=["max", "grand", "lottario"],
+            required=True,
+            help="Type of lottery the tickets belong to: max, grand, or lottario (required)"
+        )
+
+        parser.add_argument(
+            "-w",
+            action="append",
+            required=True,
+            metavar="NUMBERS",
+            help='Winning numbers of one pool, e.g. -w "1 2 3 4 5" -w "7" for Daily Grand (required)'
+        )
+
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--journal", nargs="+", metavar="FILE",
+                            help="Response text files or client archive segments holding the tickets")
+        source.add_argument("--index", metavar="FILE", help="Binary ticket index to check")
+        source.add_argument("--columns", metavar="FILE", help="Columnar .npy ticket export to check")
+
+        parser.add_argument("--save-index", metavar="FILE",
+                            help="Save the tickets read from the journals as a binary index")
+
+        args = parser.parse_args(argv)
+
+        try:
+            winningNumbers = [[int(number) for number in pool.replace(",", " ").split()] for pool in args.w]
+        except ValueError:
+            parser.error("Winning numbers (-w) must be integers.")
+
+        checkTicketsController = CheckTicketsController(
+            args.t, winningNumbers, args.journal or (), args.index, args.save_index, args.columns
+        )
+        try:
+            checkResult = checkTicketsController.execute()
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+
+        print(checkResult)
+
+    def simulateDraws(self, argv):
+        """
+        Parses command-line arguments and estimates the odds of every prize
+        tier with a Monte Carlo simulation.
+
+        Command-line arguments:
+            -t : Type of lottery game (max, grand, or lottario) [required]
+            --draws : Number of simulated draws (default = 1000)
+            --tickets : Random tickets scored against every draw (default = 100000)
+            --workers : Worker processes (default = CPU count)
+            --seed : Seed of the run (default = 0)
+
+        Output:
+            Prints estimated and exact odds per prize tier and per pool match
+            count, with 95% intervals, and the tickets needed until a jackpot.
+        """
+        parser = argparse.ArgumentParser(
+            description="Estimate OLG lottery prize-tier odds by simulating draws."
+        )
+
+        parser.add_argument(
+            "-t",
+            choices=["max", "grand", "lottario"],
+            required=True,
+            help="Type of lottery to simulate: max, grand, or lottario (required)"
+        )
+        parser.add_argument("--draws", type=int, default=1000,
+                            help="Number of simulated draws (default is 1000)")
+        parser.add_argument("--tickets", type=int, default=100000,
+                            help="Random tickets scored against every draw (default is 100000)")
+        parser.add_argument("--workers", type=int,
+                            help="Worker processes (default is the CPU count)")
+        parser.add_argument("--seed", default="0", help="Seed of the run (default is 0)")
+
+        args = parser.parse_args(argv)
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1.")
+
+        simulateDrawsController = SimulateDrawsController(args.t, args.draws, args.tickets, args.workers, args.seed)
+        try:
+            simulationResult = simulateDrawsController.execute()
+        except ValueError as e:
+            parser.error(str(e))
+
+        print(simulationResult)
+
+    def validateGenerator(self, argv):
+        """
+        Parses command-line arguments and tests whether a generation backend
+        draws every game uniformly.
+
+        Command-line arguments:
+            -t : Types of lottery game to validate (default = max grand lottario)
+            --tickets : Tickets generated per game (default = 1000000)
+            --backend : Generation backend, "mt", "crypto" or "counter" (default = mt)
+            --alpha : Probability of failing a uniform backend, per game (default = 0.01)
+            --workers : Worker processes (default = CPU count)
+            --seed : Seed of the "counter" backend (default = 0)
+
+        Output:
+            Prints a pass/fail report per game with the chi-square and
+            Kolmogorov-Smirnov results of every pool, and exits with status 1
+            when any game fails.
+        """
+        parser = argparse.ArgumentParser(
+            description="Test that a ticket generation backend draws OLG games uniformly."
+        )
+
+        parser.add_argument(
+            "-t",
+            nargs="+",
+            choices=["max", "grand", "lottario"],
+            default=["max", "grand", "lottario"],
+            help="Types of lottery to validate (default is all three)"
+        )
+        parser.add_argument("--tickets", type=int, default=1000000,
+                            help="Tickets generated per game (default is 1000000)")
+        parser.add_argument("--backend", choices=BACKENDS, default="mt",
+                            help='Generation backend: a --rng generator or "counter" (seeded); default is mt')
+        parser.add_argument("--alpha", type=float, default=0.01,
+                            help="Probability of failing a uniform backend, per game (default is 0.01)")
+        parser.add_argument("--workers", type=int,
+                            help="Worker processes (default is the CPU count)")
+        parser.add_argument("--seed", default="0", help='Seed of the "counter" backend (default is 0)')
+
+        args = parser.parse_args(argv)
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1.")
+
+        failed = False
+        for position, type in enumerate(dict.fromkeys(args.t)):
+            controller = ValidateGeneratorController(type, args.tickets, args.backend,
+                                                     args.workers, args.seed, args.alpha)
+            try:
+                validationReport = controller.execute()
+            except ValueError as e:
+                parser.error(str(e))
+
+            if position:
+                print()
+            print(validationReport)
+            failed = failed or not validationReport.passed
+
+        sys.exit(1 if failed else 0)
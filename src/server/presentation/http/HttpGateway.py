@@ -0,0 +1,305 @@
+import json
+import asyncio
+import functools
+from http import HTTPStatus
+from ..GenerateTicketController import GenerateTicketController
+from ..GenerateBatchController import GenerateBatchController
+from ..GenerateWheelController import GenerateWheelController
+from ..ResponseEncoder import ResponseEncoder
+
+
+class HttpError(Exception):
+    """
+    Raised while handling a request to answer it with an HTTP error status.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class HttpGateway:
+    """
+    HTTP/1.1 front end for the ticket generator, built on asyncio streams.
+
+    Endpoints:
+        POST /tickets   JSON body as accepted by the socket daemon; responds
+                        with the formatted generation response as text/plain,
+                        or with application/json for {"batch": [...]} requests
+        GET  /health    liveness probe for load balancers
+
+    Connections are kept alive between requests (HTTP/1.1 default, or
+    HTTP/1.0 with "Connection: keep-alive") until the client closes them or
+    stays idle for keepAliveTimeout. Responses larger than chunkThreshold are
+    sent with chunked transfer encoding while they are serialized, and ticket
+    responses are compressed on the fly when the client accepts gzip or
+    deflate. Ticket generation runs in the event loop's default executor so
+    slow requests do not stall other connections; with a
+    ThreadPoolTicketExecutor the tickets of a large request are drawn on
+    several threads at once (on a free-threaded Python). Validation errors are
+    answered with 400 and a JSON {"error": ...} body.
+    """
+
+    def __init__(self, host="localhost", port=8080, generator=None, keepAliveTimeout=15.0,
+                 requestTimeout=10.0, maxHeaderBytes=16 * 1024, maxBodyBytes=64 * 1024,
+                 chunkThreshold=64 * 1024, ticketsPerChunk=1000, ticketExecutor=None):
+        """
+        Initialize the gateway.
+
+        Args:
+            host (str): Address to bind to. Default is "localhost".
+            port (int): TCP port to bind to. Default is 8080.
+            generator (IRandomGenerator, optional): Random generator for ticket pools.
+            keepAliveTimeout (float): Seconds an idle keep-alive connection is kept open.
+            requestTimeout (float): Seconds allowed to receive a request body.
+            maxHeaderBytes (int): Largest accepted request head.
+            maxBodyBytes (int): Largest accepted request body.
+            chunkThreshold (int): Response size from which chunked encoding is used.
+            ticketsPerChunk (int): Tickets serialized per chunk of a streamed response.
+            ticketExecutor (ThreadPoolTicketExecutor, optional): Draws the tickets of
+                                                                 single requests on a thread pool.
+        """
+        self.host = host
+        self.port = port
+        self.generator = generator
+        self.keepAliveTimeout = keepAliveTimeout
+        self.requestTimeout = requestTimeout
+        self.maxHeaderBytes = maxHeaderBytes
+        self.maxBodyBytes = maxBodyBytes
+        self.chunkThreshold = chunkThreshold
+        self.ticketsPerChunk = ticketsPerChunk
+        self.ticketExecutor = ticketExecutor
+
+    def start(self):
+        """
+        Run the gateway until interrupted.
+        """
+        try:
+            asyncio.run(self.serve())
+        finally:
+            if self.ticketExecutor is not None:
+                self.ticketExecutor.close()
+
+    async def serve(self):
+        server = await asyncio.start_server(
+            self.handleConnection, self.host, self.port, limit=self.maxHeaderBytes
+        )
+        addresses = ", ".join(str(sock.getsockname()[:2]) for sock in server.sockets)
+        print(f"HTTP gateway listening on {addresses}")
+        async with server:
+            await server.serve_forever()
+
+    async def handleConnection(self, reader, writer):
+        """
+        Serve successive requests on one connection while it is kept alive.
+        """
+        try:
+            keepAlive = True
+            while keepAlive:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepAliveTimeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.sendError(writer, HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                                           "Request head too large"))
+                    break
+
+                try:
+                    method, target, version, headers = self.parseHead(head)
+                except HttpError as e:
+                    await self.sendError(writer, e)
+                    break
+
+                keepAlive = self.wantsKeepAlive(version, headers)
+                try:
+                    body = await self.readBody(reader, headers)
+                    await self.route(writer, method, target, headers, body, keepAlive)
+                except HttpError as e:
+                    # An unread or oversized body leaves the stream out of sync.
+                    if e.status in (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, HTTPStatus.LENGTH_REQUIRED,
+                                    HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.NOT_IMPLEMENTED):
+                        keepAlive = False
+                    await self.sendError(writer, e, keepAlive)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def parseHead(self, head):
+        """
+        Returns:
+            tuple: (method, target, version, headers with lower-case names)
+
+        Raises:
+            HttpError: If the request line or a header is malformed.
+        """
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        method, target, version = parts
+        if version not in ("HTTP/1.1", "HTTP/1.0"):
+            raise HttpError(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED, f"Unsupported version: {version}")
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, separator, value = line.partition(":")
+            if not separator or not name.strip():
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    def wantsKeepAlive(version, headers):
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    async def readBody(self, reader, headers):
+        if "transfer-encoding" in headers:
+            raise HttpError(HTTPStatus.NOT_IMPLEMENTED, "Chunked request bodies are not supported")
+        if "content-length" not in headers:
+            return b""
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > self.maxBodyBytes:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {self.maxBodyBytes} bytes")
+        try:
+            return await asyncio.wait_for(reader.readexactly(length), self.requestTimeout)
+        except asyncio.TimeoutError:
+            raise HttpError(HTTPStatus.REQUEST_TIMEOUT, "Request body not received in time")
+
+    async def route(self, writer, method, target, headers, body, keepAlive):
+        path = target.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET", {"Allow": "GET"})
+            await self.sendBody(writer, HTTPStatus.OK, b"ok", "text/plain", keepAlive)
+        elif path == "/tickets":
+            if method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST", {"Allow": "POST"})
+            await self.generateTickets(writer, headers, body, keepAlive)
+        else:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"No such resource: {path}")
+
+    async def generateTickets(self, writer, headers, body, keepAlive):
+        try:
+            request = json.loads(body.decode())
+            if GenerateBatchController.isBatch(request):
+                controller = GenerateBatchController.fromRequest(request, self.generator)
+                execute = controller.execute
+                contentType = "application/json"
+            elif GenerateWheelController.isWheel(request):
+                controller = GenerateWheelController.fromRequest(request, self.generator)
+                execute = controller.execute
+                contentType = "text/plain; charset=utf-8"
+            else:
+                controller = GenerateTicketController.fromRequest(request, self.generator)
+                execute = functools.partial(controller.execute, self.ticketExecutor)
+                contentType = "text/plain; charset=utf-8"
+        except (ValueError, UnicodeDecodeError) as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(e))
+
+        loop = asyncio.get_running_loop()
+        try:
+            generationResponse = await loop.run_in_executor(None, execute)
+        except ValueError as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(e))
+
+        encoder = ResponseEncoder(self.negotiateEncoding(headers))
+        extraHeaders = {"Vary": "Accept-Encoding"}
+        if encoder.encoding != "identity":
+            extraHeaders["Content-Encoding"] = "gzip" if encoder.encoding == "gzip" else "deflate"
+        chunks = encoder.encode(generationResponse.iterChunks(self.ticketsPerChunk))
+
+        # Buffer up to chunkThreshold bytes: smaller responses get a
+        # Content-Length, larger ones are streamed with chunked encoding.
+        buffered = []
+        size = 0
+        while size < self.chunkThreshold:
+            data = await loop.run_in_executor(None, next, chunks, None)
+            if data is None:
+                await self.sendBody(writer, HTTPStatus.OK, b"".join(buffered),
+                                    contentType, keepAlive, extraHeaders)
+                return
+            buffered.append(data)
+            size += len(data)
+
+        writer.write(self.formatHead(HTTPStatus.OK, {
+            "Content-Type": contentType,
+            "Transfer-Encoding": "chunked",
+            "Connection": "keep-alive" if keepAlive else "close",
+            **extraHeaders
+        }))
+        for data in buffered:
+            self.writeChunk(writer, data)
+        await writer.drain()
+
+        while True:
+            data = await loop.run_in_executor(None, next, chunks, None)
+            if data is None:
+                break
+            self.writeChunk(writer, data)
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def negotiateEncoding(headers):
+        """
+        Pick the response encoding from the Accept-Encoding header: gzip is
+        preferred over deflate (zlib), codings with q=0 are refused.
+
+        Returns:
+            str: A ResponseEncoder encoding name.
+        """
+        accepted = set()
+        for coding in headers.get("accept-encoding", "").split(","):
+            name, _, parameters = coding.strip().partition(";")
+            quality = parameters.strip().replace(" ", "")
+            if quality.startswith("q=") and quality[2:] in ("0", "0.0", "0.00", "0.000"):
+                continue
+            accepted.add(name.strip().lower())
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        if "deflate" in accepted:
+            return "zlib"
+        return "identity"
+
+    async def sendError(self, writer, error, keepAlive=False):
+        body = json.dumps({"error": str(error)}).encode()
+        await self.sendBody(writer, error.status, body, "application/json", keepAlive, error.headers)
+
+    async def sendBody(self, writer, status, body, contentType, keepAlive, extraHeaders=None):
+        headers = {
+            "Content-Type": contentType,
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keepAlive else "close"
+        }
+        headers.update(extraHeaders or {})
+        writer.write(self.formatHead(status, headers) + body)
+        await writer.drain()
+
+    @staticmethod
+    def writeChunk(writer, data):
+        if data:
+            writer.write(b"%x\r\n" % len(data) + data + b"\r\n")
+
+    @staticmethod
+    def formatHead(status, headers):
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
@@ -0,0 +1,9 @@
+"""
+Exports HTTP presentation classes for the lottery system.
+"""
+
+from .HttpGateway import HttpGateway
+
+__all__ = [
+    "HttpGateway"
+]
@@ -0,0 +1,218 @@
+import json
+import time
+
+
+class ConnectionDeadlines:
+    """
+    Enforces per-connection I/O deadlines for the socket daemon.
+
+    A connection is given:
+        - readHeaderTimeout: time allowed until the first request byte arrives
+        - requestTimeout: time allowed until the complete JSON request is read
+        - writeTimeout: time a single send may stay blocked on a stalled peer
+        - responseTimeout: time allowed to send the whole response
+        - minTransferRate: bytes/second a large response must keep up once
+          more than minRateThreshold bytes were sent and the grace period passed
+        - generationTimeout: time allowed to generate the tickets of a request
+          (None for no limit)
+
+    Every violation raises TimeoutError so the caller can close and count the
+    connection instead of letting it block the daemon.
+    """
+
+    def __init__(self, readHeaderTimeout=5.0, requestTimeout=10.0, writeTimeout=10.0,
+                 minTransferRate=64 * 1024, minRateThreshold=256 * 1024, minRateGrace=1.0,
+                 maxRequestBytes=64 * 1024, sendChunkSize=64 * 1024, generationTimeout=None,
+                 responseTimeout=300.0):
+        """
+        Initialize the deadlines.
+
+        Args:
+            readHeaderTimeout (float): Seconds to wait for the first byte of the request.
+            requestTimeout (float): Seconds to wait for the complete request.
+            writeTimeout (float): Seconds a single send may block.
+            minTransferRate (int): Minimum bytes/second for large responses.
+            minRateThreshold (int): Bytes sent before the transfer rate is checked.
+            minRateGrace (float): Seconds before the transfer rate is checked.
+            maxRequestBytes (int): Largest request accepted from a client.
+            sendChunkSize (int): Largest slice passed to a single send call.
+            generationTimeout (float, optional): Seconds allowed to generate a request's tickets.
+            responseTimeout (float): Seconds allowed to send the whole response.
+
+        Raises:
+            ValueError: If any timeout or size is not positive.
+        """
+        for name, value in (("readHeaderTimeout", readHeaderTimeout),
+                            ("requestTimeout", requestTimeout),
+                            ("writeTimeout", writeTimeout),
+                            ("responseTimeout", responseTimeout),
+                            ("maxRequestBytes", maxRequestBytes),
+                            ("sendChunkSize", sendChunkSize)):
+            if value <= 0:
+                raise ValueError(f"'{name}' must be positive.")
+
+        self.readHeaderTimeout = readHeaderTimeout
+        self.requestTimeout = requestTimeout
+        self.writeTimeout = writeTimeout
+        self.minTransferRate = minTransferRate
+        self.minRateThreshold = minRateThreshold
+        self.minRateGrace = minRateGrace
+        self.maxRequestBytes = maxRequestBytes
+        self.sendChunkSize = sendChunkSize
+        self.generationTimeout = generationTimeout
+        self.responseTimeout = responseTimeout
+
+    def receiveRequest(self, conn) -> bytes:
+        """
+        Read one JSON request from the connection within the read deadlines.
+
+        A request ends with its JSON value, so a client may send it with or
+        without a trailing newline and keep the connection open for the
+        response; values spanning several lines (pretty-printed JSON) are
+        read whole. A newline ends the request early only once the bytes
+        before it can no longer become a JSON value, and the peer shutting
+        down its side ends it at once. Bytes after the request are ignored.
+
+        Args:
+            conn (socket.socket): The accepted client connection.
+
+        Returns:
+            bytes: The raw request bytes, with the newline if one directly
+                   followed the JSON value.
+
+        Raises:
+            TimeoutError: If the header or request deadline expires.
+            ValueError: If the request exceeds maxRequestBytes.
+        """
+        start = time.monotonic()
+        headerDeadline = start + min(self.readHeaderTimeout, self.requestTimeout)
+        requestDeadline = start + self.requestTimeout
+        buffer = bytearray()
+
+        while True:
+            deadline = requestDeadline if buffer else headerDeadline
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(self.__describeReadTimeout(buffer))
+
+            conn.settimeout(remaining)
+            try:
+                chunk = conn.recv(4096)
+            except TimeoutError:
+                raise TimeoutError(self.__describeReadTimeout(buffer))
+
+            if not chunk:
+                return bytes(buffer)
+
+            buffer += chunk
+            end = self.__requestEnd(buffer, newline=b"\n" in chunk)
+            if end is not None and end <= self.maxRequestBytes:
+                return bytes(buffer[:end])
+            if len(buffer) > self.maxRequestBytes:
+                raise ValueError(f"Request exceeds {self.maxRequestBytes} bytes")
+
+    def sendResponse(self, conn, chunks) -> int:
+        """
+        Send a response within the write and response deadlines and the
+        minimum transfer rate. Time spent producing the chunks counts against
+        the response deadline.
+
+        Args:
+            conn (socket.socket): The accepted client connection.
+            chunks (bytes | Iterable[bytes]): The response, whole or as successive chunks.
+
+        Returns:
+            int: The number of bytes sent.
+
+        Raises:
+            TimeoutError: If a send stalls past writeTimeout, the response takes
+                          longer than responseTimeout or the peer reads slower
+                          than minTransferRate.
+        """
+        if isinstance(chunks, (bytes, bytearray, memoryview)):
+            chunks = (chunks,)
+
+        start = time.monotonic()
+        deadline = start + self.responseTimeout
+        sent = 0
+
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Response not sent within {self.responseTimeout}s")
+                conn.settimeout(min(self.writeTimeout, remaining))
+                try:
+                    count = conn.send(view[:self.sendChunkSize])
+                except TimeoutError:
+                    if remaining < self.writeTimeout:
+                        raise TimeoutError(f"Response not sent within {self.responseTimeout}s")
+                    raise TimeoutError(f"Write stalled for more than {self.writeTimeout}s")
+                view = view[count:]
+                sent += count
+                self.__checkTransferRate(start, sent)
+
+        return sent
+
+    def __checkTransferRate(self, start, sent):
+        if not self.minTransferRate or sent < self.minRateThreshold:
+            return
+        elapsed = time.monotonic() - start
+        if elapsed > self.minRateGrace and sent / elapsed < self.minTransferRate:
+            raise TimeoutError(
+                f"Client read {sent} bytes in {elapsed:.2f}s, "
+                f"below the minimum rate of {self.minTransferRate} B/s"
+            )
+
+    def __describeReadTimeout(self, buffer):
+        if buffer:
+            return f"Request not completed within {self.requestTimeout}s"
+        return f"No request received within {self.readHeaderTimeout}s"
+
+    @staticmethod
+    def __requestEnd(buffer, newline):
+        """
+        Returns the length of the request held in the buffer, or None while
+        more bytes may still complete it.
+
+        A complete JSON value ends the request, together with a newline
+        directly after it. Otherwise, once a newline arrived, a buffer that
+        can no longer become valid JSON ends at its last newline; the
+        daemon answers it with an error instead of waiting for a deadline.
+        """
+        try:
+            text = buffer.decode()
+        except UnicodeDecodeError as e:
+            # A multi-byte character split across two recv calls is incomplete.
+            if e.reason == "unexpected end of data" or not newline:
+                return None
+            return buffer.rfind(b"\n") + 1
+
+        start = len(text) - len(text.lstrip())
+        if start == len(text):
+            return None
+        try:
+            _, end = json.JSONDecoder().raw_decode(text, start)
+        except json.JSONDecodeError as e:
+            if not newline or ConnectionDeadlines.__mayContinue(text, e):
+                return None
+            return buffer.rfind(b"\n") + 1
+
+        rest = text[end:].lstrip(" \t\r")
+        if rest.startswith("\n"):
+            end = len(text) - len(rest) + 1
+        return len(text[:end].encode())
+
+    @staticmethod
+    def __mayContinue(text, error):
+        """
+        Returns True if the text may still be the start of a JSON value:
+        the decoder ran out of input inside a string, in the whitespace
+        between tokens, or in a literal or number that reaches the end.
+        """
+        if error.msg.startswith("Unterminated string"):
+            return True
+        rest = text[error.pos:]
+        return not rest.strip() or not any(character.isspace() or character in "{}[],:\""
+                                           for character in rest)
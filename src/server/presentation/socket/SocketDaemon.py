@@ -1,19 +1,54 @@
 import sys
-import socket
 import json
+import select
+import socket
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .Daemon import Daemon
+from .ConnectionDeadlines import ConnectionDeadlines
+from .transports import TcpTransport
 from ..GenerateTicketController import GenerateTicketController
+from ..GenerateBatchController import GenerateBatchController
+from ..GenerateWheelController import GenerateWheelController
+from ..ResponseEncoder import ResponseEncoder
+from ...services.scheduling import GenerationScheduler
+from ...services.tracing import span, currentTrace
 
 
 class SocketDaemon(Daemon):
     """
-    Persistent IPv6 blocking daemon that listens on a socket and
-    handles lottery ticket generation requests from clients.
+    Persistent daemon that listens on a socket and handles lottery
+    ticket generation requests from clients.
+
+    The listening socket is created by a transport: IPv6 TCP on `port` by
+    default, or any ITransport (e.g. a Unix domain socket) passed in.
+
+    Accepted connections are served by a bounded pool of worker threads and
+    every connection is subject to the read/write deadlines of
+    ConnectionDeadlines, so a client that stalls or reads slowly only ever
+    occupies its own worker until its deadline expires.
+
+    Single requests are generated by a GenerationScheduler in fixed-size
+    chunks shared fairly between all active requests, and a request stops
+    generating as soon as its client disconnects or its generation deadline
+    expires.
+
+    With a Tracer, sampled and slow requests are traced through reading,
+    parsing, generation, serialization and sending, and exported as Chrome
+    trace-event files.
+
+    Each served connection produces one structured record (request fields,
+    status, stage durations and byte counts) for the optional AccessLogger,
+    which writes it from a background thread. Connections closed without
+    sending a byte are health probes and are not logged.
     """
 
     def __init__(self, username, groupname, pidFile, port=None,
-             STDIN='/dev/null', STDOUT='/dev/null', STDERR='/dev/null'):
-        if port is None:
+             STDIN='/dev/null', STDOUT='/dev/null', STDERR='/dev/null',
+             deadlines=None, maxWorkers=8, transport=None, generator=None, accessLog=None,
+             scheduler=None, tracer=None):
+        if transport is None and port is None:
             try:
                 while True:
                     port_input = input("Enter port number to bind daemon to (1024–65535): ").strip()
@@ -29,38 +64,93 @@ class SocketDaemon(Daemon):
                 print("\n❌ User cancelled.")
                 sys.exit(1)
 
+        if maxWorkers < 1:
+            raise ValueError("'maxWorkers' must be at least 1")
+
         self.port = port
+        self.transport = transport if transport is not None else TcpTransport(port)
+        self.deadlines = deadlines if deadlines is not None else ConnectionDeadlines()
+        self.maxWorkers = maxWorkers
+        self.generator = generator
+        self.accessLog = accessLog
+        self.scheduler = scheduler if scheduler is not None else GenerationScheduler()
+        self.tracer = tracer
+        self.timedOutConnections = 0
+        self._statsLock = threading.Lock()
         super().__init__(username, groupname, pidFile, STDIN, STDOUT, STDERR)
 
     def run(self):
         """
-        Starts the blocking IPv6 socket server and listens for incoming connections.
+        Starts the socket server on the configured transport and dispatches
+        incoming connections to the worker pool.
         """
-        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.sock = sock
+        executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+        sock = None
+        if self.accessLog is not None:
+            self.accessLog.start()
+        self.scheduler.start()
 
         try:
-            sock.bind(("localhost", self.port))
-            sock.listen(5)
-            print(f"Listening on [127.0.0.1]:{self.port}")
+            sock = self.transport.listen(5)
+            self.sock = sock
+            print(f"Listening on {self.transport.describe()}")
 
             while self._daemonRunning:
                 conn, addr = sock.accept()
-                print(f"Connection accepted from {addr}")
-                with conn:
-                    self.generateTicket(conn)
+                self.transport.configureConnection(conn)
+                executor.submit(self.handleConnection, conn, addr)
 
         except Exception as e:
             print(f"Socket error: {e}")
         finally:
-            sock.close()
+            if sock is not None:
+                sock.close()
+            self.transport.close()
+            executor.shutdown(wait=True)
+            self.scheduler.close()
+            if self.accessLog is not None:
+                self.accessLog.close()
+
+    def handleConnection(self, conn, addr):
+        """
+        Serves a single accepted connection and closes it afterwards.
+
+        Connections that exceed one of their deadlines are closed without a
+        response and counted in `timedOutConnections`.
+        """
+        record = {"time": time.time(), "peer": str(addr or "local")}
+        started = time.perf_counter()
+        trace = token = None
+        if self.tracer is not None:
+            trace, token = self.tracer.begin()
+        with conn:
+            try:
+                self.generateTicket(conn, record)
+            except TimeoutError as e:
+                with self._statsLock:
+                    self.timedOutConnections += 1
+                record["status"] = "timeout"
+                record["error"] = str(e)
+            except OSError as e:
+                record["status"] = "failed"
+                record["error"] = str(e)
+
+        record["totalMs"] = round((time.perf_counter() - started) * 1000, 3)
+        if self.tracer is not None:
+            try:
+                if self.tracer.end(trace, token):
+                    record["traced"] = True
+            except OSError as e:
+                print(f"Trace export failed: {e}")
+        if self.accessLog is not None and not record.get("probe"):
+            self.accessLog.log(record)
 
-    def generateTicket(self, conn):
+    def generateTicket(self, conn, record=None):
         """
         Handles a single client connection.
 
-        Clients must send a JSON request like:
+        Clients must send a JSON request, which ends with its JSON value
+        (a trailing newline is optional), like:
         {
             "type": "max" | "grand" | "lottario",
             "requestId": "<string>",
@@ -68,36 +158,108 @@ class SocketDaemon(Daemon):
         }
 
         The daemon responds with a formatted ticket generation response.
+
+        A request of the form {"batch": [<request>, ...]} is answered with one
+        JSON document holding a result or an error per sub-request, and a
+        request with a "wheel" object with a wheel and its guarantee.
+
+        An optional "accept_encoding" field ("zlib" or "gzip", or a list in
+        order of preference) makes the daemon compress the response, error
+        messages included, while it is being serialized. An optional
+        "trailer" string is appended to an uncompressed response, so the
+        client can tell it from one cut short by a dropped connection.
+
+        A connection closed without sending anything is a health probe and
+        gets no response.
+
+        Args:
+            conn (socket.socket): The accepted client connection.
+            record (dict, optional): Filled with access log fields of the request.
+
+        Raises:
+            TimeoutError: If the client misses one of the connection deadlines.
         """
+        record = record if record is not None else {}
+        encoder = ResponseEncoder()
+        scheduled = None
+        started = readDone = time.perf_counter()
         try:
-            raw = conn.recv(4096)
-            request = json.loads(raw.decode())
-
-            if "type" not in request:
-                raise ValueError("Missing field: 'type'")
-            if "requestId" not in request:
-                raise ValueError("Missing field: 'requestId'")
+            with span("read request"):
+                raw = self.deadlines.receiveRequest(conn)
+            readDone = time.perf_counter()
+            if not raw:
+                # A health probe: the client connected and left without a request.
+                record["probe"] = True
+                return
+            record["bytesIn"] = len(raw)
+            record["readMs"] = round((readDone - started) * 1000, 3)
 
-            typeStr = request["type"]
-            requestId = str(request["requestId"]).strip()
-            if not requestId:
-                raise ValueError("'requestId' must not be empty")
+            with span("parse request", bytes=len(raw)):
+                request = json.loads(raw.decode())
+                encoder = ResponseEncoder.fromRequest(request)
+                record["encoding"] = encoder.encoding
+                controller = self.__controllerFor(request, record)
 
-            count = request.get("count", 1)
-            try:
-                count = int(count)
-            except (ValueError, TypeError):
-                raise ValueError("'count' must be an integer")
+            trace = currentTrace()
+            if trace is not None:
+                trace.requestId = record.get("requestId", "batch" if "batch" in record else None)
 
-            if count < 1:
-                raise ValueError("'count' must be at least 1")
-            
-            generateTicketController = GenerateTicketController(requestId, typeStr, count)
-            generationResponse = generateTicketController.execute()
+            with span("dispatch"):
+                if isinstance(controller, GenerateTicketController):
+                    generationResponse = controller.schedule(self.scheduler, self.deadlines.generationTimeout)
+                    scheduled = generationResponse
+                    # Only a client that followed its request with a newline
+                    # is watched: one that shut down its side after sending
+                    # cannot be told apart from one that went away.
+                    isAbandoned = (lambda: self.peerClosed(conn)) if raw.endswith(b"\n") else None
+                    chunks = generationResponse.iterChunks(isAbandoned=isAbandoned)
+                else:
+                    generationResponse = controller.execute()
+                    chunks = generationResponse.iterChunks()
 
-            response = str(generationResponse).encode()
-            conn.sendall(response)
+            response = encoder.encode(chunks)
+            record["status"] = "ok"
 
+        except TimeoutError:
+            raise
         except Exception as e:
             errorMsg = f"[Error] {str(e)}"
-            conn.sendall(errorMsg.encode())
+            response = encoder.encode([errorMsg])
+            record["status"] = "error"
+            record["error"] = str(e)
+
+        # Tickets are generated by the scheduler (or drawn lazily) while the
+        # response is streamed, so the write stage includes generation.
+        writeStarted = time.perf_counter()
+        record["processMs"] = round((writeStarted - readDone) * 1000, 3)
+        try:
+            with span("send response"):
+                record["bytesOut"] = self.deadlines.sendResponse(conn, response)
+        finally:
+            # Stops generating for a client that timed out or went away.
+            if scheduled is not None:
+                scheduled.cancel()
+        record["writeMs"] = round((time.perf_counter() - writeStarted) * 1000, 3)
+
+    def __controllerFor(self, request, record):
+        if GenerateBatchController.isBatch(request):
+            controller = GenerateBatchController.fromRequest(request, self.generator)
+            record["batch"] = len(controller.items)
+        elif GenerateWheelController.isWheel(request):
+            controller = GenerateWheelController.fromRequest(request, self.generator)
+            record.update(requestId=controller.id, type=controller.type, wheel=len(controller.numbers))
+        else:
+            controller = GenerateTicketController.fromRequest(request, self.generator)
+            record.update(requestId=controller.id, type=controller.type, count=controller.amount)
+        return controller
+
+    @staticmethod
+    def peerClosed(conn):
+        """
+        Returns True once the client has closed its end of the connection.
+        """
+        try:
+            readable, _, _ = select.select([conn], [], [], 0)
+            return bool(readable) and conn.recv(1, socket.MSG_PEEK) == b""
+        except (OSError, ValueError):
+            return True
@@ -4,8 +4,10 @@ Exports socket presentation classes for the lottery system.
 
 from .Daemon import Daemon
 from .SocketDaemon import SocketDaemon 
+from .ConnectionDeadlines import ConnectionDeadlines
 
 __all__ = [
     "Daemon",
-    "SocketDaemon"
+    "SocketDaemon",
+    "ConnectionDeadlines"
 ]
\ No newline at end of file
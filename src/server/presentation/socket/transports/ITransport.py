@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+
+
+class ITransport(ABC):
+    """
+    Abstract base class for a listening transport of the socket daemon.
+
+    A transport owns the address family, the address and the socket options
+    of the listening socket, so the daemon can serve TCP and Unix domain
+    socket clients with the same request handling code.
+    """
+
+    @abstractmethod
+    def listen(self, backlog: int):
+        """
+        Create, bind and start listening on the server socket.
+
+        Args:
+            backlog (int): Maximum number of pending connections.
+
+        Returns:
+            socket.socket: The listening socket.
+        """
+        pass
+
+    def configureConnection(self, conn) -> None:
+        """
+        Apply per-connection socket options to an accepted connection.
+
+        Args:
+            conn (socket.socket): The accepted client connection.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release any resources left behind by the listening socket.
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> str:
+        """
+        Returns:
+            str: A human-readable description of the listening address.
+        """
+        pass
@@ -0,0 +1,68 @@
+import socket
+from .ITransport import ITransport
+
+
+class TcpTransport(ITransport):
+    """
+    IPv6 TCP listening transport with tunable socket options.
+
+    Options:
+        - noDelay: disable Nagle's algorithm (TCP_NODELAY) on accepted connections
+        - sendBufferSize / receiveBufferSize: SO_SNDBUF / SO_RCVBUF in bytes
+        - fastOpen: TCP_FASTOPEN queue length, enabling data in the SYN
+    """
+
+    def __init__(self, port: int, host: str = "localhost", noDelay: bool = False,
+                 sendBufferSize: int = None, receiveBufferSize: int = None, fastOpen: int = None):
+        """
+        Initialize the TCP transport.
+
+        Args:
+            port (int): Port to bind to.
+            host (str): Host name or address to bind to. Default is "localhost".
+            noDelay (bool): Set TCP_NODELAY on accepted connections.
+            sendBufferSize (int, optional): SO_SNDBUF size in bytes.
+            receiveBufferSize (int, optional): SO_RCVBUF size in bytes.
+            fastOpen (int, optional): TCP_FASTOPEN pending-request queue length.
+
+        Raises:
+            ValueError: If the port is outside 1024–65535.
+        """
+        if port < 1024 or port > 65535:
+            raise ValueError("Port must be between 1024 and 65535.")
+
+        self.port = port
+        self.host = host
+        self.noDelay = noDelay
+        self.sendBufferSize = sendBufferSize
+        self.receiveBufferSize = receiveBufferSize
+        self.fastOpen = fastOpen
+
+    def listen(self, backlog: int):
+        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Buffer sizes must be set before listen() to be inherited by
+            # accepted connections and to affect the negotiated window scale.
+            if self.sendBufferSize:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sendBufferSize)
+            if self.receiveBufferSize:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receiveBufferSize)
+            if self.fastOpen:
+                if not hasattr(socket, "TCP_FASTOPEN"):
+                    raise RuntimeError("TCP_FASTOPEN is not supported on this platform.")
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_FASTOPEN, self.fastOpen)
+
+            sock.bind((self.host, self.port))
+            sock.listen(backlog)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def configureConnection(self, conn) -> None:
+        if self.noDelay:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def describe(self) -> str:
+        return f"[{self.host}]:{self.port}"
@@ -0,0 +1,62 @@
+import os
+import stat
+import socket
+from .ITransport import ITransport
+
+
+class UnixTransport(ITransport):
+    """
+    Unix domain socket listening transport.
+
+    Clients on the same host skip the TCP/IP stack entirely and need no port.
+    Access is controlled by the permission bits of the socket file: only
+    users allowed to write to the file can connect.
+    """
+
+    def __init__(self, path: str, mode: int = 0o660):
+        """
+        Initialize the Unix domain socket transport.
+
+        Args:
+            path (str): Filesystem path of the socket. Resolved to an absolute
+                        path because the daemon changes directory to "/".
+            mode (int): Permission bits applied to the socket file. Default is 0o660.
+        """
+        if not path:
+            raise ValueError("Unix socket path must not be empty.")
+        self.path = os.path.abspath(path)
+        self.mode = mode
+
+    def listen(self, backlog: int):
+        self.__removeStaleSocket()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the file with the final permissions so there is no window
+        # in which it is reachable with the looser default mode.
+        previousUmask = os.umask(0o777 & ~self.mode)
+        try:
+            sock.bind(self.path)
+        except Exception:
+            sock.close()
+            raise
+        finally:
+            os.umask(previousUmask)
+
+        os.chmod(self.path, self.mode)
+        sock.listen(backlog)
+        return sock
+
+    def close(self) -> None:
+        self.__removeStaleSocket()
+
+    def describe(self) -> str:
+        return f"unix:{self.path}"
+
+    def __removeStaleSocket(self):
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.remove(self.path)
+            else:
+                raise RuntimeError(f"Refusing to replace non-socket file: {self.path}")
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,13 @@
+"""
+Exports listening transports for the socket daemon.
+"""
+
+from .ITransport import ITransport
+from .TcpTransport import TcpTransport
+from .UnixTransport import UnixTransport
+
+__all__ = [
+    "ITransport",
+    "TcpTransport",
+    "UnixTransport"
+]
@@ -0,0 +1,106 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .transients.LotteryType import LotteryType
+from .transients.SimulationResult import SimulationResult
+from .converters import LotteryTypeConverter
+from .WinningCheckService import WinningCheckService
+from .scoring import PRIZE_TIERS
+from .simulation import simulateChunk, matchProbability, tierProbability, wilsonInterval
+
+
+class SimulationService:
+    """
+    Service class estimating prize-tier frequencies by Monte Carlo simulation.
+
+    Each simulated draw is scored against a whole set of random tickets at
+    once (see simulateChunk), and chunks of draws run on a process pool. The
+    estimates come with 95% Wilson intervals next to the exact odds from the
+    hypergeometric distribution.
+
+    All tickets of a chunk face the same draw, so their outcomes are
+    correlated. The intervals therefore use an effective sample size: the
+    number of ticket-draws divided by the design effect, which is the
+    observed variance of hits per draw over the binomial variance.
+    """
+
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers (int, optional): Worker processes; defaults to the CPU count.
+        """
+        self.workers = workers or os.cpu_count() or 1
+
+    def simulate(self, type: LotteryType, draws: int, ticketsPerDraw: int, seed=0) -> SimulationResult:
+        """
+        Simulate `draws` draws, each scored against `ticketsPerDraw` tickets.
+
+        Args:
+            type (LotteryType): The lottery game.
+            draws (int): Number of simulated draws.
+            ticketsPerDraw (int): Tickets scored per draw.
+            seed: Seed of the run; equal seeds and sizes give equal results.
+
+        Returns:
+            SimulationResult: Estimated and exact odds per prize tier and per pool match count.
+
+        Raises:
+            ValueError: If draws or ticketsPerDraw is below 1.
+        """
+        if draws < 1 or ticketsPerDraw < 1:
+            raise ValueError("'draws' and 'ticketsPerDraw' must be at least 1.")
+
+        chunkCount = min(draws, self.workers * 4)
+        sizes = [draws // chunkCount + (chunk < draws % chunkCount) for chunk in range(chunkCount)]
+
+        started = time.perf_counter()
+        if self.workers == 1:
+            parts = [simulateChunk(type, size, ticketsPerDraw, seed, chunk) for chunk, size in enumerate(sizes)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(simulateChunk, type, size, ticketsPerDraw, seed, chunk)
+                           for chunk, size in enumerate(sizes)]
+                parts = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        pools = WinningCheckService().poolsFor(type)
+        tiers = []
+        for position, (name, requirement) in enumerate(PRIZE_TIERS[type]):
+            hits = sum(part["tierHits"][position] for part in parts)
+            squares = sum(part["tierSquares"][position] for part in parts)
+            tiers.append(self.__estimate(name, hits, squares, draws, ticketsPerDraw,
+                                         tierProbability(pools, requirement)))
+
+        matches = []
+        for position, pool in enumerate(pools):
+            rows = []
+            for count in range(pool.pickCount, -1, -1):
+                hits = sum(part["matchHits"][position][count] for part in parts)
+                squares = sum(part["matchSquares"][position][count] for part in parts)
+                rows.append(self.__estimate(str(count), hits, squares, draws, ticketsPerDraw,
+                                            matchProbability(pool, count)))
+            matches.append((pool.name, rows))
+
+        typeName = LotteryTypeConverter().toString(type)
+        return SimulationResult(typeName, draws, ticketsPerDraw, self.workers, elapsed, tiers, matches)
+
+    @staticmethod
+    def __estimate(name, hits, squares, draws, ticketsPerDraw, exact):
+        trials = draws * ticketsPerDraw
+        estimate = hits / trials
+        designEffect = 1.0
+        if draws > 1 and 0 < estimate < 1:
+            mean = hits / draws
+            variance = max(squares - draws * mean * mean, 0.0) / (draws - 1)
+            designEffect = max(1.0, variance / (ticketsPerDraw * estimate * (1 - estimate)))
+        effective = trials / designEffect
+        low, high = wilsonInterval(estimate * effective, effective)
+        return {
+            "name": name,
+            "hits": hits,
+            "estimate": estimate,
+            "low": low,
+            "high": high,
+            "exact": exact,
+            "designEffect": designEffect
+        }
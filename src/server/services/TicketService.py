@@ -1,6 +1,9 @@
+from typing import Iterator, List
 from .transients.LotteryType import LotteryType
 from ..models import *
 from ..models.factories import *
+from ..models.randomness import CounterGenerator
+from .tracing import span
 
 class TicketService:
     """
@@ -10,11 +13,16 @@ class TicketService:
     factory based on the selected LotteryType.
     """
 
-    def __init__(self):
+    def __init__(self, generator=None):
         """
         Initialize the TicketService.
+
+        Args:
+            generator (IRandomGenerator, optional): Source of randomness for generated
+                                                    tickets. Defaults to the module-level
+                                                    Mersenne Twister.
         """
-        pass
+        self.generator = generator
 
     def generateTicket(self, type: LotteryType) -> Ticket:
         """
@@ -31,15 +39,70 @@ class TicketService:
         Raises:
             ValueError: If the given LotteryType is not supported.
         """
-        factory = None
+        return self.__factoryFor(type).createTicket()
+
+    def generateTickets(self, type: LotteryType, count: int, seed=None, offset: int = 0) -> List[Ticket]:
+        """
+        Generate several lottery tickets of the same type.
+
+        The factory is resolved once for the whole batch instead of once per ticket.
+
+        Args:
+            type (LotteryType): Enum value specifying the type of lottery game.
+            count (int): Number of tickets to generate.
+            seed (optional): Makes ticket i a pure function of (seed, i); see CounterGenerator.
+            offset (int): Index of the first seeded ticket, to page through a seeded batch.
+
+        Returns:
+            List[Ticket]: The generated tickets.
+
+        Raises:
+            ValueError: If the given LotteryType is not supported.
+        """
+        with span("TicketService.generateTickets", count=count, seeded=seed is not None):
+            if seed is not None:
+                return list(self.iterTickets(type, count, seed, offset))
+            factory = self.__factoryFor(type)
+            return [factory.createTicket() for _ in range(count)]
 
+    def iterTickets(self, type: LotteryType, count: int, seed=None, offset: int = 0) -> Iterator[Ticket]:
+        """
+        Lazily generate tickets of the same type, one at a time.
+
+        Unlike generateTickets, no list of the whole batch is kept, so very large
+        batches can be streamed straight to an export file.
+
+        Args:
+            type (LotteryType): Enum value specifying the type of lottery game.
+            count (int): Number of tickets to generate.
+            seed (optional): Makes ticket i a pure function of (seed, i); see CounterGenerator.
+            offset (int): Index of the first seeded ticket, to page through a seeded batch.
+
+        Yields:
+            Ticket: The generated tickets, in order.
+
+        Raises:
+            ValueError: If the given LotteryType is not supported.
+        """
+        factory = self.__factoryFor(type)
+        if seed is None:
+            for _ in range(count):
+                yield factory.createTicket()
+            return
+
+        # Each ticket gets its own generator, positioned at its index, so
+        # its numbers do not depend on when they are drawn.
+        seeded = CounterGenerator(seed)
+        for index in range(offset, offset + count):
+            factory.generator = seeded.at(index)
+            yield factory.createTicket()
+
+    def __factoryFor(self, type: LotteryType) -> ITicketFactory:
         if type == LotteryType.LOTTO_MAX:
-            factory = LottoMaxTicketFactory()
+            return LottoMaxTicketFactory(self.generator)
         elif type == LotteryType.DAILY_GRAND:
-            factory = DailyGrandTicketFactory()
+            return DailyGrandTicketFactory(self.generator)
         elif type == LotteryType.LOTTARIO:
-            factory = LottarioTicketFactory()
+            return LottarioTicketFactory(self.generator)
         else:
             raise ValueError(f"Unknown lottery type: {type}")
-
-        return factory.createTicket()
@@ -0,0 +1,166 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .transients.LotteryType import LotteryType
+from .transients.ValidationReport import ValidationReport
+from .converters import LotteryTypeConverter
+from .WinningCheckService import WinningCheckService
+from .simulation import positionProbability
+from .validation import (countChunk, BACKENDS, chiSquareSurvival, kolmogorovSurvival,
+                         pearson, kolmogorovDistance)
+
+
+class ValidationService:
+    """
+    Service class checking that a generation backend draws uniformly.
+
+    Tickets are generated in chunks on a process pool and counted on whole
+    bitsets (see countIndex), then tested per pool against the exact
+    distributions of a uniform draw of k numbers out of N:
+        - number frequency: chi-square; the counts of one ticket are
+          negatively correlated, so the statistic is scaled by
+          (N - 1) / (N - k) to follow chi-square(N - 1)
+        - sorted position j: chi-square and Kolmogorov-Smirnov against the
+          exact order-statistic distribution
+        - pair co-occurrence: chi-square of the pair counts beyond what
+          the number frequencies explain
+
+    A game passes when every test does at a Bonferroni-corrected level, so
+    the chance of failing a uniform backend stays at alpha per game.
+    """
+
+    def __init__(self, workers=None, chunkSize=65536):
+        """
+        Args:
+            workers (int, optional): Worker processes; defaults to the CPU count.
+            chunkSize (int): Tickets generated and counted per task.
+        """
+        if chunkSize < 1:
+            raise ValueError("'chunkSize' must be at least 1.")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+
+    def validate(self, type: LotteryType, tickets: int, backend="mt", seed=0, alpha=0.01) -> ValidationReport:
+        """
+        Generate `tickets` tickets with a backend and test their uniformity.
+
+        Args:
+            type (LotteryType): The lottery game.
+            tickets (int): Number of tickets to generate.
+            backend (str): A name of GENERATORS, or "counter" for seeded batches.
+            seed: Seed of the "counter" backend.
+            alpha (float): Probability of failing a uniform backend.
+
+        Returns:
+            ValidationReport: The test results per pool and the overall verdict.
+
+        Raises:
+            ValueError: If tickets is below 1 or the backend or alpha is invalid.
+        """
+        if tickets < 1:
+            raise ValueError("'tickets' must be at least 1.")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: '{backend}'")
+        if not 0 < alpha < 1:
+            raise ValueError("'alpha' must be between 0 and 1.")
+
+        sizes = [min(self.chunkSize, tickets - start) for start in range(0, tickets, self.chunkSize)]
+
+        started = time.perf_counter()
+        if self.workers == 1:
+            parts = [countChunk(type, backend, size, seed, chunk) for chunk, size in enumerate(sizes)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(countChunk, type, backend, size, seed, chunk)
+                           for chunk, size in enumerate(sizes)]
+                parts = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        pools = WinningCheckService().poolsFor(type)
+        results = []
+        for position, pool in enumerate(pools):
+            counts = [part["pools"][position] for part in parts]
+            results.append((pool.name, self.__testPool(pool, tickets, counts)))
+
+        testCount = sum(len(tests) for _, tests in results)
+        threshold = alpha / max(testCount, 1)
+        for _, tests in results:
+            for test in tests:
+                test["passed"] = test["pValue"] >= threshold
+
+        typeName = LotteryTypeConverter().toString(type)
+        return ValidationReport(typeName, backend, tickets, self.workers, elapsed, alpha, threshold, results)
+
+    def __testPool(self, pool, tickets, counts):
+        size = pool.endNumber - pool.startNumber + 1
+        picks = pool.pickCount
+        tests = []
+        if picks == size:
+            return tests
+
+        frequency = [sum(values) for values in zip(*(count["frequency"] for count in counts))]
+        expected = tickets * picks / size
+        statistic = sum((observed - expected) ** 2 for observed in frequency) / expected
+        statistic *= (size - 1) / (size - picks)
+        tests.append(self.__result("Number frequency", "chi2", statistic, size - 1,
+                                   chiSquareSurvival(statistic, size - 1)))
+        if picks == 1:
+            # The only position is the number itself; there are no pairs.
+            return tests
+
+        numbers = range(pool.startNumber, pool.endNumber + 1)
+        for position in range(picks):
+            observed = [sum(values) for values in zip(*(count["positions"][position] for count in counts))]
+            probabilities = [positionProbability(pool, position, number) for number in numbers]
+            statistic, dof = pearson(observed, [tickets * p for p in probabilities])
+            tests.append(self.__result(f"Position {position + 1}", "chi2", statistic, dof,
+                                       chiSquareSurvival(statistic, dof)))
+            distance = kolmogorovDistance(observed, probabilities)
+            tests.append(self.__result(f"Position {position + 1}", "KS D", distance, None,
+                                       kolmogorovSurvival(distance, tickets)))
+
+        pairs = [sum(values) for values in zip(*(count["pairs"] for count in counts))]
+        statistic, dof = self.__pairStatistic(pairs, tickets, size, picks)
+        tests.append(self.__result("Pair co-occurrence", "chi2", statistic, dof,
+                                   chiSquareSurvival(statistic, dof)))
+        return tests
+
+    @staticmethod
+    def __pairStatistic(pairs, tickets, size, picks):
+        """
+        Pair counts are correlated through the numbers they share, and the
+        part of their deviations of the form x(a) + x(b) merely repeats the
+        number frequencies. That part, fitted by least squares from the row
+        sums r(a) as x(a) = r(a) / (N - 2), is removed; what remains is the
+        pure pair effect, which follows a chi-square with N(N - 3)/2 degrees
+        of freedom once scaled by its exact per-dimension variance.
+
+        Returns:
+            tuple: (statistic, dof)
+        """
+        n, k = size, picks
+        both = k * (k - 1) / (n * (n - 1))
+        sharing = k * (k - 1) * (k - 2) / (n * (n - 1) * (n - 2))
+        disjoint = k * (k - 1) * (k - 2) * (k - 3) / (n * (n - 1) * (n - 2) * (n - 3))
+        # Eigenvalue of the pair covariance (per ticket, relative to the
+        # mean) on the pure pair dimensions.
+        variance = (both * (1 - both) - 2 * (sharing - both * both) + (disjoint - both * both)) / both
+
+        expected = tickets * both
+        rows = [0.0] * n
+        squares = 0.0
+        position = 0
+        for a in range(n):
+            for b in range(a + 1, n):
+                deviation = pairs[position] - expected
+                rows[a] += deviation
+                rows[b] += deviation
+                squares += deviation * deviation
+                position += 1
+        pure = squares - sum(row * row for row in rows) / (n - 2)
+        return pure / (expected * variance), n * (n - 3) // 2
+
+    @staticmethod
+    def __result(name, statisticName, statistic, dof, pValue):
+        return {"name": name, "statisticName": statisticName, "statistic": statistic,
+                "dof": dof, "pValue": pValue, "passed": True}
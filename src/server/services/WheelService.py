@@ -0,0 +1,87 @@
+import random
+import time
+from typing import List
+from ..models import Ticket
+from .TicketService import TicketService
+from .transients.LotteryType import LotteryType
+from .wheeling import CoveringSearch
+
+
+class WheelService:
+    """
+    Service class for building lottery wheels.
+
+    A wheel is a small set of tickets over numbers chosen by the player with
+    a guarantee: if `ifDrawn` of the drawn numbers are among the chosen
+    numbers, at least one ticket matches `match` of them. Wheels apply to
+    the first pool of a game; the other pools of each ticket are drawn as usual.
+    """
+
+    def __init__(self, generator=None):
+        """
+        Args:
+            generator (IRandomGenerator, optional): Source of randomness for the
+                                                    pools that are not wheeled.
+        """
+        self.generator = generator
+
+    def generateWheel(self, type: LotteryType, numbers: List[int], match: int, ifDrawn: int = None,
+                      timeBudget: float = 2.0, seed=0, timeLimit: float = None):
+        """
+        Build the smallest wheel found within the time budget.
+
+        Args:
+            type (LotteryType): The lottery game.
+            numbers (List[int]): The wheeled numbers of the game's first pool.
+            match (int): Numbers guaranteed to match on one ticket.
+            ifDrawn (int, optional): Drawn numbers among the wheeled ones the
+                                     guarantee assumes; defaults to match.
+            timeBudget (float): Seconds spent improving on the first wheel found.
+            seed: Seed of the search, so equal requests return equal wheels.
+            timeLimit (float, optional): Seconds allowed to build the search and
+                                         find a first wheel (None for no limit).
+
+        Returns:
+            tuple: (List[Ticket], dict describing the guarantee achieved)
+
+        Raises:
+            ValueError: If the numbers or the guarantee do not fit the game, or
+                        no wheel is found within the time limit.
+        """
+        template = TicketService(self.generator).generateTicket(type)
+        pool = template.pools[0]
+        numbers = sorted(set(numbers))
+        if any(not pool.startNumber <= number <= pool.endNumber for number in numbers):
+            raise ValueError(f"Wheeled numbers must be between {pool.startNumber} and {pool.endNumber}.")
+        if len(numbers) < pool.pickCount:
+            raise ValueError(f"A {pool.name} wheel needs at least {pool.pickCount} numbers.")
+        ifDrawn = match if ifDrawn is None else ifDrawn
+        if ifDrawn > pool.pickCount:
+            raise ValueError(f"Only {pool.pickCount} numbers are drawn in {pool.name}.")
+
+        deadline = time.monotonic() + timeLimit if timeLimit is not None else None
+        try:
+            search = CoveringSearch(len(numbers), pool.pickCount, match, ifDrawn,
+                                    rng=random.Random(str(seed)), deadline=deadline)
+            blocks, covered = search.run(timeBudget)
+        except TimeoutError as e:
+            raise ValueError(f"No wheel found within {timeLimit}s; wheel fewer numbers "
+                             f"or ask for a smaller guarantee.") from e
+
+        service = TicketService(self.generator)
+        tickets = []
+        for block in blocks:
+            pools = service.generateTicket(type).pools
+            others = [pools[position].selectRandomly() for position in range(1, len(pools))]
+            tickets.append(Ticket.fromNumbers(pools, [[numbers[element] for element in block]] + others))
+
+        guarantee = {
+            "numbers": numbers,
+            "match": match,
+            "if": ifDrawn,
+            "tickets": len(tickets),
+            "combinations": len(search.targets),
+            "covered": covered,
+            "guaranteed": covered == len(search.targets)
+        }
+        return tickets, guarantee
@@ -0,0 +1,181 @@
+from typing import Iterable, List
+from .transients.LotteryType import LotteryType
+from .transients.CheckResult import CheckResult
+from .converters import LotteryTypeConverter
+from .scoring import TicketIndex, PRIZE_TIERS
+from .TicketService import TicketService
+from ..models import Pool
+
+class WinningCheckService:
+    """
+    Service class for scoring issued tickets against a draw.
+
+    Tickets are collected into a TicketIndex (one bitset of tickets per pool
+    number) from an in-memory batch, a text journal of generation responses
+    or a binary index file. Scoring adds the bitsets of the winning numbers
+    with a bit-sliced counter: plane i holds bit i of every ticket's match
+    count, so all tickets are counted with a handful of big-integer
+    operations per winning number and the tier tallies are popcounts.
+    """
+
+    def __init__(self):
+        """
+        Initialize the WinningCheckService.
+        """
+        pass
+
+    def poolsFor(self, type: LotteryType) -> List[Pool]:
+        """
+        Return the pool configurations of a game, as defined by its ticket factory.
+
+        Args:
+            type (LotteryType): The lottery game.
+
+        Returns:
+            List[Pool]: The game's pools in ticket order.
+        """
+        return TicketService().generateTicket(type).pools
+
+    def indexTickets(self, type: LotteryType, tickets: Iterable) -> TicketIndex:
+        """
+        Build an index from an in-memory batch.
+
+        Args:
+            type (LotteryType): The lottery game of the tickets.
+            tickets (Iterable[Ticket | List[List[int]]]): Ticket objects, or the
+                numbers of each ticket per pool.
+
+        Returns:
+            TicketIndex: The index of the batch.
+        """
+        index = TicketIndex(self.poolsFor(type))
+        for ticket in tickets:
+            index.add(ticket.numbers if hasattr(ticket, "numbers") else ticket)
+        return index
+
+    def indexJournal(self, type: LotteryType, lines: Iterable[str]) -> TicketIndex:
+        """
+        Build an index from the text of generation responses, e.g. saved
+        ticket_<requestId>.txt files or client response archives. Responses
+        of other lottery types in the same journal are skipped.
+
+        Args:
+            type (LotteryType): The lottery game to collect.
+            lines (Iterable[str]): Lines of one or more generation responses.
+
+        Returns:
+            TicketIndex: The index of the journal's tickets.
+
+        Raises:
+            ValueError: If a ticket line cannot be parsed.
+        """
+        pools = self.poolsFor(type)
+        index = TicketIndex(pools)
+        typeName = LotteryTypeConverter().toString(type)
+        poolPositions = {pool.name: position for position, pool in enumerate(pools)}
+        lastPool = len(pools) - 1
+
+        currentType = None
+        pending = [None] * len(pools)
+        for lineNumber, line in enumerate(lines, 1):
+            name, separator, value = line.partition(":")
+            if not separator:
+                continue
+            name = name.strip()
+            if name == "Ticket Type":
+                currentType = value.strip()
+                continue
+            if currentType != typeName or name not in poolPositions:
+                continue
+
+            position = poolPositions[name]
+            try:
+                pending[position] = [int(number) for number in value.split()]
+            except ValueError:
+                raise ValueError(f"Malformed ticket line {lineNumber}: {line.strip()}")
+            if position == lastPool:
+                if None in pending:
+                    raise ValueError(f"Incomplete ticket ending on line {lineNumber}")
+                index.add(pending)
+                pending = [None] * len(pools)
+        return index
+
+    def check(self, type: LotteryType, index: TicketIndex, winningNumbers: List[List[int]]) -> CheckResult:
+        """
+        Score every ticket of an index against the winning numbers.
+
+        Args:
+            type (LotteryType): The lottery game of the tickets.
+            index (TicketIndex): The issued tickets.
+            winningNumbers (List[List[int]]): The winning numbers per pool.
+
+        Returns:
+            CheckResult: Per-pool match histograms and prize-tier tallies.
+
+        Raises:
+            ValueError: If the winning numbers or the index do not fit the game.
+        """
+        pools = self.poolsFor(type)
+        self.__validate(pools, index, winningNumbers)
+
+        full = (1 << index.count) - 1
+        exact = []
+        histograms = []
+        for position, (pool, winning) in enumerate(zip(pools, winningNumbers)):
+            planes = self.__countMatches(index, position, pool, winning)
+            masks = [self.__exactly(planes, matches, full) for matches in range(pool.pickCount + 1)]
+            exact.append(masks)
+            histograms.append((pool.name, {matches: mask.bit_count() for matches, mask in enumerate(masks)}))
+
+        tierCounts = []
+        for tierName, requirement in PRIZE_TIERS[type]:
+            mask = full
+            for masks, matches in zip(exact, requirement):
+                mask &= masks[matches]
+            tierCounts.append((tierName, mask.bit_count()))
+
+        typeName = LotteryTypeConverter().toString(type)
+        return CheckResult(typeName, index.count, [sorted(w) for w in winningNumbers], histograms, tierCounts)
+
+    @staticmethod
+    def __countMatches(index, position, pool, winning):
+        """
+        Add the bitsets of the winning numbers with ripple-carry addition on
+        bit planes. Returns the planes, least significant first.
+        """
+        planes = [0] * pool.pickCount.bit_length()
+        for number in winning:
+            carry = index.bitset(position, number)
+            for plane in range(len(planes)):
+                if not carry:
+                    break
+                planes[plane], carry = planes[plane] ^ carry, planes[plane] & carry
+        return planes
+
+    @staticmethod
+    def __exactly(planes, matches, full):
+        """
+        Returns the bitset of tickets whose match count equals `matches`.
+        """
+        mask = full
+        for bit, plane in enumerate(planes):
+            mask &= plane if (matches >> bit) & 1 else full ^ plane
+        return mask
+
+    @staticmethod
+    def __validate(pools, index, winningNumbers):
+        if len(winningNumbers) != len(pools):
+            raise ValueError(f"Expected winning numbers for {len(pools)} pool(s), got {len(winningNumbers)}.")
+
+        for pool, winning in zip(pools, winningNumbers):
+            if len(winning) != pool.pickCount or len(set(winning)) != len(winning):
+                raise ValueError(f"{pool.name} needs {pool.pickCount} unique winning number(s).")
+            for number in winning:
+                if not pool.startNumber <= number <= pool.endNumber:
+                    raise ValueError(f"Winning number {number} is outside {pool.name} range "
+                                     f"{pool.startNumber}-{pool.endNumber}.")
+
+        indexPools = [(p.name, p.startNumber, p.endNumber, p.pickCount) for p in index.pools]
+        gamePools = [(p.name, p.startNumber, p.endNumber, p.pickCount) for p in pools]
+        if indexPools != gamePools:
+            raise ValueError("The ticket index was built for a different lottery type.")
@@ -3,7 +3,15 @@ Exports application services for the lottery system.
 """
 
 from .TicketService import TicketService
+from .WinningCheckService import WinningCheckService
+from .WheelService import WheelService
+from .SimulationService import SimulationService
+from .ValidationService import ValidationService
 
 __all__ = [
-    "TicketService"
+    "TicketService",
+    "WinningCheckService",
+    "WheelService",
+    "SimulationService",
+    "ValidationService"
 ]
\ No newline at end of file
@@ -0,0 +1,92 @@
+import ast
+import mmap
+from typing import Iterator, List
+from .ColumnarTicketWriter import MAGIC
+
+
+class ColumnarTicketReader:
+    """
+    Memory-maps a .npy ticket export for zero-copy random access.
+
+    Only the pages holding the requested rows are read from disk, so ticket
+    i of a 50M-ticket export is available immediately.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: A .npy file written by ColumnarTicketWriter (or any 2-D
+                  uint8/uint16 C-order .npy file).
+
+        Raises:
+            ValueError: If the file is not a supported .npy file.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC) - 2) != MAGIC[:-2]:
+                raise ValueError(f"Not a .npy file: {path}")
+            major = f.read(2)[0]
+            lengthBytes = 2 if major == 1 else 4
+            headerLength = int.from_bytes(f.read(lengthBytes), "little")
+            header = ast.literal_eval(f.read(headerLength).decode("latin-1"))
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if header["fortran_order"] or len(header["shape"]) != 2:
+            raise ValueError("Only 2-D C-order ticket exports are supported.")
+        formats = {"|u1": "B", "<u2": "H"}
+        if header["descr"] not in formats:
+            raise ValueError(f"Unsupported dtype: {header['descr']}")
+
+        self.rows, self.columns = header["shape"]
+        offset = len(MAGIC) - 2 + 2 + lengthBytes + headerLength
+        data = memoryview(self._map)[offset:]
+        self._data = data.cast(formats[header["descr"]])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def row(self, index: int) -> memoryview:
+        """
+        Return ticket `index` as a view into the mapped file, without copying.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError("Ticket index out of range.")
+        start = index * self.columns
+        return self._data[start:start + self.columns]
+
+    def numbers(self, index: int, pickCounts: List[int]) -> List[List[int]]:
+        """
+        Return ticket `index` split into its pools.
+
+        Args:
+            index: The ticket number.
+            pickCounts: Numbers drawn per pool, in pool order (see the sidecar).
+        """
+        row = self.row(index).tolist()
+        numbers = []
+        start = 0
+        for count in pickCounts:
+            numbers.append(row[start:start + count])
+            start += count
+        return numbers
+
+    def iterNumbers(self, pickCounts: List[int]) -> Iterator[List[List[int]]]:
+        """
+        Yield every ticket split into its pools, in file order.
+        """
+        for index in range(self.rows):
+            yield self.numbers(index, pickCounts)
+
+    def close(self) -> None:
+        self._data.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
@@ -0,0 +1,156 @@
+import os
+import json
+from itertools import chain
+from typing import Iterable, List
+from ...models import Pool, Ticket
+
+MAGIC = b"\x93NUMPY\x01\x00"
+HEADER_BYTES = 128
+
+
+def npyHeader(dtype: str, rows: int, columns: int) -> bytes:
+    """
+    Build a .npy version 1.0 header padded to a fixed HEADER_BYTES, so the
+    row count can be patched in place once writing has finished.
+    """
+    description = f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': ({rows}, {columns}), }}"
+    padding = HEADER_BYTES - len(MAGIC) - 2 - len(description) - 1
+    if padding < 0:
+        raise ValueError("Ticket export header does not fit.")
+    header = description + " " * padding + "\n"
+    return MAGIC + len(header).to_bytes(2, "little") + header.encode("latin-1")
+
+
+class ColumnarTicketWriter:
+    """
+    Streams tickets into a NumPy .npy file with one fixed-width unsigned
+    integer column per drawn number, plus a JSON metadata sidecar.
+
+    Rows are tickets in generation order; the columns of a ticket are its
+    pools in order, each pool's numbers sorted ascending. The element type
+    is uint8 ("|u1") when every pool ends at or below 255 and uint16
+    ("<u2") otherwise. The file can be loaded with numpy.load (or
+    numpy.load(mmap_mode="r")) and read back without NumPy through
+    ColumnarTicketReader.
+
+    The sidecar `<path>.json` records the dtype, the row count, the pools and
+    the name of every column, and any extra metadata given to the writer.
+    Used as a context manager, an exception inside the block aborts the
+    export instead: the file is deleted and no sidecar is written.
+    """
+
+    def __init__(self, path: str, pools: List[Pool], metadata: dict = None, bufferRows: int = 65536):
+        """
+        Args:
+            path: Destination .npy path.
+            pools: The pool configurations of the exported game, in ticket order.
+            metadata: Extra fields stored in the sidecar, e.g. requestId and lotteryType.
+            bufferRows: Rows collected in memory before they are written.
+        """
+        self.path = path
+        self.pools = pools
+        self.metadata = dict(metadata or {})
+        self.bufferRows = bufferRows
+        self.columns = sum(pool.pickCount for pool in pools)
+        self.wide = any(pool.endNumber > 255 for pool in pools)
+        self.dtype = "<u2" if self.wide else "|u1"
+        self.rows = 0
+
+        self._buffer = bytearray()
+        self._bufferedRows = 0
+        self._file = open(path, "wb")
+        self._file.write(npyHeader(self.dtype, 0, self.columns))
+
+    def write(self, ticket: Ticket) -> None:
+        """
+        Append one ticket as a row.
+
+        Args:
+            ticket: A Ticket, or its numbers as one list per pool.
+        """
+        numbers = ticket.numbers if hasattr(ticket, "numbers") else ticket
+        row = list(chain.from_iterable(numbers))
+        if len(row) != self.columns:
+            raise ValueError(f"Expected {self.columns} numbers per ticket, got {len(row)}.")
+        if self.wide:
+            for number in row:
+                self._buffer += number.to_bytes(2, "little")
+        else:
+            self._buffer += bytes(row)
+
+        self._bufferedRows += 1
+        if self._bufferedRows >= self.bufferRows:
+            self.flush()
+
+    def writeTickets(self, tickets: Iterable[Ticket]) -> None:
+        """
+        Append tickets as rows, e.g. the `tickets` of a GenerationResponse or
+        a lazily generated stream.
+        """
+        for ticket in tickets:
+            self.write(ticket)
+
+    def flush(self) -> None:
+        self._file.write(self._buffer)
+        self.rows += self._bufferedRows
+        self._buffer.clear()
+        self._bufferedRows = 0
+
+    def close(self) -> None:
+        """
+        Write the remaining rows, patch the row count into the header and
+        write the metadata sidecar.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.seek(0)
+        self._file.write(npyHeader(self.dtype, self.rows, self.columns))
+        self._file.close()
+
+        columnNames = []
+        pools = []
+        for pool in self.pools:
+            first = len(columnNames)
+            columnNames.extend(f"{pool.name} {position + 1}" for position in range(pool.pickCount))
+            pools.append({
+                "name": pool.name, "start": pool.startNumber, "end": pool.endNumber,
+                "pick": pool.pickCount, "columns": list(range(first, len(columnNames)))
+            })
+
+        sidecar = {
+            "format": "npy",
+            "version": 1,
+            "dtype": self.dtype,
+            "rows": self.rows,
+            "columnCount": self.columns,
+            "dataOffset": HEADER_BYTES,
+            "columns": columnNames,
+            "pools": pools,
+            **self.metadata
+        }
+        with open(f"{self.path}.json", "w") as f:
+            json.dump(sidecar, f, indent=2)
+
+    def abort(self) -> None:
+        """
+        Discard a failed export: close and delete the file, and any sidecar
+        an earlier export left at the same path, so no partial export
+        looks complete.
+        """
+        if not self._file.closed:
+            self._file.close()
+        for path in (self.path, f"{self.path}.json"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is not None:
+            self.abort()
+        else:
+            self.close()
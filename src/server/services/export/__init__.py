@@ -0,0 +1,11 @@
+"""
+Exports the columnar ticket export writer and reader.
+"""
+
+from .ColumnarTicketWriter import ColumnarTicketWriter
+from .ColumnarTicketReader import ColumnarTicketReader
+
+__all__ = [
+    "ColumnarTicketWriter",
+    "ColumnarTicketReader"
+]
@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from ..TicketService import TicketService
+from ..transients.LotteryType import LotteryType
+from ...models import Ticket
+from ...models.randomness import MersenneTwisterGenerator
+
+
+def gilEnabled() -> bool:
+    """
+    Returns False only on a free-threaded build (e.g. python3.13t) running
+    with the GIL disabled.
+    """
+    isGilEnabled = getattr(sys, "_is_gil_enabled", None)
+    return True if isGilEnabled is None else isGilEnabled()
+
+
+class ThreadPoolTicketExecutor:
+    """
+    Generates the tickets of large requests on a pool of threads.
+
+    On free-threaded CPython the threads run on every core without the
+    process start-up and pickling costs of multiprocessing. A request is cut
+    into chunks of chunkSize tickets and each chunk is drawn on a worker
+    thread with that thread's own generator, spawned from the request's
+    generator on first use, so threads never share the module-level
+    `random` state or a generator lock. Every chunk returns its own list
+    and the caller joins them in submission order: results are assembled
+    without locks, and seeded batches are identical to those generated on
+    a single thread.
+
+    While the GIL is enabled threads cannot draw in parallel, so requests
+    are generated on the calling thread exactly as TicketService would,
+    unless ignoreGil is set (to measure the difference). Requests smaller
+    than two chunks always run on the calling thread.
+    """
+
+    def __init__(self, threads=None, chunkSize=2000, ignoreGil=False):
+        """
+        Initialize the executor. Its threads are started on first use, so
+        a daemon can fork before that.
+
+        Args:
+            threads (int, optional): Worker threads. Defaults to the CPU count.
+            chunkSize (int): Tickets drawn by a worker per task.
+            ignoreGil (bool): Use the threads even while the GIL is enabled.
+
+        Raises:
+            ValueError: If threads or chunkSize is not positive.
+        """
+        if threads is None:
+            threads = os.cpu_count() or 1
+        if threads < 1 or chunkSize < 1:
+            raise ValueError("'threads' and 'chunkSize' must be positive.")
+
+        self.threads = threads
+        self.chunkSize = chunkSize
+        self.parallel = threads > 1 and (ignoreGil or not gilEnabled())
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def generateTickets(self, type: LotteryType, count: int, generator=None,
+                        seed=None, offset: int = 0) -> List[Ticket]:
+        """
+        Generate tickets like TicketService.generateTickets, drawing their
+        numbers on the worker threads.
+
+        Args:
+            type (LotteryType): Enum value specifying the type of lottery game.
+            count (int): Number of tickets to generate.
+            generator (IRandomGenerator, optional): Generator each thread spawns its own from.
+                                                    Defaults to the Mersenne Twister.
+            seed (optional): Makes ticket i a pure function of (seed, i); see CounterGenerator.
+            offset (int): Index of the first seeded ticket.
+
+        Returns:
+            List[Ticket]: The generated tickets, in order.
+
+        Raises:
+            ValueError: If the given LotteryType is not supported.
+        """
+        if not self.parallel or count < 2 * self.chunkSize:
+            return TicketService(generator).generateTickets(type, count, seed, offset)
+
+        pool = self.__pool()
+        futures = [
+            pool.submit(self.__generateChunk, type, min(self.chunkSize, count - start),
+                        generator, seed, offset + start)
+            for start in range(0, count, self.chunkSize)
+        ]
+
+        tickets = []
+        try:
+            for future in futures:
+                tickets.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return tickets
+
+    def close(self):
+        """
+        Stop the worker threads once their current chunks are done.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def __pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.threads, thread_name_prefix="ticket-generator")
+            return self._pool
+
+    def __generateChunk(self, type, count, generator, seed, offset):
+        if seed is None:
+            generator = self.__threadGenerator(generator)
+        tickets = TicketService(generator).generateTickets(type, count, seed, offset)
+        # Numbers are drawn on first access; draw them here, on this thread.
+        for ticket in tickets:
+            ticket.numbers
+        return tickets
+
+    def __threadGenerator(self, generator):
+        generators = getattr(self._local, "generators", None)
+        if generators is None:
+            generators = self._local.generators = {}
+        spawned = generators.get(generator)
+        if spawned is None:
+            base = generator if generator is not None else MersenneTwisterGenerator()
+            spawned = generators[generator] = base.spawn()
+        return spawned
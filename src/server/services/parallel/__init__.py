@@ -0,0 +1,10 @@
+"""
+Exports the thread-pool ticket executor for free-threaded CPython builds.
+"""
+
+from .ThreadPoolTicketExecutor import ThreadPoolTicketExecutor, gilEnabled
+
+__all__ = [
+    "ThreadPoolTicketExecutor",
+    "gilEnabled"
+]
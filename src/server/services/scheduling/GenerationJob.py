@@ -0,0 +1,118 @@
+import time
+from collections import deque
+from ..tracing import currentTrace
+
+
+class GenerationJob:
+    """
+    One request's share of the GenerationScheduler.
+
+    The scheduler's workers append generated chunks of tickets; the
+    connection serving the request consumes them with iterChunks(). At most
+    `maxBufferedChunks` chunks wait unconsumed, so a slow reader pauses its
+    own job instead of piling tickets up in memory.
+
+    A job ends when every ticket was consumed, or when it is cancelled: by
+    the consumer (e.g. its peer disconnected), or by the scheduler once
+    `deadline` (a time.monotonic() value) has passed.
+    """
+
+    def __init__(self, scheduler, tickets, count, deadline=None, maxBufferedChunks=4):
+        """
+        Args:
+            scheduler (GenerationScheduler): The scheduler running the job.
+            tickets (Iterator[Ticket]): Lazily created tickets of the request.
+            count (int): Number of tickets the iterator yields.
+            deadline (float, optional): time.monotonic() time at which the job is cancelled.
+            maxBufferedChunks (int): Generated chunks allowed to wait for the consumer.
+        """
+        self.scheduler = scheduler
+        self.tickets = tickets
+        self.count = count
+        self.remaining = count
+        self.deadline = deadline
+        self.maxBufferedChunks = maxBufferedChunks
+        self.error = None
+        self.running = False
+        # Workers record their chunks on the trace of the submitting request.
+        self.trace = currentTrace()
+
+        self._chunks = deque()
+        self._ready = scheduler.condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.error is not None or self.remaining == 0
+
+    def runnable(self, now) -> bool:
+        """
+        Returns True when a worker may generate the next chunk. Called with
+        the scheduler lock held.
+        """
+        if self.deadline is not None and now >= self.deadline and self.error is None:
+            self._fail(TimeoutError("Generation deadline expired"))
+        return not self.finished and not self.running and len(self._chunks) < self.maxBufferedChunks
+
+    def cancel(self, error=None):
+        """
+        Stop generating the remaining tickets. Safe to call at any time,
+        including after the job has finished.
+
+        Args:
+            error (Exception, optional): Raised to a consumer still waiting for chunks.
+        """
+        with self._ready:
+            if not self.finished:
+                self._fail(error if error is not None else ConnectionAbortedError("Generation cancelled"))
+
+    def iterChunks(self, pollInterval=0.1, isAbandoned=None):
+        """
+        Yield the generated tickets chunk by chunk, in order.
+
+        Args:
+            pollInterval (float): Seconds between checks of `isAbandoned` while waiting.
+            isAbandoned (callable, optional): Returns True once nobody will read
+                                              the response, e.g. the peer hung up.
+
+        Raises:
+            TimeoutError: If the deadline expired before all tickets were generated.
+            ConnectionAbortedError: If the job was cancelled.
+        """
+        while True:
+            with self._ready:
+                while not self._chunks:
+                    if self.error is not None:
+                        raise self.error
+                    if self.remaining == 0:
+                        return
+                    timeout = pollInterval
+                    if self.deadline is not None:
+                        timeout = min(timeout, max(self.deadline - time.monotonic(), 0))
+                    if not self._ready.wait(timeout) and not self._chunks:
+                        if self.deadline is not None and time.monotonic() >= self.deadline:
+                            self._fail(TimeoutError("Generation deadline expired"))
+                        elif isAbandoned is not None and isAbandoned():
+                            self._fail(ConnectionAbortedError("Peer disconnected"))
+                chunk = self._chunks.popleft()
+                self.scheduler.wake()
+            yield chunk
+
+    def _deliver(self, chunk):
+        """
+        Hand a generated chunk to the consumer. Called with the scheduler lock held.
+        """
+        self.running = False
+        if self.error is not None:
+            return
+        self.remaining -= len(chunk)
+        self._chunks.append(chunk)
+        self._ready.notify_all()
+
+    def _fail(self, error):
+        """
+        Called with the scheduler lock held.
+        """
+        self.error = error
+        self._chunks.clear()
+        self._ready.notify_all()
+        self.scheduler.wake()
@@ -0,0 +1,183 @@
+import threading
+import time
+from collections import deque
+from itertools import islice
+from ..TicketService import TicketService
+from ..transients.LotteryType import LotteryType
+from .GenerationJob import GenerationJob
+
+POLICIES = ("round-robin", "shortest-first")
+
+
+class GenerationScheduler:
+    """
+    Generates the tickets of all active requests in fixed-size chunks on a
+    small pool of worker threads.
+
+    Instead of generating a request in one go, a worker produces
+    `chunkSize` tickets of one job and then picks the next job:
+        - round-robin: active jobs take turns, so a count of 5,000,000 only
+          delays a count of 1 by one chunk
+        - shortest-first: the job with the fewest remaining tickets goes
+          next, minimising the mean completion time of small requests
+
+    Cancelled or expired jobs are dropped before their next chunk, so the
+    CPU they would have used goes to the remaining requests.
+    """
+
+    def __init__(self, workers=2, chunkSize=1000, policy="round-robin", maxBufferedChunks=4):
+        """
+        Initialize the scheduler. Its workers run once start() is called.
+
+        Args:
+            workers (int): Number of generation threads.
+            chunkSize (int): Tickets generated per scheduling turn.
+            policy (str): "round-robin" or "shortest-first".
+            maxBufferedChunks (int): Generated chunks a job may hold before its
+                                     consumer reads them.
+
+        Raises:
+            ValueError: If a size is not positive or the policy is unknown.
+        """
+        if workers < 1 or chunkSize < 1 or maxBufferedChunks < 1:
+            raise ValueError("'workers', 'chunkSize' and 'maxBufferedChunks' must be positive.")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown scheduling policy: '{policy}'")
+
+        self.chunkSize = chunkSize
+        self.policy = policy
+        self.maxBufferedChunks = maxBufferedChunks
+
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._jobs = deque()
+        self._closed = False
+        self.workers = workers
+        self._workers = []
+
+    def start(self):
+        """
+        Start the worker threads. Kept out of __init__ so a daemon can fork
+        before any thread exists.
+        """
+        if self._workers:
+            return
+        self._workers = [
+            threading.Thread(target=self.__workerLoop, name=f"generation-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def condition(self):
+        """
+        Returns a condition variable sharing the scheduler lock, for jobs.
+        """
+        return threading.Condition(self._lock)
+
+    def wake(self):
+        """
+        Tell idle workers that a job may have become runnable. Called with
+        the scheduler lock held.
+        """
+        self._work.notify_all()
+
+    def submit(self, type: LotteryType, count: int, generator=None, timeout=None,
+               seed=None, offset=0) -> GenerationJob:
+        """
+        Schedule the generation of `count` tickets.
+
+        Args:
+            type (LotteryType): The lottery game.
+            count (int): Number of tickets to generate.
+            generator (IRandomGenerator, optional): Source of randomness for the tickets.
+            timeout (float, optional): Seconds after which the job is cancelled.
+            seed (optional): Generate tickets offset .. offset + count - 1 of this seeded batch.
+            offset (int): Index of the first seeded ticket.
+
+        Returns:
+            GenerationJob: Handle to consume the tickets or cancel the job.
+
+        Raises:
+            ValueError: If the type is unsupported.
+            RuntimeError: If the scheduler is closed.
+        """
+        tickets = TicketService(generator).iterTickets(type, count, seed, offset)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        job = GenerationJob(self, tickets, count, deadline, self.maxBufferedChunks)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Generation scheduler is closed.")
+            self._jobs.append(job)
+            self._work.notify()
+        return job
+
+    def activeJobs(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def close(self):
+        """
+        Cancel all jobs and stop the workers.
+        """
+        with self._lock:
+            self._closed = True
+            for job in self._jobs:
+                job._fail(ConnectionAbortedError("Generation scheduler closed"))
+            self._jobs.clear()
+            self._work.notify_all()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def __workerLoop(self):
+        while True:
+            with self._lock:
+                job = self.__nextJob()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._work.wait()
+                    job = self.__nextJob()
+                job.running = True
+
+            size = min(self.chunkSize, job.remaining)
+            started = time.perf_counter_ns()
+            try:
+                chunk = list(islice(job.tickets, size))
+                # Draw the numbers here rather than while serializing.
+                for ticket in chunk:
+                    ticket.numbers
+            except Exception as e:
+                with self._lock:
+                    job.running = False
+                    job._fail(e)
+                continue
+
+            if job.trace is not None:
+                job.trace.record("generate chunk", started, time.perf_counter_ns() - started,
+                                 {"tickets": len(chunk)})
+            with self._lock:
+                job._deliver(chunk)
+                if job.finished and job in self._jobs:
+                    self._jobs.remove(job)
+
+    def __nextJob(self):
+        """
+        Pick the next runnable job according to the policy, dropping finished
+        ones. Called with the lock held.
+        """
+        now = time.monotonic()
+        for job in [job for job in self._jobs if job.finished and not job.running]:
+            self._jobs.remove(job)
+
+        if self.policy == "shortest-first":
+            runnable = [job for job in self._jobs if job.runnable(now)]
+            return min(runnable, key=lambda job: job.remaining) if runnable else None
+
+        for _ in range(len(self._jobs)):
+            job = self._jobs[0]
+            self._jobs.rotate(-1)
+            if job.runnable(now):
+                return job
+        return None
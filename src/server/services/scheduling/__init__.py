@@ -0,0 +1,12 @@
+"""
+Exports the chunked generation scheduler.
+"""
+
+from .GenerationJob import GenerationJob
+from .GenerationScheduler import GenerationScheduler, POLICIES
+
+__all__ = [
+    "GenerationJob",
+    "GenerationScheduler",
+    "POLICIES"
+]
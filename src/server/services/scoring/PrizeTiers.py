@@ -0,0 +1,33 @@
+from ..transients import LotteryType
+
+# Prize tiers of each game as (tier name, required matches per pool).
+# A ticket falls into a tier when its match count in every pool equals the
+# requirement exactly; tiers of one game are therefore mutually exclusive.
+# The bonus-number tiers of Lotto Max and Lottario are not listed because
+# those games are modelled without a bonus draw.
+PRIZE_TIERS = {
+    LotteryType.LOTTO_MAX: [
+        ("7/7", (7,)),
+        ("6/7", (6,)),
+        ("5/7", (5,)),
+        ("4/7", (4,)),
+        ("3/7", (3,)),
+    ],
+    LotteryType.DAILY_GRAND: [
+        ("5/5 + Grand Number", (5, 1)),
+        ("5/5", (5, 0)),
+        ("4/5 + Grand Number", (4, 1)),
+        ("4/5", (4, 0)),
+        ("3/5 + Grand Number", (3, 1)),
+        ("3/5", (3, 0)),
+        ("2/5 + Grand Number", (2, 1)),
+        ("1/5 + Grand Number", (1, 1)),
+        ("0/5 + Grand Number", (0, 1)),
+    ],
+    LotteryType.LOTTARIO: [
+        ("6/6", (6,)),
+        ("5/6", (5,)),
+        ("4/6", (4,)),
+        ("3/6", (3,)),
+    ],
+}
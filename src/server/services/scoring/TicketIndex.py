@@ -0,0 +1,176 @@
+import json
+import mmap
+import struct
+from typing import List
+from ...models import Pool
+
+MAGIC = b"LTIX"
+GROWTH_BYTES = 64 * 1024
+
+
+class TicketIndex:
+    """
+    Inverted index of issued tickets: for every pool and every number of the
+    pool, a bitset of the tickets containing that number.
+
+    Bit t of the bitset for (pool, number) is set when ticket t drew that
+    number. Checking a draw then only touches the bitsets of the winning
+    numbers and works on whole bitsets at a time (see WinningCheckService),
+    instead of looping over tickets in Python.
+
+    Binary file layout (little-endian):
+        b"LTIX" | uint32 header length | JSON header |
+        one bitset of `bytesPerNumber` bytes per (pool, number), pools in
+        order and numbers ascending
+    """
+
+    def __init__(self, pools: List[Pool]):
+        """
+        Create an empty index for tickets made of the given pools.
+
+        Args:
+            pools: The pool configurations of the game, in ticket order.
+        """
+        if not pools:
+            raise ValueError("TicketIndex must contain at least one pool.")
+        self.pools = pools
+        self.count = 0
+        self.readOnly = False
+        self._capacity = 0
+        self._bits = [
+            [bytearray() for _ in range(pool.startNumber, pool.endNumber + 1)]
+            for pool in pools
+        ]
+
+    def add(self, numbers: List[List[int]]) -> None:
+        """
+        Append one ticket to the index.
+
+        Args:
+            numbers: The ticket's numbers for each pool, in pool order.
+
+        Raises:
+            ValueError: If a number lies outside its pool's range or the
+                        ticket does not have one entry per pool.
+        """
+        if self.readOnly:
+            raise RuntimeError("TicketIndex loaded from a file is read-only.")
+        if len(numbers) != len(self.pools):
+            raise ValueError(f"Expected numbers for {len(self.pools)} pool(s), got {len(numbers)}.")
+
+        ticket = self.count
+        byte = ticket >> 3
+        bit = 1 << (ticket & 7)
+        if byte >= self._capacity:
+            self.__grow()
+
+        for pool, poolBits, poolNumbers in zip(self.pools, self._bits, numbers):
+            start = pool.startNumber
+            for number in poolNumbers:
+                if not start <= number <= pool.endNumber:
+                    raise ValueError(f"Number {number} is outside {pool.name} range "
+                                     f"{start}-{pool.endNumber}.")
+                poolBits[number - start][byte] |= bit
+        self.count = ticket + 1
+
+    def addTickets(self, tickets) -> None:
+        """
+        Append generated Ticket objects to the index.
+
+        Args:
+            tickets (Iterable[Ticket]): Tickets with the same pools as the index.
+        """
+        for ticket in tickets:
+            self.add(ticket.numbers)
+
+    def bitset(self, poolIndex: int, number: int) -> int:
+        """
+        Return the tickets containing a number as an integer bitset.
+
+        Args:
+            poolIndex: Position of the pool in the ticket.
+            number: The number within that pool.
+
+        Returns:
+            int: Bit t is set when ticket t contains `number`.
+        """
+        pool = self.pools[poolIndex]
+        if not pool.startNumber <= number <= pool.endNumber:
+            return 0
+        bits = self._bits[poolIndex][number - pool.startNumber]
+        return int.from_bytes(bits[:self.bytesPerNumber], "little")
+
+    @property
+    def bytesPerNumber(self) -> int:
+        return (self.count + 7) // 8
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a binary file.
+
+        Args:
+            path: Destination file path.
+        """
+        header = json.dumps({
+            "version": 1,
+            "count": self.count,
+            "bytesPerNumber": self.bytesPerNumber,
+            "pools": [
+                {"name": pool.name, "start": pool.startNumber,
+                 "end": pool.endNumber, "pick": pool.pickCount}
+                for pool in self.pools
+            ]
+        }).encode()
+
+        size = self.bytesPerNumber
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for poolBits in self._bits:
+                for bits in poolBits:
+                    f.write(memoryview(bits)[:size])
+
+    @classmethod
+    def load(cls, path: str) -> "TicketIndex":
+        """
+        Memory-map an index written by save(). Only the bitsets that are
+        actually read are paged in.
+
+        Args:
+            path: The index file path.
+
+        Returns:
+            TicketIndex: A read-only index backed by the file.
+
+        Raises:
+            ValueError: If the file is not a ticket index.
+        """
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"Not a ticket index file: {path}")
+            (headerLength,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(headerLength))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        pools = [Pool(p["name"], p["start"], p["end"], p["pick"]) for p in header["pools"]]
+        index = cls(pools)
+        index.count = header["count"]
+        index.readOnly = True
+        index._capacity = header["bytesPerNumber"]
+
+        view = memoryview(mapped)
+        offset = 8 + headerLength
+        size = header["bytesPerNumber"]
+        for poolBits in index._bits:
+            for number in range(len(poolBits)):
+                poolBits[number] = view[offset:offset + size]
+                offset += size
+        return index
+
+    def __grow(self):
+        padding = bytes(GROWTH_BYTES)
+        for poolBits in self._bits:
+            for bits in poolBits:
+                bits += padding
+        self._capacity += GROWTH_BYTES
@@ -0,0 +1,11 @@
+"""
+Exports the ticket index and prize tier tables used to score draws.
+"""
+
+from .TicketIndex import TicketIndex
+from .PrizeTiers import PRIZE_TIERS
+
+__all__ = [
+    "TicketIndex",
+    "PRIZE_TIERS"
+]
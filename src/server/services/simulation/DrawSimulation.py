@@ -0,0 +1,59 @@
+from ...models import Pool
+from ...models.randomness import CounterGenerator
+from ..TicketService import TicketService
+from ..WinningCheckService import WinningCheckService
+from ..scoring import PRIZE_TIERS
+
+
+def simulateChunk(type, draws, ticketCount, seed, chunk):
+    """
+    Score `draws` random draws against one random set of `ticketCount`
+    tickets. Runs in a worker process of the SimulationService.
+
+    The tickets are indexed once into a TicketIndex, so every draw is scored
+    for all tickets at once with the bit-sliced counting of
+    WinningCheckService. Tickets and draws come from counter-based
+    generators keyed by (seed, chunk), so chunks are independent across
+    processes and a run is reproducible.
+
+    Returns:
+        dict: Per tier and per pool match count, the total hits and the sum
+              of squared hits per draw (for the variance between draws).
+    """
+    service = WinningCheckService()
+    pools = service.poolsFor(type)
+    tickets = TicketService().generateTickets(type, ticketCount, seed=f"{seed}:tickets:{chunk}")
+    index = service.indexTickets(type, tickets)
+    del tickets
+
+    tierNames = [name for name, _ in PRIZE_TIERS[type]]
+    tierHits = [0] * len(tierNames)
+    tierSquares = [0] * len(tierNames)
+    matchHits = [[0] * (pool.pickCount + 1) for pool in pools]
+    matchSquares = [[0] * (pool.pickCount + 1) for pool in pools]
+
+    draw = CounterGenerator(f"{seed}:draws:{chunk}")
+    for number in range(draws):
+        generator = draw.at(number)
+        winning = [
+            Pool(pool.name, pool.startNumber, pool.endNumber, pool.pickCount, generator).selectRandomly()
+            for pool in pools
+        ]
+        result = service.check(type, index, winning)
+
+        for position, (_, hits) in enumerate(result.tierCounts):
+            tierHits[position] += hits
+            tierSquares[position] += hits * hits
+        for position, (_, histogram) in enumerate(result.matchHistograms):
+            for matches, hits in histogram.items():
+                matchHits[position][matches] += hits
+                matchSquares[position][matches] += hits * hits
+
+    return {
+        "draws": draws,
+        "tickets": ticketCount,
+        "tierHits": tierHits,
+        "tierSquares": tierSquares,
+        "matchHits": matchHits,
+        "matchSquares": matchSquares
+    }
@@ -0,0 +1,66 @@
+from math import comb, sqrt
+from typing import List, Sequence, Tuple
+from ...models import Pool
+
+
+def hypergeometric(population: int, successes: int, draws: int, matches: int) -> float:
+    """
+    Probability of exactly `matches` successes when `draws` items are taken
+    without replacement from `population` items of which `successes` succeed.
+    """
+    if matches < 0 or matches > min(successes, draws):
+        return 0.0
+    return comb(successes, matches) * comb(population - successes, draws - matches) / comb(population, draws)
+
+
+def matchProbability(pool: Pool, matches: int) -> float:
+    """
+    Probability that a ticket matches exactly `matches` numbers of a pool's draw.
+    """
+    size = pool.endNumber - pool.startNumber + 1
+    return hypergeometric(size, pool.pickCount, pool.pickCount, matches)
+
+
+def positionProbability(pool: Pool, position: int, number: int) -> float:
+    """
+    Probability that the sorted numbers of a pool's draw have `number` at
+    `position` (0 = smallest): `position` smaller numbers and the rest
+    larger ones must be drawn around it.
+    """
+    size = pool.endNumber - pool.startNumber + 1
+    rank = number - pool.startNumber
+    if not 0 <= position < pool.pickCount or not 0 <= rank < size:
+        return 0.0
+    return comb(rank, position) * comb(size - rank - 1, pool.pickCount - position - 1) / comb(size, pool.pickCount)
+
+
+def tierProbability(pools: List[Pool], requirement: Sequence[int]) -> float:
+    """
+    Exact probability of a prize tier; the pools are drawn independently.
+    """
+    probability = 1.0
+    for pool, matches in zip(pools, requirement):
+        probability *= matchProbability(pool, matches)
+    return probability
+
+
+def wilsonInterval(hits: float, trials: float, z: float = 1.959964) -> Tuple[float, float]:
+    """
+    Wilson score interval of a binomial proportion (95% for the default z).
+    Unlike the normal approximation it stays inside [0, 1] and is
+    meaningful for zero hits, which matters for jackpot tiers.
+
+    Args:
+        hits: Observed successes (may be fractional after a design-effect correction).
+        trials: Number of trials (likewise).
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    p = hits / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    # At 0 or all hits centre and margin cancel exactly, but not in floating point.
+    low = 0.0 if hits <= 0 else max(0.0, centre - margin)
+    high = 1.0 if hits >= trials else min(1.0, centre + margin)
+    return low, high
@@ -0,0 +1,15 @@
+"""
+Exports the Monte Carlo draw simulation worker and exact odds helpers.
+"""
+
+from .DrawSimulation import simulateChunk
+from .Odds import hypergeometric, matchProbability, positionProbability, tierProbability, wilsonInterval
+
+__all__ = [
+    "simulateChunk",
+    "hypergeometric",
+    "matchProbability",
+    "positionProbability",
+    "tierProbability",
+    "wilsonInterval"
+]
@@ -0,0 +1,82 @@
+import threading
+import time
+
+
+class Span:
+    """
+    Times one stage of a traced request; use it as a context manager.
+    """
+
+    __slots__ = ("trace", "name", "args", "start")
+
+    def __init__(self, trace, name, args):
+        self.trace = trace
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        end = time.perf_counter_ns()
+        if excType is not None:
+            self.args = dict(self.args or {}, error=f"{excType.__name__}: {excValue}")
+        self.trace.record(self.name, self.start, end - self.start, self.args)
+
+
+class NullSpan:
+    """
+    Stands in for a span when the request is not traced.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        return None
+
+
+NULL_SPAN = NullSpan()
+
+
+class Trace:
+    """
+    The spans recorded for one request, from any thread.
+
+    Each span is kept as (name, start ns, duration ns, thread id, args);
+    appending to a list is atomic, so worker threads can record spans on a
+    trace owned by the connection's thread.
+    """
+
+    def __init__(self, requestId=None, sampled=True):
+        """
+        Args:
+            requestId (str, optional): The traced request; may be set once it is parsed.
+            sampled (bool): Whether head sampling selected the request.
+        """
+        self.requestId = requestId
+        self.sampled = sampled
+        self.start = time.perf_counter_ns()
+        self.end = None
+        self.spans = []
+        self.threadNames = {}
+
+    def span(self, name, args=None) -> Span:
+        return Span(self, name, args)
+
+    def record(self, name, start, duration, args=None):
+        thread = threading.current_thread()
+        self.threadNames.setdefault(thread.ident, thread.name)
+        self.spans.append((name, start, duration, thread.ident, args))
+
+    def finish(self):
+        self.end = time.perf_counter_ns()
+
+    @property
+    def durationMs(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter_ns()
+        return (end - self.start) / 1e6
@@ -0,0 +1,134 @@
+import contextvars
+import json
+import os
+import random
+import re
+import time
+from .Trace import Trace, NULL_SPAN
+
+_currentTrace = contextvars.ContextVar("currentTrace", default=None)
+
+
+def currentTrace():
+    """
+    Returns:
+        Trace: The trace of the request being served by this thread or task, or None.
+    """
+    return _currentTrace.get()
+
+
+def span(name, **args):
+    """
+    Time a stage of the current request:
+
+        with span("TicketService.generateTickets", count=count):
+            ...
+
+    Costs one context variable lookup when the request is not traced.
+    """
+    trace = _currentTrace.get()
+    if trace is None:
+        return NULL_SPAN
+    return trace.span(name, args or None)
+
+
+class Tracer:
+    """
+    Decides which requests are traced and exports their traces as
+    Chrome trace-event JSON, which chrome://tracing and Perfetto open.
+
+    Sampling is head-based: a request is traced from the start with
+    probability sampleRate. With slowThresholdMs set, every request records
+    its spans and the ones that took longer than the threshold are exported
+    too, whatever the sampling decided. Without it, requests that are not
+    sampled record nothing at all.
+
+    Every exported trace is one file, <directory>/trace-<requestId>-<time>.json.
+    """
+
+    def __init__(self, directory, sampleRate=0.01, slowThresholdMs=None, rng=None):
+        """
+        Args:
+            directory (str): Directory receiving the trace files.
+            sampleRate (float): Fraction of requests traced from the start.
+            slowThresholdMs (float, optional): Requests slower than this are always exported.
+            rng (random.Random, optional): Source of the sampling decisions.
+
+        Raises:
+            ValueError: If sampleRate is not between 0 and 1.
+        """
+        if not 0.0 <= sampleRate <= 1.0:
+            raise ValueError("'sampleRate' must be between 0 and 1.")
+        self.directory = directory
+        self.sampleRate = sampleRate
+        self.slowThresholdMs = slowThresholdMs
+        self.rng = rng if rng is not None else random.Random()
+        self.exported = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def begin(self, requestId=None):
+        """
+        Start serving a request in the current thread or task.
+
+        Returns:
+            tuple: (Trace or None, token for end())
+        """
+        sampled = self.sampleRate > 0 and self.rng.random() < self.sampleRate
+        if not sampled and self.slowThresholdMs is None:
+            return None, _currentTrace.set(None)
+        trace = Trace(requestId, sampled)
+        return trace, _currentTrace.set(trace)
+
+    def end(self, trace, token):
+        """
+        Finish the request started by begin() and export its trace if it
+        was sampled or slow.
+
+        Returns:
+            str: Path of the exported file, or None.
+        """
+        _currentTrace.reset(token)
+        if trace is None:
+            return None
+        trace.finish()
+        slow = self.slowThresholdMs is not None and trace.durationMs >= self.slowThresholdMs
+        if not (trace.sampled or slow):
+            return None
+        return self.export(trace, "slow" if slow and not trace.sampled else "sampled")
+
+    def export(self, trace, reason="sampled"):
+        """
+        Write a trace as Chrome trace-event JSON.
+
+        Returns:
+            str: Path of the written file.
+        """
+        pid = os.getpid()
+        origin = trace.start
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in trace.threadNames.items()
+        ]
+        events.append({
+            "name": f"request {trace.requestId}", "cat": "request", "ph": "X", "pid": pid,
+            "tid": next(iter(trace.threadNames), 0), "ts": 0, "dur": (trace.end - origin) / 1000,
+            "args": {"requestId": trace.requestId, "reason": reason}
+        })
+        for name, start, duration, tid, args in trace.spans:
+            event = {"name": name, "cat": "stage", "ph": "X", "pid": pid, "tid": tid,
+                     "ts": (start - origin) / 1000, "dur": duration / 1000}
+            if args:
+                event["args"] = args
+            events.append(event)
+
+        safeId = re.sub(r"[^A-Za-z0-9_.-]", "_", str(trace.requestId))[:64]
+        path = os.path.join(self.directory, f"trace-{safeId}-{time.time_ns()}.json")
+        with open(path, "w") as f:
+            json.dump({
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": {"requestId": trace.requestId, "reason": reason,
+                              "durationMs": round(trace.durationMs, 3)}
+            }, f)
+        self.exported += 1
+        return path
@@ -0,0 +1,14 @@
+"""
+Exports request tracing: the Tracer, the current-trace helpers and spans.
+"""
+
+from .Trace import Trace, Span
+from .Tracer import Tracer, span, currentTrace
+
+__all__ = [
+    "Trace",
+    "Span",
+    "Tracer",
+    "span",
+    "currentTrace"
+]
@@ -0,0 +1,65 @@
+import json
+from typing import List, Optional
+from .GenerationResponse import GenerationResponse
+
+
+class BatchGenerationResponse:
+    """
+    Represents the combined response to a batch of generation requests.
+
+    Attributes:
+        items (List[tuple]): One (GenerationResponse, None) or (requestId, error message)
+                             pair per sub-request, in request order.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty batch response.
+        """
+        self.items = []
+
+    def addResult(self, generationResponse: GenerationResponse) -> None:
+        """
+        Append a successfully generated sub-request.
+        """
+        self.items.append((generationResponse, None))
+
+    def addError(self, requestId: Optional[str], message: str) -> None:
+        """
+        Append a sub-request that failed validation or generation.
+        """
+        self.items.append((requestId, message))
+
+    def toDict(self) -> dict:
+        """
+        Returns:
+            dict: {"results": [...]} with one entry per sub-request; successful
+                  entries carry the formatted response, failed ones the error.
+        """
+        results = []
+        for index, (item, error) in enumerate(self.items):
+            if error is None:
+                results.append({
+                    "index": index,
+                    "requestId": item.requestId,
+                    "type": item.lotteryType,
+                    "status": "ok",
+                    "response": str(item)
+                })
+            else:
+                results.append({"index": index, "requestId": item, "status": "error", "error": error})
+        return {"results": results}
+
+    def iterChunks(self, ticketsPerChunk: int = 1000):
+        """
+        Yields the JSON document in a single piece, so batch and single
+        responses can be streamed the same way. ticketsPerChunk is accepted
+        for that reason and ignored.
+        """
+        yield str(self)
+
+    def __str__(self) -> str:
+        """
+        Returns the batch response as a JSON document.
+        """
+        return json.dumps(self.toDict())
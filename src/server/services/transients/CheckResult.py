@@ -0,0 +1,44 @@
+from typing import Dict, List, Tuple
+
+
+class CheckResult:
+    """
+    Outcome of scoring a set of issued tickets against a draw.
+
+    Attributes:
+        lotteryType (str): The lottery type the tickets belong to.
+        ticketCount (int): Number of tickets scored.
+        winningNumbers (List[List[int]]): The winning numbers per pool.
+        matchHistograms (List[Tuple[str, Dict[int, int]]]): Per pool, the number of
+            tickets matching exactly k winning numbers, for every k.
+        tierCounts (List[Tuple[str, int]]): Number of winning tickets per prize tier.
+    """
+
+    def __init__(self, lotteryType: str, ticketCount: int, winningNumbers: List[List[int]],
+                 matchHistograms: List[Tuple[str, Dict[int, int]]], tierCounts: List[Tuple[str, int]]):
+        self.lotteryType = lotteryType
+        self.ticketCount = ticketCount
+        self.winningNumbers = winningNumbers
+        self.matchHistograms = matchHistograms
+        self.tierCounts = tierCounts
+
+    def __str__(self) -> str:
+        """
+        Returns a report with the draw, the prize-tier tallies and the
+        per-pool match histograms.
+        """
+        lines = [f"Ticket Type: {self.lotteryType}", f"Tickets Checked: {self.ticketCount}", ""]
+        for (poolName, _), numbers in zip(self.matchHistograms, self.winningNumbers):
+            lines.append(f"Winning {poolName}: {' '.join(str(num) for num in numbers)}")
+
+        lines.append("")
+        lines.append("Prize Tiers:")
+        for tierName, count in self.tierCounts:
+            lines.append(f"  {tierName}: {count}")
+
+        for poolName, histogram in self.matchHistograms:
+            lines.append("")
+            lines.append(f"{poolName} Matches:")
+            for matches, count in sorted(histogram.items(), reverse=True):
+                lines.append(f"  {matches}: {count}")
+        return "\n".join(lines)
@@ -1,5 +1,6 @@
 from typing import List
 from ...models.Ticket import Ticket
+from ..tracing import span
 
 
 class GenerationResponse:
@@ -41,6 +42,47 @@ class GenerationResponse:
             - Ticket Type (immediately below)
             - All ticket pool contents
         """
-        header = f"Generation Request ID: {self.requestId}\nTicket Type: {self.lotteryType}"
+        header = self.header()
         body = "\n\n".join(str(ticket) for ticket in self.tickets)
         return f"{header}\n\n{body}" if body else header
+
+    def header(self) -> str:
+        """
+        Returns the lines printed above the tickets.
+        """
+        return f"Generation Request ID: {self.requestId}\nTicket Type: {self.lotteryType}"
+
+    def iterChunks(self, ticketsPerChunk: int = 1000):
+        """
+        Yields the string representation in pieces of at most
+        `ticketsPerChunk` tickets, so large responses can be streamed while
+        they are serialized. Joining the pieces gives str(self).
+
+        Args:
+            ticketsPerChunk (int): Number of tickets serialized per piece.
+        """
+        yield self.header()
+        for start in range(0, len(self.tickets), ticketsPerChunk):
+            chunk = self.tickets[start:start + ticketsPerChunk]
+            # Drawing of lazily generated numbers is part of this span.
+            with span("serialize", tickets=len(chunk)):
+                text = "\n\n" + "\n\n".join(str(ticket) for ticket in chunk)
+            yield text
+
+    def exportColumns(self, path: str) -> int:
+        """
+        Write the tickets to a columnar .npy export with a JSON metadata
+        sidecar (see ColumnarTicketWriter).
+
+        Args:
+            path (str): Destination .npy path.
+
+        Returns:
+            int: Number of tickets written.
+        """
+        from ..export import ColumnarTicketWriter
+
+        metadata = {"requestId": self.requestId, "lotteryType": self.lotteryType}
+        with ColumnarTicketWriter(path, self.tickets[0].pools, metadata) as writer:
+            writer.writeTickets(self.tickets)
+        return writer.rows
@@ -0,0 +1,52 @@
+from ..tracing import span
+
+
+class ScheduledGenerationResponse:
+    """
+    A generation response whose tickets are produced by a GenerationJob
+    while the response is being sent.
+
+    Its text is identical to that of a GenerationResponse with the same tickets.
+
+    Attributes:
+        requestId (str): Identifier for this generation request.
+        lotteryType (str): The type of lottery this request represents.
+        job (GenerationJob): The scheduled job generating the tickets.
+    """
+
+    def __init__(self, requestId: str, lotteryType: str, job):
+        """
+        Args:
+            requestId (str): Unique identifier for the request.
+            lotteryType (str): Name of the lottery type (e.g., "Lotto Max").
+            job (GenerationJob): The scheduled job generating the tickets.
+        """
+        if not requestId:
+            raise ValueError("Request ID must not be empty.")
+        if not lotteryType:
+            raise ValueError("Lottery type must not be empty.")
+
+        self.requestId = requestId
+        self.lotteryType = lotteryType
+        self.job = job
+
+    def iterChunks(self, pollInterval: float = 0.1, isAbandoned=None):
+        """
+        Yields the string representation one scheduled chunk of tickets at a time.
+
+        Args:
+            pollInterval (float): Seconds between checks of `isAbandoned` while waiting.
+            isAbandoned (callable, optional): Returns True once the client is gone.
+
+        Raises:
+            TimeoutError: If the job's deadline expired.
+            ConnectionAbortedError: If the job was cancelled.
+        """
+        yield f"Generation Request ID: {self.requestId}\nTicket Type: {self.lotteryType}"
+        for chunk in self.job.iterChunks(pollInterval, isAbandoned):
+            with span("serialize", tickets=len(chunk)):
+                text = "\n\n" + "\n\n".join(str(ticket) for ticket in chunk)
+            yield text
+
+    def cancel(self):
+        self.job.cancel()
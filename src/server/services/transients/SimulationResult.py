@@ -0,0 +1,73 @@
+import math
+from typing import Dict, List, Tuple
+
+
+def _odds(probability: float) -> str:
+    if probability <= 0:
+        return "never"
+    return f"1 in {1 / probability:,.1f}"
+
+
+class SimulationResult:
+    """
+    Outcome of a Monte Carlo draw simulation.
+
+    Attributes:
+        lotteryType (str): The simulated lottery type.
+        draws (int): Number of simulated draws.
+        ticketsPerDraw (int): Tickets scored against every draw.
+        workers (int): Worker processes used.
+        elapsed (float): Wall-clock seconds of the simulation.
+        tiers (List[Dict]): Per prize tier: name, hits, estimate, low, high
+            (95% interval), exact probability and design effect.
+        matchHistograms (List[Tuple[str, List[Dict]]]): The same per pool and match count.
+    """
+
+    def __init__(self, lotteryType: str, draws: int, ticketsPerDraw: int, workers: int, elapsed: float,
+                 tiers: List[Dict], matchHistograms: List[Tuple[str, List[Dict]]]):
+        self.lotteryType = lotteryType
+        self.draws = draws
+        self.ticketsPerDraw = ticketsPerDraw
+        self.workers = workers
+        self.elapsed = elapsed
+        self.tiers = tiers
+        self.matchHistograms = matchHistograms
+
+    def __str__(self) -> str:
+        """
+        Returns a report with the estimated odds, their 95% intervals and the
+        exact odds per prize tier and per pool match count, and the tickets
+        needed until the top tier is won.
+        """
+        trials = self.draws * self.ticketsPerDraw
+        lines = [
+            f"Ticket Type: {self.lotteryType}",
+            f"Simulated: {self.draws:,} draws x {self.ticketsPerDraw:,} tickets = {trials:,} ticket-draws",
+            f"Elapsed: {self.elapsed:.1f}s on {self.workers} process(es) "
+            f"({trials / max(self.elapsed, 1e-9):,.0f} ticket-draws/s)",
+            "",
+            "Prize Tiers (hits, estimated odds [95% interval], exact odds):"
+        ]
+        lines.extend(self.__row(row) for row in self.tiers)
+
+        for poolName, rows in self.matchHistograms:
+            lines.append("")
+            lines.append(f"{poolName} Matches:")
+            lines.extend(self.__row(row) for row in rows)
+
+        top = self.tiers[0] if self.tiers else None
+        if top is not None and top["exact"] > 0:
+            lines.append("")
+            lines.append(f"Tickets until {top['name']}:")
+            lines.append(f"  expected (exact): {1 / top['exact']:,.0f}")
+            lines.append(f"  for a 50% chance (exact): {math.log(2) / -math.log1p(-top['exact']):,.0f}")
+            if top["estimate"] > 0:
+                lines.append(f"  expected (simulated): {1 / top['estimate']:,.0f}")
+            else:
+                lines.append(f"  expected (simulated): more than {1 / top['high']:,.0f} (no hits)")
+        return "\n".join(lines)
+
+    @staticmethod
+    def __row(row) -> str:
+        interval = f"[{_odds(row['high'])} .. {_odds(row['low'])}]"
+        return f"  {row['name']}: {row['hits']:,} hits, {_odds(row['estimate'])} {interval}, exact {_odds(row['exact'])}"
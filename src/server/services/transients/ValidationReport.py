@@ -0,0 +1,62 @@
+from typing import Dict, List, Tuple
+
+
+class ValidationReport:
+    """
+    Outcome of a statistical validation of a generation backend.
+
+    Attributes:
+        lotteryType (str): The validated lottery type.
+        backend (str): The generation backend that drew the tickets.
+        tickets (int): Number of tickets generated and counted.
+        workers (int): Worker processes used.
+        elapsed (float): Wall-clock seconds of generation and counting.
+        alpha (float): Probability of failing a uniform backend.
+        threshold (float): p-value below which a single test fails.
+        pools (List[Tuple[str, List[Dict]]]): Per pool, the tests with their
+            name, statistic, degrees of freedom, p-value and verdict.
+    """
+
+    def __init__(self, lotteryType: str, backend: str, tickets: int, workers: int, elapsed: float,
+                 alpha: float, threshold: float, pools: List[Tuple[str, List[Dict]]]):
+        self.lotteryType = lotteryType
+        self.backend = backend
+        self.tickets = tickets
+        self.workers = workers
+        self.elapsed = elapsed
+        self.alpha = alpha
+        self.threshold = threshold
+        self.pools = pools
+
+    @property
+    def passed(self) -> bool:
+        return all(test["passed"] for _, tests in self.pools for test in tests)
+
+    def __str__(self) -> str:
+        """
+        Returns a report with every test of every pool and the verdict for the game.
+        """
+        testCount = sum(len(tests) for _, tests in self.pools)
+        lines = [
+            f"Ticket Type: {self.lotteryType}",
+            f"Backend: {self.backend}",
+            f"Validated: {self.tickets:,} tickets in {self.elapsed:.1f}s on {self.workers} process(es) "
+            f"({self.tickets / max(self.elapsed, 1e-9) * 60:,.0f} tickets/min)",
+            f"Significance: {self.alpha} per game, p < {self.threshold:.2g} fails a test "
+            f"(Bonferroni over {testCount} tests)"
+        ]
+        for poolName, tests in self.pools:
+            lines.append("")
+            lines.append(f"{poolName}:")
+            lines.extend(self.__row(test) for test in tests)
+
+        lines.append("")
+        lines.append(f"Result: {'PASS' if self.passed else 'FAIL'}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def __row(test) -> str:
+        dof = f" ({test['dof']} dof)" if test["dof"] is not None else ""
+        statistic = f"{test['statisticName']} = {test['statistic']:.6g}{dof}"
+        return (f"  {'PASS' if test['passed'] else 'FAIL'}  {test['name']:<20} "
+                f"{statistic:<28} p = {test['pValue']:.4f}")
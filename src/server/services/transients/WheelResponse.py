@@ -0,0 +1,39 @@
+from typing import List
+from ...models.Ticket import Ticket
+from .GenerationResponse import GenerationResponse
+
+
+class WheelResponse(GenerationResponse):
+    """
+    A generation response holding a wheel and the guarantee it achieves.
+
+    Attributes:
+        guarantee (dict): numbers, match, if, tickets, combinations, covered
+                          and guaranteed, as reported by WheelService.
+    """
+
+    def __init__(self, requestId: str, lotteryType: str, tickets: List[Ticket], guarantee: dict):
+        """
+        Args:
+            requestId (str): Unique identifier for the request.
+            lotteryType (str): Name of the lottery type (e.g., "Lotto Max").
+            tickets (List[Ticket]): The wheel's tickets.
+            guarantee (dict): The guarantee reported by WheelService.
+        """
+        super().__init__(requestId, lotteryType, tickets)
+        self.guarantee = guarantee
+
+    def header(self) -> str:
+        """
+        Adds the wheel and its guarantee below the usual header. The lines
+        are not pool lines, so journals holding wheels still parse.
+        """
+        guarantee = self.guarantee
+        share = guarantee["covered"] / guarantee["combinations"]
+        status = "guaranteed" if guarantee["guaranteed"] else f"{share:.2%} of combinations covered"
+        return (
+            f"{super().header()}\n"
+            f"Wheel Numbers: {' '.join(str(number) for number in guarantee['numbers'])}\n"
+            f"Wheel Guarantee: {guarantee['match']} if {guarantee['if']} "
+            f"with {guarantee['tickets']} ticket(s), {status}"
+        )
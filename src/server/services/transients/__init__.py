@@ -4,8 +4,20 @@ Exports application transiets for the lottery system.
 
 from .LotteryType import LotteryType
 from .GenerationResponse import GenerationResponse
+from .CheckResult import CheckResult
+from .BatchGenerationResponse import BatchGenerationResponse
+from .ScheduledGenerationResponse import ScheduledGenerationResponse
+from .WheelResponse import WheelResponse
+from .SimulationResult import SimulationResult
+from .ValidationReport import ValidationReport
 
 __all__ = [
     "LotteryType",
-    "GenerationResponse"
+    "GenerationResponse",
+    "CheckResult",
+    "BatchGenerationResponse",
+    "ScheduledGenerationResponse",
+    "WheelResponse",
+    "SimulationResult",
+    "ValidationReport"
 ]
\ No newline at end of file
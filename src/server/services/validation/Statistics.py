@@ -0,0 +1,120 @@
+from math import exp, lgamma, log, sqrt
+from typing import Sequence, Tuple
+
+
+def gammaQ(a: float, x: float) -> float:
+    """
+    Regularized upper incomplete gamma function Q(a, x) = Γ(a, x) / Γ(a).
+
+    Uses the power series of P(a, x) below x = a + 1 and Lentz's continued
+    fraction for Q(a, x) above it, where each converges quickly.
+    """
+    if a <= 0:
+        raise ValueError("'a' must be positive.")
+    if x <= 0:
+        return 1.0
+    logPrefix = a * log(x) - x - lgamma(a)
+
+    if x < a + 1:
+        term = total = 1.0 / a
+        denominator = a
+        while abs(term) > abs(total) * 1e-15:
+            denominator += 1
+            term *= x / denominator
+            total += term
+        return max(0.0, 1.0 - total * exp(logPrefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    fraction = d
+    step = 1
+    while True:
+        an = -step * (step - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        fraction *= delta
+        if abs(delta - 1) < 1e-15 or step > 100000:
+            return fraction * exp(logPrefix)
+        step += 1
+
+
+def chiSquareSurvival(statistic: float, dof: float) -> float:
+    """
+    P(X >= statistic) for X following a chi-square distribution with `dof`
+    degrees of freedom.
+    """
+    return gammaQ(dof / 2, statistic / 2)
+
+
+def kolmogorovSurvival(distance: float, samples: int) -> float:
+    """
+    P(D >= distance) for the Kolmogorov-Smirnov statistic of `samples`
+    observations, with Stephens' small-sample correction.
+
+    For a discrete distribution the p-value is conservative (too large),
+    so a rejection is still meaningful.
+    """
+    root = sqrt(samples)
+    scaled = (root + 0.12 + 0.11 / root) * distance
+    if scaled < 0.2:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = exp(-2 * j * j * scaled * scaled)
+        total += term if j % 2 else -term
+        if term < 1e-16:
+            break
+    return min(1.0, max(0.0, 2 * total))
+
+
+def pearson(observed: Sequence[int], expected: Sequence[float], minExpected: float = 5.0) -> Tuple[float, int]:
+    """
+    Pearson's chi-square statistic of observed against expected counts.
+
+    Neighbouring cells are merged until each expects at least minExpected
+    observations, as the chi-square approximation requires; the tails of
+    order-statistic distributions are far thinner than that.
+
+    Returns:
+        tuple: (statistic, degrees of freedom)
+    """
+    cells = []
+    pendingObserved = pendingExpected = 0
+    for count, mean in zip(observed, expected):
+        pendingObserved += count
+        pendingExpected += mean
+        if pendingExpected >= minExpected:
+            cells.append((pendingObserved, pendingExpected))
+            pendingObserved = pendingExpected = 0
+    if pendingExpected > 0:
+        if cells:
+            count, mean = cells.pop()
+            cells.append((count + pendingObserved, mean + pendingExpected))
+        else:
+            cells.append((pendingObserved, pendingExpected))
+
+    statistic = sum((count - mean) ** 2 / mean for count, mean in cells)
+    return statistic, len(cells) - 1
+
+
+def kolmogorovDistance(observed: Sequence[int], probabilities: Sequence[float]) -> float:
+    """
+    Largest distance between the empirical and the exact cumulative
+    distribution over ordered cells.
+    """
+    samples = sum(observed)
+    if not samples:
+        return 0.0
+    distance = cumulativeObserved = cumulativeExact = 0.0
+    for count, probability in zip(observed, probabilities):
+        cumulativeObserved += count / samples
+        cumulativeExact += probability
+        distance = max(distance, abs(cumulativeObserved - cumulativeExact))
+    return distance
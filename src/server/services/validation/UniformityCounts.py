@@ -0,0 +1,74 @@
+from ...models.randomness import GENERATORS
+from ..TicketService import TicketService
+from ..WinningCheckService import WinningCheckService
+from ..scoring import TicketIndex
+
+# Generation backends the harness can validate: the named generators of
+# GENERATORS, plus "counter" for seeded (CounterGenerator) batches.
+BACKENDS = tuple(sorted(GENERATORS)) + ("counter",)
+
+
+def countIndex(index: TicketIndex) -> list:
+    """
+    Count the numbers of every indexed ticket, per pool, on whole bitsets.
+
+    Bitset b(x) of number x has bit t set when ticket t holds x, so:
+        - frequency of x is popcount(b(x))
+        - co-occurrence of x < y is popcount(b(x) & b(y))
+        - x sits at sorted position j on the tickets holding exactly j
+          smaller numbers. A bit-sliced counter (one bitset per bit of the
+          count) adds up b(x) over the smaller numbers, and splitting b(x)
+          by the counter's bit planes yields the tickets per position.
+    No step loops over tickets in Python.
+
+    Returns:
+        list: Per pool, a dict with "frequency" (per number), "positions"
+              (per position, per number) and "pairs" (x < y, row by row).
+    """
+    counts = []
+    for poolIndex, pool in enumerate(index.pools):
+        bitsets = [index.bitset(poolIndex, number) for number in range(pool.startNumber, pool.endNumber + 1)]
+        picks = pool.pickCount
+
+        frequency = [bits.bit_count() for bits in bitsets]
+
+        positions = [[0] * len(bitsets) for _ in range(picks)]
+        planes = [0] * picks.bit_length()
+        for number, bits in enumerate(bitsets):
+            groups = [bits]
+            for plane in planes:
+                groups = [group & ~plane for group in groups] + [group & plane for group in groups]
+            for position in range(picks):
+                positions[position][number] = groups[position].bit_count()
+            carry = bits
+            for bit, plane in enumerate(planes):
+                planes[bit], carry = plane ^ carry, plane & carry
+
+        pairs = []
+        for number, bits in enumerate(bitsets):
+            pairs.extend((bits & other).bit_count() for other in bitsets[number + 1:])
+
+        counts.append({"frequency": frequency, "positions": positions, "pairs": pairs})
+    return counts
+
+
+def countChunk(type, backend, ticketCount, seed, chunk):
+    """
+    Generate `ticketCount` tickets with a backend and count their numbers.
+    Runs in a worker process of the ValidationService.
+
+    Every chunk draws from a freshly spawned generator, so forked workers
+    never replay the parent's Mersenne Twister state; "counter" chunks use
+    the seed (seed, chunk) instead.
+
+    Returns:
+        dict: The ticket count and the per-pool counts of countIndex.
+    """
+    service = WinningCheckService()
+    if backend == "counter":
+        tickets = TicketService().iterTickets(type, ticketCount, seed=f"{seed}:validate:{chunk}")
+    else:
+        tickets = TicketService(GENERATORS[backend]().spawn()).iterTickets(type, ticketCount)
+    index = TicketIndex(service.poolsFor(type))
+    index.addTickets(tickets)
+    return {"tickets": index.count, "pools": countIndex(index)}
@@ -0,0 +1,18 @@
+"""
+Exports the uniformity counting worker and the statistical tests used to
+validate generation backends.
+"""
+
+from .UniformityCounts import countChunk, countIndex, BACKENDS
+from .Statistics import gammaQ, chiSquareSurvival, kolmogorovSurvival, pearson, kolmogorovDistance
+
+__all__ = [
+    "countChunk",
+    "countIndex",
+    "BACKENDS",
+    "gammaQ",
+    "chiSquareSurvival",
+    "kolmogorovSurvival",
+    "pearson",
+    "kolmogorovDistance"
+]
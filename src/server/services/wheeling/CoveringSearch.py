@@ -0,0 +1,209 @@
+import random
+import time
+from itertools import combinations
+from math import comb
+
+
+class CoveringSearch:
+    """
+    Searches for a small lotto design: a set of k-element blocks over v
+    elements such that every m-element subset (a "target") shares at least
+    t elements with some block.
+
+    Targets are numbered and every set of targets is a Python int used as a
+    bitset. For each t-subset s of the elements, covers[s] holds the targets
+    containing s, so the targets a block covers are the OR of covers[s]
+    over its C(k, t) t-subsets, and the new targets it would cover are one
+    AND away.
+
+    The search is a randomized greedy: it repeatedly takes the first
+    uncovered target and, among `samples` candidate blocks that cover it,
+    adds the one covering the most uncovered targets. Each candidate is grown
+    greedily from t elements of the target. Then blocks made redundant by
+    later picks are pruned. Restarts run until the time budget
+    is spent and the smallest complete design wins.
+
+    With a deadline, building the incidence bitsets and the first greedy
+    pass raise TimeoutError once it passes, so the cost of a large design
+    is bounded before any wheel exists.
+    """
+
+    # Largest size of the t-subset/target incidence bitsets, in bits.
+    MAX_INCIDENCE_BITS = 2 * 1024 ** 3
+
+    def __init__(self, v, k, t, m=None, samples=8, rng=None, deadline=None):
+        """
+        Args:
+            v (int): Number of elements (the wheeled numbers).
+            k (int): Elements per block (numbers per ticket).
+            t (int): Guaranteed overlap.
+            m (int, optional): Size of the targets; defaults to t.
+            samples (int): Candidate blocks evaluated per greedy step.
+            rng (random.Random, optional): Source of the search's randomness.
+            deadline (float, optional): time.monotonic() value by which the
+                                        first complete design must be found.
+
+        Raises:
+            ValueError: If the parameters are inconsistent or the design is too large.
+            TimeoutError: If building the search passes the deadline.
+        """
+        m = t if m is None else m
+        if not 1 <= t <= m <= k <= v:
+            raise ValueError("A wheel needs 1 <= match <= if <= ticket size <= wheeled numbers.")
+        if comb(v, t) * comb(v, m) > self.MAX_INCIDENCE_BITS:
+            raise ValueError(f"A {t}-if-{m} wheel of {v} numbers is too large to search.")
+
+        self.v, self.k, self.t, self.m = v, k, t, m
+        self.samples = samples
+        self.rng = rng if rng is not None else random.Random(0)
+        self.deadline = deadline
+
+        self.targets = list(combinations(range(v), m))
+        self.full = (1 << len(self.targets)) - 1
+        self.covers = self.__incidence(t)
+
+    def run(self, timeBudget=2.0, maxBlocks=5000):
+        """
+        Search until the time budget is spent. The first greedy pass always
+        completes unless it reaches maxBlocks or the search's deadline.
+
+        Args:
+            timeBudget (float): Seconds to spend on restarts after the first pass.
+            maxBlocks (int): Largest design accepted.
+
+        Returns:
+            tuple: (list of blocks as sorted element tuples, number of targets covered)
+
+        Raises:
+            TimeoutError: If the first pass does not end by the search's deadline.
+        """
+        best, bestCovered = self.__greedy(maxBlocks, self.deadline)
+        if bestCovered < len(self.targets) and self.__expired():
+            raise TimeoutError("No complete wheel was found before the deadline.")
+
+        deadline = time.monotonic() + timeBudget
+        while time.monotonic() < deadline and len(best) > 1:
+            blocks, covered = self.__greedy(len(best) - 1, deadline)
+            if covered == len(self.targets) and len(blocks) < len(best):
+                best, bestCovered = blocks, covered
+        return best, bestCovered
+
+    def coverage(self, block):
+        """
+        Returns:
+            int: Bitset of the targets covered by a block.
+        """
+        covered = 0
+        for subset in combinations(block, self.t):
+            covered |= self.covers[self.__mask(subset)]
+        return covered
+
+    def __greedy(self, maxBlocks, deadline=None):
+        uncovered = self.full
+        blocks = []
+        coverages = []
+        while uncovered and len(blocks) < maxBlocks:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            target = self.targets[(uncovered & -uncovered).bit_length() - 1]
+
+            bestBlock, bestCoverage, bestGain = None, 0, -1
+            for _ in range(self.samples):
+                block, coverage = self.__candidate(target, uncovered)
+                gain = (coverage & uncovered).bit_count()
+                if gain > bestGain:
+                    bestBlock, bestCoverage, bestGain = block, coverage, gain
+
+            blocks.append(bestBlock)
+            coverages.append(bestCoverage)
+            uncovered &= ~bestCoverage
+
+        blocks, coverages = self.__prune(blocks, coverages)
+        covered = 0
+        for coverage in coverages:
+            covered |= coverage
+        return blocks, covered.bit_count()
+
+    def __candidate(self, target, uncovered):
+        """
+        Build a block covering the target: start from t of its elements and
+        add, one at a time, the element whose new t-subsets cover the most
+        uncovered targets (ties broken at random).
+
+        Returns:
+            tuple: (block as a sorted tuple, bitset of the targets it covers)
+        """
+        block = self.rng.sample(target, self.t)
+        coverage = self.covers[self.__mask(block)]
+        while len(block) < self.k:
+            bestElements, bestExtra, bestGain = [], 0, -1
+            for element in range(self.v):
+                if element in block:
+                    continue
+                bit = 1 << element
+                extra = 0
+                for subset in combinations(block, self.t - 1):
+                    extra |= self.covers[self.__mask(subset) | bit]
+                gain = ((coverage | extra) & uncovered).bit_count()
+                if gain > bestGain:
+                    bestElements, bestExtra, bestGain = [element], [extra], gain
+                elif gain == bestGain:
+                    bestElements.append(element)
+                    bestExtra.append(extra)
+            choice = self.rng.randrange(len(bestElements))
+            block.append(bestElements[choice])
+            coverage |= bestExtra[choice]
+        return tuple(sorted(block)), coverage
+
+    @staticmethod
+    def __prune(blocks, coverages):
+        """
+        Drop blocks whose targets are all covered by the other blocks,
+        oldest first, since early greedy picks are the most likely to have
+        been overtaken.
+        """
+        position = 0
+        while position < len(blocks):
+            others = 0
+            for other, coverage in enumerate(coverages):
+                if other != position:
+                    others |= coverage
+            if coverages[position] & ~others:
+                position += 1
+            else:
+                del blocks[position]
+                del coverages[position]
+        return blocks, coverages
+
+    def __incidence(self, size):
+        """
+        Maps the bitmask of every size-element subset to the bitset of the
+        targets containing it.
+        """
+        members = {}
+        for index, target in enumerate(self.targets):
+            if not index & 4095 and self.__expired():
+                raise TimeoutError("The wheel search could not be built before the deadline.")
+            for subset in combinations(target, size):
+                members.setdefault(self.__mask(subset), []).append(index)
+
+        width = (len(self.targets) + 7) // 8
+        incidence = {}
+        for position, (mask, indices) in enumerate(members.items()):
+            if not position & 4095 and self.__expired():
+                raise TimeoutError("The wheel search could not be built before the deadline.")
+            bits = bytearray(width)
+            for index in indices:
+                bits[index >> 3] |= 1 << (index & 7)
+            incidence[mask] = int.from_bytes(bits, "little")
+        return incidence
+
+    def __expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @staticmethod
+    def __mask(elements):
+        mask = 0
+        for element in elements:
+            mask |= 1 << element
+        return mask
@@ -0,0 +1,9 @@
+"""
+Exports the covering-design search behind lottery wheels.
+"""
+
+from .CoveringSearch import CoveringSearch
+
+__all__ = [
+    "CoveringSearch"
+]
@@ -0,0 +1,4 @@
+"""
+Tests of the lottery ticket server and client. Run from the repository root
+with `python -m pytest` or `python -m unittest discover -s tests -t .`
+"""
@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from src.client import GenerateTicketService
+from src.client.sinks import ArchiveResponseSink, ResponseArchive
+from src.client.sinks.ArchiveResponseSink import listSegments
+from tests.support import RecordingLogger
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ArchiveResponseSinkTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testWriteThenLookup(self):
+        responses = {f"r{number}": f"Generation Request ID: r{number}\nticket {number}" for number in range(50)}
+        with ArchiveResponseSink(self.path, flushCount=7) as sink:
+            for requestId, response in responses.items():
+                sink.write(requestId, response)
+
+        archive = ResponseArchive(self.path)
+        self.assertEqual(set(archive.entries()), set(responses))
+        for requestId, response in responses.items():
+            self.assertEqual(archive.lookup(requestId), response)
+
+    def testRollsSegments(self):
+        with ArchiveResponseSink(self.path, maxSegmentBytes=100, flushCount=1) as sink:
+            for number in range(10):
+                sink.write(str(number), "x" * 40)
+
+        self.assertGreater(len(listSegments(self.path)), 1)
+        archive = ResponseArchive(self.path)
+        self.assertEqual([archive.lookup(str(number)) for number in range(10)], ["x" * 40] * 10)
+
+    def testLatestEntryWins(self):
+        with ArchiveResponseSink(self.path) as sink:
+            sink.write("a", "first")
+            sink.write("a", "second")
+        self.assertEqual(ResponseArchive(self.path).lookup("a"), "second")
+
+    def testUnknownRequest(self):
+        with self.assertRaises(KeyError):
+            ResponseArchive(self.path).lookup("missing")
+
+    def testReportsALocationOnlyOnceFlushed(self):
+        sink = ArchiveResponseSink(self.path, flushCount=2)
+        self.assertIsNone(sink.write("a", "one"))
+        self.assertEqual(ResponseArchive(self.path).entries(), {})
+        self.assertEqual(sink.write("b", "two"), f"archive {self.path}")
+        self.assertEqual(set(ResponseArchive(self.path).entries()), {"a", "b"})
+
+    def testFsyncIsOptIn(self):
+        with mock.patch("os.fsync") as fsync:
+            with ArchiveResponseSink(self.path) as sink:
+                sink.write("a", "one")
+            fsync.assert_not_called()
+
+            with ArchiveResponseSink(self.path, fsync=True) as sink:
+                sink.write("b", "two")
+                sink.write("c", "three")
+            # Data and index once for the whole batch.
+            self.assertEqual(fsync.call_count, 2)
+
+
+class ArchiveSaveReportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = RecordingLogger()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testSavedIsReportedAfterTheFlush(self):
+        service = GenerateTicketService(self.logger, ArchiveResponseSink(self.directory.name))
+        service.handleResponse({"requestId": "a"}, "Generation Request ID: a")
+        self.assertEqual(self.logger.infos, [])
+
+        service.close()
+        self.assertEqual(self.logger.infos, [f"Response a saved to archive {self.directory.name}"])
+        self.assertEqual(ResponseArchive(self.directory.name).lookup("a"), "Generation Request ID: a")
+
+    def testFailedFlushIsReported(self):
+        sink = ArchiveResponseSink(self.directory.name)
+        service = GenerateTicketService(self.logger, sink)
+        service.handleResponse({"requestId": "a"}, "Generation Request ID: a")
+
+        with mock.patch.object(sink, "flush", side_effect=OSError("disk full")):
+            service.close()
+        self.assertEqual(self.logger.infos, [])
+        self.assertEqual(self.logger.errors, ["Response a was not saved: disk full"])
+
+
+class ArchiveCommandTest(unittest.TestCase):
+    def testListAndExtract(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with ArchiveResponseSink(directory) as sink:
+                sink.write("abc", "Generation Request ID: abc")
+
+            def run(*args):
+                return subprocess.run([sys.executable, "-m", "src.client.archive", "--dir", directory, *args],
+                                      cwd=ROOT, capture_output=True, text=True)
+
+            listed = run("list")
+            self.assertEqual(listed.stdout.split("\t")[:2], ["abc", "archive-000001.dat"])
+
+            output = os.path.join(directory, "extracted")
+            self.assertEqual(run("extract", "abc", "-o", output).returncode, 0)
+            with open(os.path.join(output, "ticket_abc.txt")) as f:
+                self.assertEqual(f.read(), "Generation Request ID: abc")
+
+            missing = run("extract", "nope")
+            self.assertEqual(missing.returncode, 1)
+            self.assertIn("not found", missing.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import unittest
+from unittest import mock
+from src.client import AsyncTicketClient, TicketRequestError
+from src.client.aio.HttpConnection import HttpConnection
+from tests.support import freePort, runningGateway
+
+
+class CountingOpen:
+    """
+    Wraps HttpConnection.open to count the connections a client opens.
+    """
+
+    def __init__(self):
+        self.opened = 0
+        self.original = HttpConnection.open
+
+    async def __call__(self, *args, **kwargs):
+        self.opened += 1
+        return await self.original(*args, **kwargs)
+
+
+class AsyncTicketClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.running = runningGateway(chunkThreshold=4096, keepAliveTimeout=0.2)
+        cls.gateway, cls.port = cls.running.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.running.__exit__(None, None, None)
+
+    def setUp(self):
+        self.opens = CountingOpen()
+        patcher = mock.patch.object(HttpConnection, "open", self.opens)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testConcurrentRequestsShareAFewConnections(self):
+        async def main():
+            async with AsyncTicketClient("localhost", self.port, maxConnections=3) as client:
+                return await asyncio.gather(*(client.generate("max", f"c{number}", 2) for number in range(20)))
+
+        responses = asyncio.run(main())
+        for number, response in enumerate(responses):
+            self.assertTrue(response.startswith(f"Generation Request ID: c{number}\n"))
+            self.assertEqual(response.count("Lotto Max Numbers:"), 2)
+        self.assertLessEqual(self.opens.opened, 3)
+
+    def testChunkedAndCompressedResponses(self):
+        async def main():
+            async with AsyncTicketClient("localhost", self.port, acceptEncoding="gzip") as client:
+                large = await client.generate("grand", "large", 3000)
+                small = await client.request({"type": "max", "requestId": "seeded", "count": 5, "seed": 1})
+                return large, small
+
+        large, small = asyncio.run(main())
+        self.assertEqual(large.count("Grand Number:"), 3000)
+        self.assertEqual(small.count("Lotto Max Numbers:"), 5)
+        self.assertEqual(self.opens.opened, 1)
+
+    def testRejectedRequests(self):
+        async def main():
+            async with AsyncTicketClient("localhost", self.port) as client:
+                with self.assertRaises(TicketRequestError) as raised:
+                    await client.generate("nope", "bad")
+                # The connection stays usable after an error response.
+                return raised.exception, await client.generate("lottario", "after")
+
+        error, response = asyncio.run(main())
+        self.assertEqual(error.status, 400)
+        self.assertIn("nope", str(error))
+        self.assertTrue(response.startswith("Generation Request ID: after"))
+
+    def testConnectionClosedWhileIdleIsReplaced(self):
+        async def main():
+            async with AsyncTicketClient("localhost", self.port, idleTimeout=60) as client:
+                await client.generate("max", "first")
+                # Past the gateway's keep-alive, which closes the idle connection.
+                await asyncio.sleep(0.4)
+                return await client.generate("max", "second")
+
+        self.assertTrue(asyncio.run(main()).startswith("Generation Request ID: second"))
+        self.assertEqual(self.opens.opened, 2)
+
+    def testWrittenRequestIsNotResent(self):
+        received = []
+
+        async def answerOnce(reader, writer):
+            # Answers the first request, then closes after reading the second.
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(next(line.split(b":")[1] for line in head.split(b"\r\n")
+                                  if line.lower().startswith(b"content-length")))
+                received.append(await reader.readexactly(length))
+                if len(received) > 1:
+                    writer.close()
+                    return
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+
+        async def main():
+            server = await asyncio.start_server(answerOnce, "localhost", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server, AsyncTicketClient("localhost", port) as client:
+                first = await client.request({"requestId": "1"})
+                with self.assertRaises(ConnectionError):
+                    await client.request({"requestId": "2"})
+                return first
+
+        self.assertEqual(asyncio.run(main()), "ok")
+        self.assertEqual(len(received), 2)
+        self.assertEqual(self.opens.opened, 1)
+
+    def testHealth(self):
+        async def main():
+            async with AsyncTicketClient("localhost", self.port) as up, \
+                    AsyncTicketClient("localhost", freePort(), connectTimeout=1) as down:
+                return await up.health(), await down.health()
+
+        self.assertEqual(asyncio.run(main()), (True, False))
+
+    def testClosedClientRefusesRequests(self):
+        async def main():
+            client = AsyncTicketClient("localhost", self.port)
+            await client.close()
+            with self.assertRaises(RuntimeError):
+                await client.generate("max", "late")
+
+        asyncio.run(main())
+        for options in ({"maxConnections": 0}, {"acceptEncoding": "br"}):
+            with self.assertRaises(ValueError):
+                AsyncTicketClient(**options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.client import GenerateTicketService
+from src.client.sinks import FileResponseSink
+from tests.support import RecordingLogger
+
+
+class HandleResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = RecordingLogger()
+        self.service = GenerateTicketService(self.logger, FileResponseSink(self.directory.name))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testSavesValidResponses(self):
+        self.service.handleResponse({"requestId": "a"}, "Generation Request ID: a\n")
+        with open(os.path.join(self.directory.name, "ticket_a.txt")) as f:
+            self.assertEqual(f.read(), "Generation Request ID: a")
+        self.assertIn("saved", self.logger.infos[-1])
+
+    def testEmptyResponseIsAnError(self):
+        self.service.handleResponse({"requestId": "a"}, "  \n")
+        self.assertEqual(os.listdir(self.directory.name), [])
+        self.assertIn("without a response", self.logger.errors[-1])
+        self.assertEqual(self.logger.infos, [])
+
+    def testServerErrorIsNotSaved(self):
+        self.service.handleResponse({"requestId": "a"}, "[Error] Unknown lottery type: 'x'")
+        self.assertEqual(os.listdir(self.directory.name), [])
+        self.assertEqual(self.logger.errors[-1], "Unknown lottery type: 'x'")
+
+    def testPromptsBeforeConnecting(self):
+        from src.client import main
+
+        calls = []
+        with mock.patch.object(main, "parseArgs", return_value=mock.Mock(
+                endpoint=[], retries=None, breaker_threshold=None, sink="files", compress=None)), \
+                mock.patch.object(main, "createTransport", return_value=None), \
+                mock.patch.object(main.GenerateTicketService, "promptRequest",
+                                  side_effect=lambda: calls.append("prompt") or {"requestId": "a"}), \
+                mock.patch.object(main.ConnectionService, "connect",
+                                  side_effect=lambda: calls.append("connect")), \
+                mock.patch.object(main.ConnectionService, "sendJson", return_value="[Error] x"), \
+                mock.patch.object(main, "LoggingService", RecordingLogger):
+            main.main()
+        self.assertEqual(calls, ["prompt", "connect"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import contextlib
+import io
+import socket
+import sys
+import unittest
+from unittest import mock
+from src.client import ConnectionService, main
+from src.server.presentation.socket.transports import TcpTransport
+from tests.support import RecordingLogger, freePort
+
+
+def parseArgs(*argv):
+    with mock.patch.object(sys, "argv", ["client", *argv]):
+        return main.parseArgs()
+
+
+class TcpOptionsTest(unittest.TestCase):
+    def testOptionsReachTheTransport(self):
+        transport = main.createTransport(parseArgs("--port", "5000", "--nodelay", "--sndbuf", "65536",
+                                                   "--rcvbuf", "131072"))
+        self.assertEqual((transport.port, transport.noDelay, transport.fastOpen), (5000, True, False))
+        self.assertEqual((transport.sendBufferSize, transport.receiveBufferSize), (65536, 131072))
+
+        endpoint, = parseArgs("--endpoint", "[::1]:5001", "--rcvbuf", "4096").endpoint
+        self.assertEqual((endpoint.host, endpoint.receiveBufferSize), ("::1", 4096))
+
+    def testOptionsRejectedWithUnixSockets(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as exit:
+            parseArgs("--unix", "/tmp/daemon.sock", "--nodelay")
+        self.assertEqual(exit.exception.code, 2)
+
+    def testPromptedPortUsesTheOptions(self):
+        port = freePort()
+        listener = TcpTransport(port).listen(1)
+        service = ConnectionService(RecordingLogger(), tcpOptions={"noDelay": True})
+        try:
+            with mock.patch.object(ConnectionService, "_ConnectionService__getValidPort", return_value=port):
+                service.connect()
+            with service.socket:
+                self.assertTrue(service.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        finally:
+            listener.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
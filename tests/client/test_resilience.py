@@ -0,0 +1,141 @@
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+import zlib
+from src.client import ConnectionService
+from src.client.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from src.client.transports import UnixTransport
+from tests.support import RecordingLogger, runningDaemon, scriptedServer
+
+NO_DELAY = RetryPolicy(maxAttempts=3, baseDelay=0, maxDelay=0, connectTimeout=1, readTimeout=5)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def testTransitions(self):
+        breaker = CircuitBreaker(failureThreshold=2, resetTimeout=0.05)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        breaker.before()
+        breaker.recordFailure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before()
+        breaker.recordFailure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertGreater(breaker.remaining(), 0)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before()
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before()
+        # Only one trial at a time while half-open.
+        with self.assertRaises(CircuitOpenError):
+            breaker.before()
+        breaker.recordFailure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.06)
+        breaker.before()
+        breaker.recordSuccess()
+        self.assertEqual((breaker.state, breaker.failures, breaker.remaining()), (CircuitBreaker.CLOSED, 0, 0.0))
+
+    def testSuccessResetsTheFailureCount(self):
+        breaker = CircuitBreaker(failureThreshold=2)
+        breaker.recordFailure()
+        breaker.recordSuccess()
+        breaker.recordFailure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def testRejectsInvalidSettings(self):
+        for options in ({"failureThreshold": 0}, {"resetTimeout": 0}):
+            with self.assertRaises(ValueError):
+                CircuitBreaker(**options)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def testFullJitterStaysWithinTheBound(self):
+        policy = RetryPolicy(baseDelay=0.1, maxDelay=0.5, multiplier=2, rng=random.Random(1))
+        for attempt, bound in ((0, 0.1), (1, 0.2), (2, 0.4), (3, 0.5), (10, 0.5)):
+            delays = [policy.delay(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= delay <= bound for delay in delays))
+            self.assertGreater(max(delays), bound * 0.8)
+
+    def testRejectsInvalidSettings(self):
+        for options in ({"maxAttempts": 0}, {"baseDelay": -1}, {"baseDelay": 2, "maxDelay": 1},
+                        {"multiplier": 0.5}, {"connectTimeout": 0}, {"readTimeout": 0}):
+            with self.assertRaises(ValueError):
+                RetryPolicy(**options)
+
+
+class ConnectionServiceRetryTest(unittest.TestCase):
+    def testTruncatedResponseIsNotRetried(self):
+        # The daemon may have served the request, so it is not sent again.
+        with scriptedServer([b"Generation Request ID: t\nTicket"]) as (path, requests):
+            logger = RecordingLogger()
+            service = ConnectionService(logger, UnixTransport(path), retryPolicy=NO_DELAY)
+            with self.assertRaisesRegex(ConnectionError, "truncated"):
+                service.request({"type": "max", "requestId": "t"})
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(json.loads(requests[0])["trailer"], "\n[End]\n")
+        self.assertTrue(any("Not retrying" in message for message in logger.errors))
+
+    def testTruncatedCompressedResponseIsNotRetried(self):
+        stream = zlib.compress(b"Generation Request ID: z\n" * 200)
+        with scriptedServer([stream[:len(stream) // 2]]) as (path, requests):
+            breaker = CircuitBreaker(failureThreshold=5)
+            service = ConnectionService(RecordingLogger(), UnixTransport(path), "zlib", retryPolicy=NO_DELAY,
+                                        circuitBreaker=breaker)
+            with self.assertRaisesRegex(ConnectionError, "truncated"):
+                service.request({"type": "max", "requestId": "z"})
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(breaker.failures, 1)
+
+    def testConnectFailuresAreRetried(self):
+        with scriptedServer([b"Generation Request ID: c\n\n[End]\n"]) as (path, requests):
+            transport = UnixTransport(path)
+            connect = transport.connect
+            calls = []
+
+            def flakyConnect(timeout=None):
+                calls.append(timeout)
+                if len(calls) == 1:
+                    raise ConnectionRefusedError("not yet")
+                return connect(timeout)
+
+            transport.connect = flakyConnect
+            service = ConnectionService(RecordingLogger(), transport, retryPolicy=NO_DELAY)
+            self.assertEqual(service.request({"type": "max", "requestId": "c"}), "Generation Request ID: c\n")
+        self.assertEqual((len(calls), len(requests)), (2, 1))
+
+    def testErrorResponsesAreAnswers(self):
+        with scriptedServer([b"[Error] Unknown lottery type\n[End]\n"]) as (path, requests):
+            service = ConnectionService(RecordingLogger(), UnixTransport(path), "gzip", retryPolicy=NO_DELAY)
+            self.assertEqual(service.request({"type": "x", "requestId": "e"}), "[Error] Unknown lottery type")
+
+    def testBreakerOpensWhileTheDaemonIsDown(self):
+        with tempfile.TemporaryDirectory() as directory:
+            transport = UnixTransport(os.path.join(directory, "down.sock"))
+            breaker = CircuitBreaker(failureThreshold=3, resetTimeout=60)
+            service = ConnectionService(RecordingLogger(), transport, retryPolicy=NO_DELAY, circuitBreaker=breaker)
+
+            with self.assertRaises(OSError):
+                service.request({"type": "max", "requestId": "d"})
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+            with self.assertRaises(CircuitOpenError):
+                service.request({"type": "max", "requestId": "d"})
+
+    def testRequestAgainstTheDaemon(self):
+        with runningDaemon() as (daemon, path):
+            service = ConnectionService(RecordingLogger(), UnixTransport(path), retryPolicy=NO_DELAY)
+            response = service.request({"type": "lottario", "requestId": "live", "count": 3})
+        self.assertEqual(response.count("Lottario Numbers:"), 3)
+        self.assertFalse(response.endswith("[End]\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+from src.client import NoEndpointError, ShardedConnectionService
+from src.client.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from src.client.sharding import HashRing
+from src.client.transports import UnixTransport
+from src.server.presentation import AccessLogger
+from tests.support import RecordingLogger, runningDaemon, scriptedServer
+
+KEYS = [f"request-{number}" for number in range(3000)]
+
+
+class HashRingTest(unittest.TestCase):
+    def testPreferenceCoversEveryEndpointOnce(self):
+        ring = HashRing(["a", "b", "c", "d"])
+        for key in KEYS[:100]:
+            order = list(ring.preference(key))
+            self.assertEqual(sorted(order), [0, 1, 2, 3])
+            self.assertEqual(order, list(HashRing(["a", "b", "c", "d"]).preference(key)))
+
+    def testKeysSpreadEvenly(self):
+        ring = HashRing(["a", "b", "c", "d"])
+        owners = Counter(next(ring.preference(key)) for key in KEYS)
+        for position in range(4):
+            self.assertGreater(owners[position], len(KEYS) / 4 * 0.7)
+
+    def testAddingAnEndpointOnlyMovesKeysToIt(self):
+        before = HashRing(["a", "b", "c"])
+        after = HashRing(["a", "b", "c", "d"])
+        moved = 0
+        for key in KEYS:
+            owner = after.endpoints[next(after.preference(key))]
+            if owner != before.endpoints[next(before.preference(key))]:
+                self.assertEqual(owner, "d")
+                moved += 1
+        self.assertLess(moved, len(KEYS) * 0.35)
+
+    def testRejectsInvalidRings(self):
+        for endpoints, virtualNodes in (([], 10), (["a", "a"], 10), (["a"], 0)):
+            with self.assertRaises(ValueError):
+                HashRing(endpoints, virtualNodes)
+
+
+class ShardedConnectionServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.missing = UnixTransport(os.path.join(self.directory.name, "missing.sock"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testFailsOverToTheNextEndpoint(self):
+        with runningDaemon() as (daemon, path):
+            logger = RecordingLogger()
+            service = ShardedConnectionService(logger, [self.missing, UnixTransport(path)])
+            key = next(key for key in KEYS if next(service.ring.preference(key)) == 0)
+
+            response = service.sendJson({"type": "max", "requestId": key})
+            self.assertTrue(response.startswith(f"Generation Request ID: {key}"))
+            self.assertEqual(service.healthy(), [f"unix:{path}"])
+            self.assertEqual(len(logger.errors), 1)
+
+            # The unhealthy owner is now tried last.
+            service.sendJson({"type": "max", "requestId": key})
+            self.assertEqual(len(logger.errors), 1)
+
+    def testRequestSentIsNotFailedOver(self):
+        with runningDaemon() as (daemon, path), \
+                scriptedServer([b"Generation Request ID: "]) as (scriptedPath, requests):
+            logger = RecordingLogger()
+            service = ShardedConnectionService(logger, [UnixTransport(scriptedPath), UnixTransport(path)],
+                                               retryPolicy=RetryPolicy(3, 0, 0))
+            key = next(key for key in KEYS if next(service.ring.preference(key)) == 0)
+
+            with self.assertRaisesRegex(ConnectionError, "truncated") as raised:
+                service.sendJson({"type": "max", "requestId": key})
+
+        self.assertNotIsInstance(raised.exception, NoEndpointError)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(service.healthy(), [f"unix:{path}"])
+        self.assertFalse(any("retrying" in message for message in logger.errors))
+
+    def testProbesStayOutOfTheAccessLog(self):
+        log = os.path.join(self.directory.name, "access.log")
+        with runningDaemon(accessLog=AccessLogger(log)) as (daemon, path):
+            logger = RecordingLogger()
+            service = ShardedConnectionService(logger, [UnixTransport(path), self.missing])
+            service.connect()
+            service.close()
+            service.sendJson({"type": "max", "requestId": "logged"})
+
+        self.assertIn("1 of 2 endpoint(s) reachable.\n", logger.infos)
+        with open(log) as f:
+            self.assertEqual([json.loads(line)["requestId"] for line in f], ["logged"])
+
+    def testRetriesRoundsAndOpensTheBreaker(self):
+        logger = RecordingLogger()
+        breaker = CircuitBreaker(failureThreshold=2, resetTimeout=60)
+        service = ShardedConnectionService(logger, [self.missing], retryPolicy=RetryPolicy(3, 0, 0),
+                                           circuitBreaker=breaker)
+
+        with self.assertRaises(CircuitOpenError):
+            service.sendJson({"type": "max", "requestId": "r"})
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(sum("retrying" in message for message in logger.errors), 2)
+
+    def testRetryReachesAnEndpointThatComesBack(self):
+        with runningDaemon() as (daemon, path):
+            transport = UnixTransport(path)
+            connect = transport.connect
+            calls = []
+
+            def flakyConnect(timeout):
+                calls.append(timeout)
+                if len(calls) == 1:
+                    raise ConnectionRefusedError("not yet")
+                return connect(timeout)
+
+            transport.connect = flakyConnect
+            breaker = CircuitBreaker(failureThreshold=5)
+            service = ShardedConnectionService(RecordingLogger(), [transport], retryPolicy=RetryPolicy(3, 0, 0),
+                                               circuitBreaker=breaker)
+            response = service.sendJson({"type": "grand", "requestId": "back"})
+
+        self.assertTrue(response.startswith("Generation Request ID: back"))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((breaker.state, breaker.failures), (CircuitBreaker.CLOSED, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,3 @@
+"""
+Tests of the lottery ticket server.
+"""
@@ -0,0 +1,170 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from src.server.presentation import AccessLogger
+from tests.support import runningDaemon, exchange
+
+
+def readRecords(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class Blocker:
+    """
+    Holds the writer thread up while it serializes a record.
+    """
+
+    def __init__(self):
+        self.released = threading.Event()
+
+    def __str__(self):
+        self.released.wait(5)
+        return "released"
+
+
+class AccessLoggerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "access.log")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testWritesOneJsonObjectPerRecord(self):
+        logger = AccessLogger(self.path)
+        logger.start()
+        for number in range(100):
+            logger.log({"status": "ok", "requestId": str(number)})
+        logger.close()
+
+        self.assertEqual([record["requestId"] for record in readRecords(self.path)],
+                         [str(number) for number in range(100)])
+        self.assertEqual(logger.written, 100)
+
+    def testSamplingKeepsEveryFailure(self):
+        logger = AccessLogger(self.path, sampleRate=0.0)
+        logger.start()
+        for status in ("ok", "error", "ok", "timeout", "ok"):
+            logger.log({"status": status})
+        logger.close()
+
+        self.assertEqual([record["status"] for record in readRecords(self.path)], ["error", "timeout"])
+        self.assertEqual(logger.sampledOut, 3)
+
+    def testRotatesBySize(self):
+        logger = AccessLogger(self.path, maxBytes=1024, backupCount=2)
+        # Records queued before start() are written as one batch, which is
+        # then past maxBytes and rotated.
+        for batch in range(5):
+            for number in range(batch * 20, batch * 20 + 20):
+                logger.log({"status": "ok", "requestId": f"{number:04d}", "padding": "x" * 40})
+            logger.start()
+            logger.close()
+
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertEqual(os.path.getsize(self.path), 0)
+        kept = readRecords(self.path + ".2") + readRecords(self.path + ".1")
+        self.assertEqual([record["requestId"] for record in kept], [f"{number:04d}" for number in range(60, 100)])
+
+    def testFullQueueDropsAndReports(self):
+        logger = AccessLogger(self.path, queueSize=2)
+        for number in range(5):
+            logger.log({"status": "error", "requestId": str(number)})
+        self.assertEqual(logger.dropped, 3)
+        logger.start()
+        logger.close()
+
+        records = readRecords(self.path)
+        self.assertEqual([record.get("requestId") for record in records[:2]], ["0", "1"])
+        self.assertEqual(records[-1]["event"], "access_log_dropped")
+        self.assertEqual(records[-1]["dropped"], 3)
+
+    def testWriteErrorsDoNotStopTheWriter(self):
+        # A directory in place of the file makes every open fail.
+        os.mkdir(self.path)
+        logger = AccessLogger(self.path, flushInterval=0.05)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for number in range(3):
+                logger.log({"status": "error", "requestId": f"lost{number}"})
+            logger.start()
+            deadline = time.monotonic() + 5
+            while not logger.writeErrors and time.monotonic() < deadline:
+                time.sleep(0.01)
+            os.rmdir(self.path)
+            logger.log({"status": "error", "requestId": "kept"})
+            logger.close()
+
+        self.assertGreaterEqual(logger.writeErrors, 1)
+        self.assertEqual(output.getvalue().count("failed"), 1)
+        records = readRecords(self.path)
+        self.assertEqual([record.get("requestId") for record in records], ["kept", None])
+        self.assertEqual(records[-1]["event"], "access_log_dropped")
+        self.assertEqual(records[-1]["dropped"], 3)
+
+    def testCloseDoesNotBlockOnAFullQueue(self):
+        blocker = Blocker()
+        logger = AccessLogger(self.path, queueSize=2)
+        logger.start()
+        logger.log({"status": "error", "blocker": blocker})
+        deadline = time.monotonic() + 5
+        while not logger._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        logger.log({"status": "error", "requestId": "1"})
+        logger.log({"status": "error", "requestId": "2"})
+        writer = logger._thread
+
+        started = time.monotonic()
+        with contextlib.redirect_stdout(io.StringIO()):
+            logger.close(timeout=0.1)
+        self.assertLess(time.monotonic() - started, 1)
+
+        # Once unblocked, the writer empties the queue and stops.
+        blocker.released.set()
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual([record.get("requestId") for record in readRecords(self.path)], [None, "1", "2"])
+
+    def testFileIsNotWorldReadable(self):
+        previous = os.umask(0)
+        try:
+            logger = AccessLogger(self.path)
+            logger.log({"status": "ok"})
+            logger.start()
+            logger.close()
+        finally:
+            os.umask(previous)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    def testRejectsInvalidSettings(self):
+        for options in ({"maxBytes": 0}, {"queueSize": 0}, {"backupCount": -1}, {"sampleRate": 1.5}):
+            with self.assertRaises(ValueError):
+                AccessLogger(self.path, **options)
+
+
+class DaemonAccessLogTest(unittest.TestCase):
+    def testProbesAreNotLogged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "access.log")
+            with runningDaemon(accessLog=AccessLogger(path)) as (daemon, socketPath):
+                for _ in range(3):
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                        sock.connect(socketPath)
+                exchange(socketPath, json.dumps({"type": "max", "requestId": "a"}).encode() + b"\n")
+                exchange(socketPath, b"{broken\n")
+
+            records = readRecords(path)
+
+        self.assertEqual(sorted((record["status"], record.get("requestId")) for record in records),
+                         [("error", None), ("ok", "a")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import http.client
+import json
+import unittest
+from src.server.presentation import GenerateBatchController, GenerateTicketController
+from src.server.presentation.GenerateBatchController import MAX_BATCH_ITEMS
+from tests.support import runningDaemon, runningGateway, exchange
+
+BATCH = {"batch": [
+    {"type": "max", "requestId": "a", "count": 3},
+    {"type": "nope", "requestId": "b"},
+    {"type": "grand", "requestId": "c", "count": 2},
+    "not an object",
+    {"type": "max", "count": 1},
+    {"type": "lottario", "requestId": "d", "count": 0},
+    {"type": "max", "requestId": "e", "wheel": {"numbers": [1, 2, 3], "match": 2}},
+    {"type": "max", "requestId": "f", "count": 2},
+]}
+
+
+class GenerateBatchControllerTest(unittest.TestCase):
+    def testReportsEveryItemInOrder(self):
+        results = GenerateBatchController.fromRequest(BATCH).execute().toDict()["results"]
+
+        self.assertEqual([result["index"] for result in results], list(range(len(BATCH["batch"]))))
+        self.assertEqual([result["status"] for result in results],
+                         ["ok", "error", "ok", "error", "error", "error", "error", "ok"])
+        self.assertEqual([result["requestId"] for result in results], ["a", "b", "c", None, None, "d", "e", "f"])
+
+        self.assertEqual(results[0]["response"].count("Lotto Max Numbers:"), 3)
+        self.assertEqual(results[2]["response"].count("Grand Number:"), 2)
+        self.assertEqual(results[7]["response"].count("Lotto Max Numbers:"), 2)
+        self.assertIn("nope", results[1]["error"])
+        self.assertEqual(results[3]["error"], "Request must be a JSON object")
+        self.assertEqual(results[4]["error"], "Missing field: 'requestId'")
+        self.assertEqual(results[5]["error"], "'count' must be at least 1")
+        self.assertIn("must be sent on its own", results[6]["error"])
+
+    def testSeededItemsMatchSingleRequests(self):
+        batch = {"batch": [{"type": "max", "requestId": "s", "count": 10, "seed": 4, "offset": 5}]}
+        result = GenerateBatchController.fromRequest(batch).execute().toDict()["results"][0]
+        single = GenerateTicketController.fromRequest(batch["batch"][0]).execute()
+        self.assertEqual(result["response"], str(single))
+
+    def testRejectsInvalidEnvelopes(self):
+        for batch in ([], "x", [{}] * (MAX_BATCH_ITEMS + 1)):
+            with self.assertRaises(ValueError):
+                GenerateBatchController.fromRequest({"batch": batch})
+
+
+class BatchOverTheWireTest(unittest.TestCase):
+    def testGatewayAnswersWithJson(self):
+        with runningGateway() as (gateway, port):
+            connection = http.client.HTTPConnection("localhost", port, timeout=10)
+            connection.request("POST", "/tickets", json.dumps(BATCH))
+            response = connection.getresponse()
+            body = response.read()
+            connection.close()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Content-Type"), "application/json")
+        results = json.loads(body)["results"]
+        self.assertEqual([result["status"] for result in results].count("ok"), 3)
+
+    def testDaemonAnswersWithJson(self):
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, json.dumps(BATCH).encode() + b"\n")
+        self.assertEqual(len(json.loads(response)["results"]), len(BATCH["batch"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+from src.server.models import Pool
+from src.server.presentation import GenerateTicketController
+from src.server.services.export import ColumnarTicketReader, ColumnarTicketWriter
+from src.server.services.export.ColumnarTicketWriter import HEADER_BYTES
+
+
+class ColumnarExportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tickets.npy")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testExportMatchesGeneratedTickets(self):
+        request = {"type": "grand", "requestId": "x", "count": 300, "seed": 9, "offset": 4}
+        written = GenerateTicketController.fromRequest(request).export(self.path)
+        expected = [ticket.numbers for ticket in GenerateTicketController.fromRequest(request).execute().tickets]
+
+        # The offset skips into the requested count, like a second page.
+        self.assertEqual(written, 296)
+        with open(self.path + ".json") as f:
+            sidecar = json.load(f)
+        self.assertEqual((sidecar["rows"], sidecar["dtype"], sidecar["requestId"]), (296, "|u1", "x"))
+        pickCounts = [pool["pick"] for pool in sidecar["pools"]]
+
+        with ColumnarTicketReader(self.path) as reader:
+            self.assertEqual(len(reader), 296)
+            self.assertEqual(list(reader.iterNumbers(pickCounts)), expected)
+            self.assertEqual(reader.numbers(-1, pickCounts), expected[-1])
+            with self.assertRaises(IndexError):
+                reader.row(296)
+
+    def testWidePoolsUseSixteenBits(self):
+        pools = [Pool("Main", 1, 1000, 3), Pool("Bonus", 1, 10, 1)]
+        rows = [[[1, 500, 1000], [7]], [[2, 256, 999], [10]]]
+        with ColumnarTicketWriter(self.path, pools, bufferRows=1) as writer:
+            writer.writeTickets(rows)
+            with self.assertRaises(ValueError):
+                writer.write([[1, 2], [3]])
+
+        self.assertEqual(os.path.getsize(self.path), HEADER_BYTES + 2 * 4 * 2)
+        with ColumnarTicketReader(self.path) as reader:
+            self.assertEqual(list(reader.iterNumbers([3, 1])), rows)
+
+    def testEmptyExportAndBadFiles(self):
+        ColumnarTicketWriter(self.path, [Pool("Main", 1, 49, 6)]).close()
+        with ColumnarTicketReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+
+        with open(self.path, "wb") as f:
+            f.write(b"not numpy at all")
+        with self.assertRaises(ValueError):
+            ColumnarTicketReader(self.path)
+
+    def testFailedExportLeavesNoFiles(self):
+        pools = [Pool("Main", 1, 49, 6)]
+        with ColumnarTicketWriter(self.path, pools) as writer:
+            writer.write([[1, 2, 3, 4, 5, 6]])
+
+        with self.assertRaises(ValueError):
+            with ColumnarTicketWriter(self.path, pools, bufferRows=1) as writer:
+                writer.write([[1, 2, 3, 4, 5, 6]])
+                writer.write([[1, 2, 3]])
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import gzip
+import http.client
+import json
+import unittest
+import zlib
+from src.client import ConnectionService
+from src.client.transports import UnixTransport
+from src.server.presentation import ResponseEncoder
+from src.server.presentation.http import HttpGateway
+from tests.support import RecordingLogger, runningDaemon, runningGateway, exchange
+
+TEXT = ["Generation Request ID: a\n", "Lotto Max Numbers: 1 2 3 4 5 6 7\n" * 500, "", "end\n"]
+
+
+class ResponseEncoderTest(unittest.TestCase):
+    def testIdentity(self):
+        self.assertEqual(b"".join(ResponseEncoder().encode(TEXT)), "".join(TEXT).encode())
+
+    def testGzipAndZlibRoundTrip(self):
+        self.assertEqual(gzip.decompress(b"".join(ResponseEncoder("gzip").encode(TEXT))), "".join(TEXT).encode())
+        self.assertEqual(zlib.decompress(b"".join(ResponseEncoder("zlib").encode(TEXT))), "".join(TEXT).encode())
+
+    def testCompressesRepetitiveTickets(self):
+        self.assertLess(len(b"".join(ResponseEncoder("gzip").encode(TEXT))), len("".join(TEXT)) // 5)
+
+    def testFromRequest(self):
+        self.assertEqual(ResponseEncoder.fromRequest({}).encoding, "identity")
+        self.assertEqual(ResponseEncoder.fromRequest({"accept_encoding": "GZIP"}).encoding, "gzip")
+        self.assertEqual(ResponseEncoder.fromRequest({"accept_encoding": ["br", "zlib", "gzip"]}).encoding, "zlib")
+        for accepted in ("br", [], 5):
+            with self.assertRaises(ValueError):
+                ResponseEncoder.fromRequest({"accept_encoding": accepted})
+        with self.assertRaises(ValueError):
+            ResponseEncoder("gzip", level=10)
+
+    def testTrailerEndsOnlyUncompressedResponses(self):
+        encoder = ResponseEncoder.fromRequest({"trailer": "\n[End]\n"})
+        self.assertEqual(b"".join(encoder.encode(TEXT)), "".join(TEXT).encode() + b"\n[End]\n")
+        encoder = ResponseEncoder.fromRequest({"trailer": "\n[End]\n", "accept_encoding": "zlib"})
+        self.assertEqual(zlib.decompress(b"".join(encoder.encode(TEXT))), "".join(TEXT).encode())
+        for trailer in ("", "x" * 65, True):
+            with self.assertRaises(ValueError):
+                ResponseEncoder.fromRequest({"trailer": trailer})
+
+
+class NegotiationTest(unittest.TestCase):
+    def testAcceptEncoding(self):
+        cases = {
+            "": "identity",
+            "gzip, deflate": "gzip",
+            "deflate": "zlib",
+            "gzip;q=0, deflate": "zlib",
+            "*": "gzip",
+            "br": "identity",
+        }
+        for header, encoding in cases.items():
+            self.assertEqual(HttpGateway.negotiateEncoding({"accept-encoding": header}), encoding, header)
+
+
+class CompressedResponsesTest(unittest.TestCase):
+    def testGatewayGzip(self):
+        with runningGateway(chunkThreshold=4096) as (gateway, port):
+            connection = http.client.HTTPConnection("localhost", port, timeout=10)
+            for count in (1, 5000):
+                connection.request("POST", "/tickets", json.dumps({"type": "max", "requestId": "g", "count": count}),
+                                   {"Accept-Encoding": "gzip"})
+                response = connection.getresponse()
+                body = gzip.decompress(response.read())
+                self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+                self.assertEqual(body.count(b"Lotto Max Numbers:"), count)
+            connection.close()
+
+    def testDaemonCompressesForTheClient(self):
+        with runningDaemon() as (daemon, path):
+            raw = exchange(path, json.dumps({"type": "max", "requestId": "z", "count": 50,
+                                             "accept_encoding": "zlib"}).encode() + b"\n")
+            self.assertEqual(zlib.decompress(raw).count(b"Lotto Max Numbers:"), 50)
+
+            for encoding in ("gzip", "zlib"):
+                service = ConnectionService(RecordingLogger(), UnixTransport(path), encoding)
+                service.socket = service.transport.connect(5)
+                response = service.sendJson({"type": "grand", "requestId": "y", "count": 20})
+                self.assertTrue(response.startswith("Generation Request ID: y"))
+                self.assertEqual(response.count("Grand Number:"), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
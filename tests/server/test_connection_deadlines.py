@@ -0,0 +1,133 @@
+import json
+import socket
+import threading
+import time
+import unittest
+from src.server.presentation.socket import ConnectionDeadlines
+
+
+class ReceiveRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def testReadsUpToTheNewline(self):
+        # The first part ends in the middle of a literal, which is not yet
+        # a JSON value; the request ends with the value and its newline.
+        self.client.sendall(b'{"type": "max", "flag": tr')
+        timer = threading.Timer(0.05, self.client.sendall, [b'ue}\n{"ignored": 1}'])
+        timer.start()
+        try:
+            raw = ConnectionDeadlines().receiveRequest(self.server)
+        finally:
+            timer.join()
+        self.assertEqual(raw, b'{"type": "max", "flag": true}\n')
+
+    def testRequestWithoutNewline(self):
+        # The client keeps its side open and waits for the response.
+        self.client.sendall(b'  {"type": "max"}')
+        self.assertEqual(ConnectionDeadlines(requestTimeout=1).receiveRequest(self.server), b'  {"type": "max"}')
+
+    def testMultiLineRequest(self):
+        payload = json.dumps({"type": "max", "requestId": "pretty", "count": 2}, indent=2).encode()
+        lines = payload.splitlines(keepends=True)
+        self.client.sendall(lines[0])
+        timer = threading.Timer(0.05, self.client.sendall, [b"".join(lines[1:])])
+        timer.start()
+        try:
+            raw = ConnectionDeadlines(requestTimeout=1).receiveRequest(self.server)
+        finally:
+            timer.join()
+        self.assertEqual(raw, payload)
+
+    def testCharacterSplitAcrossReads(self):
+        payload = '{"requestId": "é"}'.encode()
+        self.client.sendall(payload[:-3])
+        timer = threading.Timer(0.05, self.client.sendall, [payload[-3:]])
+        timer.start()
+        try:
+            raw = ConnectionDeadlines(requestTimeout=1).receiveRequest(self.server)
+        finally:
+            timer.join()
+        self.assertEqual(raw, payload)
+
+    def testInvalidLineEndsTheRequest(self):
+        self.client.sendall(b'{"type": max}\n')
+        self.assertEqual(ConnectionDeadlines(requestTimeout=1).receiveRequest(self.server), b'{"type": max}\n')
+
+    def testShutdownEndsTheRequest(self):
+        self.client.sendall(b'{"type": "max"}')
+        self.client.shutdown(socket.SHUT_WR)
+        self.assertEqual(ConnectionDeadlines().receiveRequest(self.server), b'{"type": "max"}')
+
+    def testNothingSentIsAnEmptyRequest(self):
+        self.client.shutdown(socket.SHUT_WR)
+        self.assertEqual(ConnectionDeadlines().receiveRequest(self.server), b"")
+
+    def testHeaderDeadline(self):
+        deadlines = ConnectionDeadlines(readHeaderTimeout=0.05)
+        with self.assertRaisesRegex(TimeoutError, "No request received"):
+            deadlines.receiveRequest(self.server)
+
+    def testRequestDeadline(self):
+        self.client.sendall(b'{"type": "max",\n')
+        deadlines = ConnectionDeadlines(readHeaderTimeout=0.05, requestTimeout=0.1)
+        with self.assertRaisesRegex(TimeoutError, "Request not completed"):
+            deadlines.receiveRequest(self.server)
+
+    def testRequestSizeLimit(self):
+        self.client.sendall(b"x" * 64)
+        with self.assertRaisesRegex(ValueError, "exceeds 16 bytes"):
+            ConnectionDeadlines(maxRequestBytes=16).receiveRequest(self.server)
+
+
+class SendResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def testSendsEveryChunk(self):
+        sent = ConnectionDeadlines().sendResponse(self.server, [b"ab", b"", b"cd"])
+        self.server.shutdown(socket.SHUT_WR)
+        self.assertEqual(sent, 4)
+        self.assertEqual(self.client.recv(16), b"abcd")
+
+    def testWriteDeadline(self):
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        deadlines = ConnectionDeadlines(writeTimeout=0.1, minTransferRate=0)
+        with self.assertRaisesRegex(TimeoutError, "Write stalled"):
+            deadlines.sendResponse(self.server, b"x" * (8 * 1024 * 1024))
+
+    def testResponseDeadlineIncludesProducingChunks(self):
+        def slowChunks():
+            for _ in range(20):
+                time.sleep(0.02)
+                yield b"x"
+
+        deadlines = ConnectionDeadlines(writeTimeout=5.0, responseTimeout=0.1)
+        started = time.monotonic()
+        with self.assertRaisesRegex(TimeoutError, "Response not sent within 0.1s"):
+            deadlines.sendResponse(self.server, slowChunks())
+        self.assertLess(time.monotonic() - started, 0.3)
+
+    def testResponseDeadlineCutsABlockedSend(self):
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        deadlines = ConnectionDeadlines(writeTimeout=5.0, responseTimeout=0.1, minTransferRate=0)
+        with self.assertRaisesRegex(TimeoutError, "Response not sent within"):
+            deadlines.sendResponse(self.server, b"x" * (8 * 1024 * 1024))
+
+    def testRejectsNonPositiveTimeouts(self):
+        with self.assertRaises(ValueError):
+            ConnectionDeadlines(responseTimeout=0)
+        with self.assertRaises(ValueError):
+            ConnectionDeadlines(writeTimeout=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
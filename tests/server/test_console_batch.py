@@ -0,0 +1,118 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from src.server.presentation.console import Console
+
+
+class ConsoleBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def createTicket(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr), \
+                self.assertRaises(SystemExit) as exit:
+            Console().createTicket(list(argv))
+        return exit.exception.code, stdout.getvalue(), stderr.getvalue()
+
+    def testJsonLinesWithErrors(self):
+        path = self.write("requests.jsonl", "\n".join([
+            '{"type": "max", "requestId": "a", "count": 2}',
+            '{"type": "grand", "requestId": "b"}',
+            "{broken",
+            "",
+            '{"type": "nope", "requestId": "c"}',
+            '{"type": "lottario", "requestId": "d", "seed": 3}',
+        ]))
+        code, stdout, stderr = self.createTicket("--batch", path)
+
+        self.assertEqual(code, 1)
+        self.assertEqual([line.split(":")[0] for line in stderr.splitlines()],
+                         ["[Error] line 3", "[Error] line 5"])
+        self.assertIn("Invalid JSON", stderr)
+        self.assertEqual(stdout.count("Generation Request ID:"), 3)
+        self.assertEqual(stdout.count("Lotto Max Numbers:"), 2)
+
+    def testCsvToFiles(self):
+        path = self.write("requests.csv", "type,requestId,count\nmax,a,3\n,,\ngrand,b,\n")
+        output = os.path.join(self.directory.name, "out")
+        code, stdout, stderr = self.createTicket("--batch", path, "--output-dir", output)
+
+        self.assertEqual((code, stdout, stderr), (0, "", ""))
+        self.assertEqual(sorted(os.listdir(output)), ["ticket_a.txt", "ticket_b.txt"])
+        with open(os.path.join(output, "ticket_a.txt")) as f:
+            self.assertEqual(f.read().count("Lotto Max Numbers:"), 3)
+        with open(os.path.join(output, "ticket_b.txt")) as f:
+            self.assertEqual(f.read().count("Grand Number:"), 1)
+
+    def testRequestIdsCannotNameAPath(self):
+        path = self.write("requests.jsonl", "\n".join([
+            '{"type": "max", "requestId": "../../escaped"}',
+            '{"type": "max", "requestId": "a/b"}',
+        ]))
+        output = os.path.join(self.directory.name, "out")
+        code, _, stderr = self.createTicket("--batch", path, "--output-dir", output)
+
+        self.assertEqual((code, stderr), (0, ""))
+        self.assertEqual(sorted(os.listdir(output)), ["ticket_.._.._escaped.txt", "ticket_a_b.txt"])
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["out", "requests.jsonl"])
+
+    def testDuplicateRequestIdsAreReported(self):
+        path = self.write("requests.jsonl", "\n".join([
+            '{"type": "max", "requestId": "a", "count": 2}',
+            '{"type": "grand", "requestId": "a"}',
+            '{"type": "grand", "requestId": "a?"}',
+            '{"type": "grand", "requestId": "a!"}',
+        ]))
+        output = os.path.join(self.directory.name, "out")
+        code, _, stderr = self.createTicket("--batch", path, "--output-dir", output)
+
+        self.assertEqual(code, 1)
+        self.assertEqual([line.split(":")[0] for line in stderr.splitlines()],
+                         ["[Error] line 2", "[Error] line 4"])
+        self.assertIn("already written for line 1", stderr)
+        self.assertIn("already written for line 3", stderr)
+        with open(os.path.join(output, "ticket_a.txt")) as f:
+            self.assertEqual(f.read().count("Lotto Max Numbers:"), 2)
+
+    def testLineNumbersCountLeadingBlankLines(self):
+        jsonl = self.write("requests.jsonl", '\n\n{"type": "max", "requestId": "a"}\n{broken\n')
+        csvPath = self.write("requests.csv", "\n\ntype,requestId\nmax,a\nnope,b\n")
+        _, _, jsonlErrors = self.createTicket("--batch", jsonl)
+        _, _, csvErrors = self.createTicket("--batch", csvPath)
+
+        self.assertTrue(jsonlErrors.startswith("[Error] line 4:"), jsonlErrors)
+        self.assertTrue(csvErrors.startswith("[Error] line 5:"), csvErrors)
+
+    def testCombinedOutputFile(self):
+        path = self.write("requests.jsonl", '{"type": "max", "requestId": "a"}\n{"type": "max", "requestId": "b"}\n')
+        output = os.path.join(self.directory.name, "all.txt")
+        code, _, _ = self.createTicket("--batch", path, "-o", output)
+
+        self.assertEqual(code, 0)
+        with open(output) as f:
+            lines = f.read().splitlines()
+        self.assertEqual([line for line in lines if line.startswith("Generation Request ID:")],
+                         ["Generation Request ID: a", "Generation Request ID: b"])
+        self.assertEqual(lines[lines.index("Generation Request ID: b") - 1], "")
+
+    def testBatchExcludesSingleRequestOptions(self):
+        path = self.write("requests.jsonl", "")
+        code, _, stderr = self.createTicket("--batch", path, "-t", "max")
+        self.assertEqual(code, 2)
+        self.assertIn("cannot be combined with --batch", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
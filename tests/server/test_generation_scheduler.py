@@ -0,0 +1,112 @@
+import time
+import unittest
+from src.server.models.randomness import IRandomGenerator, MersenneTwisterGenerator
+from src.server.services import TicketService
+from src.server.services.scheduling import GenerationScheduler
+from src.server.services.transients.LotteryType import LotteryType
+
+
+class SlowGenerator(IRandomGenerator):
+    """
+    Takes a millisecond per number, so consumers outrun the workers.
+    """
+
+    def __init__(self):
+        self.source = MersenneTwisterGenerator()
+
+    def randbelow(self, n):
+        time.sleep(0.001)
+        return self.source.randbelow(n)
+
+
+def numbers(tickets):
+    return [ticket.numbers for ticket in tickets]
+
+
+class GenerationSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = None
+
+    def tearDown(self):
+        if self.scheduler is not None:
+            self.scheduler.close()
+
+    def start(self, **options):
+        self.scheduler = GenerationScheduler(**options)
+        self.scheduler.start()
+        return self.scheduler
+
+    def testSeededChunksMatchTheTicketService(self):
+        scheduler = self.start(workers=3, chunkSize=7)
+        job = scheduler.submit(LotteryType.DAILY_GRAND, 100, seed=12, offset=30)
+        chunks = list(job.iterChunks())
+
+        self.assertEqual([len(chunk) for chunk in chunks], [7] * 14 + [2])
+        expected = TicketService().generateTickets(LotteryType.DAILY_GRAND, 100, seed=12, offset=30)
+        self.assertEqual(numbers(ticket for chunk in chunks for ticket in chunk), numbers(expected))
+
+    def testSmallJobIsNotStuckBehindALargeOne(self):
+        for policy in ("round-robin", "shortest-first"):
+            scheduler = self.start(workers=1, chunkSize=10, policy=policy, maxBufferedChunks=1)
+            large = scheduler.submit(LotteryType.LOTTO_MAX, 10_000)
+            small = scheduler.submit(LotteryType.LOTTO_MAX, 5)
+
+            self.assertEqual(sum(len(chunk) for chunk in small.iterChunks()), 5)
+            # The unread large job is held back by its buffer limit.
+            self.assertGreater(large.remaining, 9_000)
+            large.cancel()
+            scheduler.close()
+
+    def testCancelledJobStopsAndIsDropped(self):
+        scheduler = self.start(workers=1, chunkSize=10, maxBufferedChunks=1)
+        job = scheduler.submit(LotteryType.LOTTO_MAX, 1_000_000)
+        chunks = job.iterChunks()
+        next(chunks)
+        job.cancel()
+
+        with self.assertRaises(ConnectionAbortedError):
+            next(chunks)
+        deadline = time.monotonic() + 5
+        while scheduler.activeJobs() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(scheduler.activeJobs(), 0)
+        self.assertGreater(job.remaining, 999_000)
+        job.cancel()
+
+    def testAbandonedConsumerCancelsTheJob(self):
+        scheduler = self.start(workers=1, chunkSize=10, maxBufferedChunks=1)
+        job = scheduler.submit(LotteryType.LOTTO_MAX, 1_000_000, SlowGenerator())
+
+        with self.assertRaisesRegex(ConnectionAbortedError, "Peer disconnected"):
+            list(job.iterChunks(pollInterval=0.01, isAbandoned=lambda: True))
+        self.assertGreater(job.remaining, 999_000)
+
+    def testDeadlineExpires(self):
+        scheduler = self.start(workers=1, chunkSize=10, maxBufferedChunks=1)
+        job = scheduler.submit(LotteryType.LOTTO_MAX, 1_000_000, timeout=0.05)
+        chunks = job.iterChunks()
+        next(chunks)
+        time.sleep(0.1)
+
+        with self.assertRaisesRegex(TimeoutError, "deadline"):
+            for _ in range(1_000_000):
+                next(chunks)
+
+    def testCloseCancelsJobsAndRefusesNewOnes(self):
+        scheduler = self.start(workers=1, chunkSize=10, maxBufferedChunks=1)
+        job = scheduler.submit(LotteryType.LOTTO_MAX, 1_000_000)
+        scheduler.close()
+
+        with self.assertRaises(ConnectionAbortedError):
+            list(job.iterChunks())
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(LotteryType.LOTTO_MAX, 1)
+
+    def testRejectsInvalidSettings(self):
+        for options in ({"workers": 0}, {"chunkSize": 0}, {"maxBufferedChunks": 0}, {"policy": "fifo"}):
+            with self.assertRaises(ValueError):
+                GenerationScheduler(**options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import http.client
+import json
+import socket
+import unittest
+from tests.support import runningGateway
+
+
+def post(connection, body, headers=None):
+    connection.request("POST", "/tickets", json.dumps(body), dict({"Content-Type": "application/json"},
+                                                                  **(headers or {})))
+    response = connection.getresponse()
+    return response, response.read()
+
+
+class HttpGatewayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.running = runningGateway(chunkThreshold=4096)
+        cls.gateway, cls.port = cls.running.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.running.__exit__(None, None, None)
+
+    def setUp(self):
+        self.connection = http.client.HTTPConnection("localhost", self.port, timeout=10)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def testHealth(self):
+        self.connection.request("GET", "/health")
+        response = self.connection.getresponse()
+        self.assertEqual((response.status, response.read()), (200, b"ok"))
+
+    def testSmallResponseHasAContentLength(self):
+        response, body = post(self.connection, {"type": "max", "requestId": "a", "count": 2})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(int(response.getheader("Content-Length")), len(body))
+        self.assertIsNone(response.getheader("Transfer-Encoding"))
+        self.assertEqual(body.count(b"Lotto Max Numbers:"), 2)
+
+    def testLargeResponseIsChunked(self):
+        response, body = post(self.connection, {"type": "grand", "requestId": "b", "count": 5000})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        self.assertEqual(body.count(b"Grand Number:"), 5000)
+
+    def testKeepAliveReusesTheConnection(self):
+        post(self.connection, {"type": "max", "requestId": "c", "count": 1})
+        first = self.connection.sock
+        response, _ = post(self.connection, {"type": "max", "requestId": "d", "count": 3000})
+        self.assertIs(self.connection.sock, first)
+        response, _ = post(self.connection, {"type": "max", "requestId": "e", "count": 1})
+        self.assertEqual(response.status, 200)
+        self.assertIs(self.connection.sock, first)
+
+    def testHttp10ClosesByDefault(self):
+        with socket.create_connection(("localhost", self.port), timeout=10) as sock:
+            sock.sendall(b"GET /health HTTP/1.0\r\n\r\n")
+            data = b""
+            while chunk := sock.recv(4096):
+                data += chunk
+        self.assertTrue(data.startswith(b"HTTP/1.1 200"))
+        self.assertIn(b"Connection: close", data)
+
+    def testValidationErrors(self):
+        response, body = post(self.connection, {"type": "nope", "requestId": "f"})
+        self.assertEqual(response.status, 400)
+        self.assertIn("nope", json.loads(body)["error"])
+
+        self.connection.request("POST", "/tickets", b"{not json")
+        response = self.connection.getresponse()
+        self.assertEqual(response.status, 400)
+        response.read()
+
+    def testUnknownPathAndMethod(self):
+        self.connection.request("GET", "/nowhere")
+        response = self.connection.getresponse()
+        self.assertEqual(response.status, 404)
+        response.read()
+
+        self.connection.request("GET", "/tickets")
+        response = self.connection.getresponse()
+        self.assertEqual(response.status, 405)
+        self.assertEqual(response.getheader("Allow"), "POST")
+        response.read()
+
+    def testOversizedBodyClosesTheConnection(self):
+        self.connection.request("POST", "/tickets", b" " * (65 * 1024))
+        response = self.connection.getresponse()
+        self.assertEqual(response.status, 413)
+        self.assertEqual(response.getheader("Connection"), "close")
+        response.read()
+
+
+if __name__ == "__main__":
+    unittest.main()
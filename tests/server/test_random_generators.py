@@ -0,0 +1,84 @@
+import importlib
+import random
+import unittest
+from collections import Counter
+from unittest import mock
+from src.server.models import Pool
+from src.server.models.randomness import BufferedCryptoGenerator, MersenneTwisterGenerator
+from src.server.services import TicketService
+from src.server.services.transients.LotteryType import LotteryType
+
+cryptoModule = importlib.import_module("src.server.models.randomness.BufferedCryptoGenerator")
+
+
+def everyByte(size):
+    """
+    A stand-in for os.urandom returning each byte value equally often.
+    """
+    return bytes(range(256)) * (size // 256)
+
+
+class BufferedCryptoGeneratorTest(unittest.TestCase):
+    def testSmallBoundsAreExactlyUniform(self):
+        # Over a block holding every byte value equally often, rejection
+        # leaves each residue exactly limit / n times.
+        for n in range(1, 257):
+            generator = BufferedCryptoGenerator(blockSize=1024)
+            limit = 4 * (256 - 256 % n)
+            with mock.patch("os.urandom", everyByte):
+                counts = Counter(generator.randbelow(n) for _ in range(limit))
+            self.assertEqual(set(counts), set(range(n)), n)
+            self.assertEqual(set(counts.values()), {limit // n}, n)
+
+    def testRejectedBytesAreNeverUsed(self):
+        # 250 to 255 would bias values below 6 for n = 10.
+        generator = BufferedCryptoGenerator(blockSize=64)
+        with mock.patch("os.urandom", lambda size: bytes([250, 251, 252, 253, 254, 255, 7] * 10)[:size]):
+            self.assertEqual([generator.randbelow(10) for _ in range(20)], [7] * 20)
+
+    def testLargeBoundsUseRejection(self):
+        # Two-byte values 0..511 masked to 9 bits: 0..299 are kept in order.
+        block = b"".join(value.to_bytes(2, "little") for value in range(512))
+        generator = BufferedCryptoGenerator(blockSize=len(block))
+        with mock.patch("os.urandom", lambda size: block):
+            self.assertEqual([generator.randbelow(300) for _ in range(300)], list(range(300)))
+
+    def testRealDrawsStayInRange(self):
+        generator = BufferedCryptoGenerator()
+        for n in (1, 2, 7, 49, 50, 256, 257, 10 ** 6):
+            values = [generator.randbelow(n) for _ in range(2000)]
+            self.assertTrue(all(0 <= value < n for value in values), n)
+
+    def testRejectsInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            BufferedCryptoGenerator(blockSize=16)
+        with self.assertRaises(ValueError):
+            BufferedCryptoGenerator().randbelow(0)
+
+    def testForkResetDropsBufferedValues(self):
+        generator = BufferedCryptoGenerator()
+        generator.randbelow(50)
+        generator.randbelow(1000)
+        cryptoModule._resetAfterFork()
+        self.assertEqual(generator._samples, {})
+        self.assertEqual(generator._raw, b"")
+
+
+class PoolGeneratorTest(unittest.TestCase):
+    def testPoolsDrawUniqueNumbersInRange(self):
+        for generator in (BufferedCryptoGenerator(), MersenneTwisterGenerator()):
+            for _ in range(200):
+                numbers = Pool("Lotto Max", 1, 50, 7, generator).selectRandomly()
+                self.assertEqual(len(set(numbers)), 7)
+                self.assertTrue(all(1 <= number <= 50 for number in numbers))
+
+    def testSeededTwisterIsReproducible(self):
+        def draw():
+            service = TicketService(MersenneTwisterGenerator(random.Random(5)))
+            return [ticket.numbers for ticket in service.generateTickets(LotteryType.LOTTO_MAX, 5)]
+
+        self.assertEqual(draw(), draw())
+
+
+if __name__ == "__main__":
+    unittest.main()
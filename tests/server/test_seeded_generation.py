@@ -0,0 +1,87 @@
+import unittest
+from collections import Counter
+from src.server.models.randomness import CounterGenerator, MersenneTwisterGenerator
+from src.server.presentation import GenerateTicketController
+from src.server.services.parallel import ThreadPoolTicketExecutor
+from src.server.services.scheduling import GenerationScheduler
+
+REQUEST = {"type": "max", "requestId": "seeded", "count": 5000, "seed": "draw-2026"}
+
+
+def draws(generator, n, count):
+    return [generator.randbelow(n) for _ in range(count)]
+
+
+class CounterGeneratorTest(unittest.TestCase):
+    def testTicketDependsOnlyOnSeedAndIndex(self):
+        generator = CounterGenerator(42)
+        first = draws(generator.at(7), 50, 20)
+
+        self.assertEqual(draws(CounterGenerator("42", 7), 50, 20), first)
+        self.assertEqual(draws(generator.at(7).spawn(), 50, 20), first)
+        self.assertNotEqual(draws(generator.at(8), 50, 20), first)
+        self.assertNotEqual(draws(CounterGenerator(43, 7), 50, 20), first)
+
+    def testValuesAreInRangeAndUnbiased(self):
+        generator = CounterGenerator("uniform")
+        for n in (1, 3, 255, 256, 257, 1000, 2 ** 40 + 1):
+            self.assertTrue(all(0 <= value < n for value in draws(generator, n, 200)))
+
+        counts = Counter(draws(CounterGenerator("buckets"), 3, 30000))
+        for value in range(3):
+            self.assertAlmostEqual(counts[value] / 30000, 1 / 3, delta=0.015)
+        with self.assertRaises(ValueError):
+            generator.randbelow(0)
+
+
+class SeededRequestTest(unittest.TestCase):
+    def expected(self):
+        return [ticket.numbers for ticket in GenerateTicketController.fromRequest(REQUEST).execute().tickets]
+
+    def testRepeatable(self):
+        first = self.expected()
+        self.assertEqual(self.expected(), first)
+        generator = MersenneTwisterGenerator()
+        self.assertEqual([ticket.numbers for ticket in
+                          GenerateTicketController.fromRequest(REQUEST, generator).execute().tickets], first)
+
+    def testPagesMatchTheWholeBatch(self):
+        whole = self.expected()
+        pages = []
+        for offset in range(0, 5000, 1500):
+            page = GenerateTicketController.fromRequest(dict(REQUEST, offset=offset, limit=1500)).execute()
+            pages.extend(ticket.numbers for ticket in page.tickets)
+        self.assertEqual(pages, whole)
+
+    def testSchedulerAndThreadPoolMatchExecute(self):
+        controller = GenerateTicketController.fromRequest(REQUEST)
+        expected = "".join(controller.execute().iterChunks())
+
+        scheduler = GenerationScheduler(workers=3, chunkSize=300)
+        scheduler.start()
+        try:
+            response = controller.schedule(scheduler)
+            scheduled = "".join(response.iterChunks())
+        finally:
+            scheduler.close()
+
+        executor = ThreadPoolTicketExecutor(threads=4, chunkSize=700, ignoreGil=True)
+        try:
+            threaded = "".join(controller.execute(executor).iterChunks())
+        finally:
+            executor.close()
+
+        self.assertEqual(expected.count("Lotto Max Numbers:"), 5000)
+        self.assertEqual(scheduled, expected)
+        self.assertEqual(threaded, expected)
+
+    def testRejectsInvalidPaging(self):
+        for fields in ({"offset": 5000}, {"offset": -1}, {"limit": 0}, {"seed": True}, {"seed": 1.5}):
+            with self.assertRaises(ValueError):
+                GenerateTicketController.fromRequest(dict(REQUEST, **fields))
+        with self.assertRaises(ValueError):
+            GenerateTicketController.fromRequest({"type": "max", "requestId": "x", "offset": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
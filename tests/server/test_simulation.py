@@ -0,0 +1,81 @@
+import unittest
+from math import comb, isclose
+from src.server.services import SimulationService, WinningCheckService
+from src.server.services.simulation import (hypergeometric, matchProbability, positionProbability,
+                                            tierProbability, wilsonInterval)
+from src.server.services.scoring import PRIZE_TIERS
+from src.server.services.transients.LotteryType import LotteryType
+
+
+class OddsTest(unittest.TestCase):
+    def testJackpotOdds(self):
+        cases = {
+            LotteryType.LOTTO_MAX: comb(50, 7),
+            LotteryType.LOTTARIO: comb(45, 6),
+            LotteryType.DAILY_GRAND: comb(49, 5) * 7,
+        }
+        for type, combinations in cases.items():
+            pools = WinningCheckService().poolsFor(type)
+            jackpot = PRIZE_TIERS[type][0][1]
+            self.assertTrue(isclose(tierProbability(pools, jackpot), 1 / combinations, rel_tol=1e-12), type)
+
+    def testDistributionsSumToOne(self):
+        for type in LotteryType:
+            for pool in WinningCheckService().poolsFor(type):
+                self.assertAlmostEqual(sum(matchProbability(pool, count) for count in range(pool.pickCount + 1)), 1.0)
+                for position in range(pool.pickCount):
+                    total = sum(positionProbability(pool, position, number)
+                                for number in range(pool.startNumber, pool.endNumber + 1))
+                    self.assertAlmostEqual(total, 1.0)
+
+    def testHypergeometric(self):
+        # Three of the six numbers of a 6/49 draw.
+        self.assertAlmostEqual(hypergeometric(49, 6, 6, 3), 246820 / 13983816)
+        self.assertEqual(hypergeometric(49, 6, 6, 7), 0.0)
+        self.assertEqual(hypergeometric(49, 6, 6, -1), 0.0)
+
+    def testWilsonInterval(self):
+        low, high = wilsonInterval(0, 100)
+        self.assertEqual(low, 0.0)
+        self.assertAlmostEqual(high, 3.841459 / 103.841459, places=6)
+
+        low, high = wilsonInterval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        self.assertEqual(wilsonInterval(0, 0), (0.0, 1.0))
+        self.assertEqual(wilsonInterval(0, 1000)[0], 0.0)
+        self.assertEqual(wilsonInterval(1000, 1000)[1], 1.0)
+
+
+class SimulationServiceTest(unittest.TestCase):
+    def testIntervalsCoverTheExactOdds(self):
+        covered = total = 0
+        for seed in range(20):
+            result = SimulationService(workers=1).simulate(LotteryType.LOTTARIO, 100, 500, seed=seed)
+            name, rows = result.matchHistograms[0]
+            self.assertEqual(sum(row["hits"] for row in rows), 100 * 500)
+            for row in result.tiers + rows:
+                self.assertGreaterEqual(row["designEffect"], 1.0)
+                if row["exact"] > 1e-3:
+                    total += 1
+                    covered += row["low"] <= row["exact"] <= row["high"]
+        # 95% intervals; allow for the luck of 20 runs.
+        self.assertGreaterEqual(covered / total, 0.85)
+
+    def testReproducible(self):
+        runs = [SimulationService(workers=1).simulate(LotteryType.DAILY_GRAND, 20, 100, seed="same")
+                for _ in range(2)]
+        self.assertEqual(*[[tier["hits"] for tier in run.tiers] for run in runs])
+        self.assertIn("exact 1 in 13,348,188.0", str(runs[0]))
+
+    def testProcessPool(self):
+        result = SimulationService(workers=2).simulate(LotteryType.LOTTO_MAX, 16, 50, seed=1)
+        self.assertEqual(sum(row["hits"] for row in result.matchHistograms[0][1]), 16 * 50)
+
+    def testRejectsEmptyRuns(self):
+        with self.assertRaises(ValueError):
+            SimulationService(workers=1).simulate(LotteryType.LOTTO_MAX, 0, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import unittest
+from src.server.presentation.socket import ConnectionDeadlines
+from tests.support import runningDaemon, exchange
+
+
+def request(**fields):
+    return json.dumps(dict({"type": "max", "requestId": "r1", "count": 2}, **fields)).encode()
+
+
+class SocketDaemonTest(unittest.TestCase):
+    def testRequestSplitInsideALiteral(self):
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, request()[:-3], request()[-3:] + b"\n", pause=0.05)
+        self.assertTrue(response.startswith(b"Generation Request ID: r1"))
+        self.assertEqual(response.count(b"Lotto Max Numbers:"), 2)
+
+    def testRequestWithoutNewline(self):
+        # Sent the way clients did before the newline existed, waiting for
+        # the response with the connection open.
+        deadlines = ConnectionDeadlines(requestTimeout=1)
+        with runningDaemon(deadlines=deadlines) as (daemon, path):
+            response = exchange(path, request())
+        self.assertTrue(response.startswith(b"Generation Request ID: r1"))
+        self.assertEqual(daemon.timedOutConnections, 0)
+
+    def testMultiLineRequest(self):
+        payload = json.dumps({"type": "grand", "requestId": "pretty", "count": 2}, indent=2).encode()
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, payload)
+        self.assertEqual(response.count(b"Grand Number:"), 2)
+
+    def testRequestEndedByShutdown(self):
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, request(count=3000), shutdown=True)
+        self.assertEqual(response.count(b"Lotto Max Numbers:"), 3000)
+
+    def testTrailerOnlyWhenRequested(self):
+        with runningDaemon() as (daemon, path):
+            plain = exchange(path, request())
+            ended = exchange(path, request(trailer="\n[End]\n"))
+            error = exchange(path, request(type="nope", trailer="\n[End]\n"))
+        self.assertFalse(plain.endswith(b"[End]\n"))
+        self.assertTrue(ended.endswith(b"\n[End]\n"))
+        self.assertEqual(ended[:-len(b"\n[End]\n")].count(b"Lotto Max Numbers:"), 2)
+        self.assertTrue(error.startswith(b"[Error] ") and error.endswith(b"\n[End]\n"))
+
+    def testIncompleteRequestTimesOut(self):
+        deadlines = ConnectionDeadlines(readHeaderTimeout=0.1, requestTimeout=0.2)
+        with runningDaemon(deadlines=deadlines) as (daemon, path):
+            response = exchange(path, request()[:-1] + b"\n")
+        self.assertEqual(response, b"")
+        self.assertEqual(daemon.timedOutConnections, 1)
+
+    def testInvalidRequestGetsAnError(self):
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, b'{"type": max}\n')
+        self.assertTrue(response.startswith(b"[Error] "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from src.server.models.randomness import IRandomGenerator, MersenneTwisterGenerator
+from src.server.services import TicketService
+from src.server.services.parallel import ThreadPoolTicketExecutor, gilEnabled
+from src.server.services.transients.LotteryType import LotteryType
+
+
+class RecordingGenerator(IRandomGenerator):
+    """
+    Remembers the threads its spawned generators draw on.
+    """
+
+    def __init__(self, spawned=None):
+        self.spawned = spawned if spawned is not None else []
+        self.source = MersenneTwisterGenerator().spawn()
+        self.threads = set()
+
+    def spawn(self):
+        generator = RecordingGenerator(self.spawned)
+        self.spawned.append(generator)
+        return generator
+
+    def randbelow(self, n):
+        self.threads.add(threading.get_ident())
+        return self.source.randbelow(n)
+
+
+class ThreadPoolTicketExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolTicketExecutor(threads=4, chunkSize=100, ignoreGil=True)
+
+    def tearDown(self):
+        self.executor.close()
+
+    def testParallelOnlyWithoutTheGilOrWhenForced(self):
+        self.assertTrue(self.executor.parallel)
+        self.assertEqual(ThreadPoolTicketExecutor(threads=4).parallel, not gilEnabled())
+        self.assertFalse(ThreadPoolTicketExecutor(threads=1, ignoreGil=True).parallel)
+        for options in ({"threads": 0}, {"chunkSize": 0}):
+            with self.assertRaises(ValueError):
+                ThreadPoolTicketExecutor(**options)
+
+    def testEveryThreadDrawsWithItsOwnGenerator(self):
+        base = RecordingGenerator()
+        tickets = self.executor.generateTickets(LotteryType.LOTTARIO, 1000, base)
+
+        self.assertEqual(len(tickets), 1000)
+        for ticket in tickets:
+            self.assertEqual(len(set(ticket.numbers[0])), 6)
+            self.assertTrue(all(1 <= number <= 45 for number in ticket.numbers[0]))
+        self.assertFalse(base.threads)
+        self.assertTrue(1 <= len(base.spawned) <= 4)
+        for generator in base.spawned:
+            self.assertEqual(len(generator.threads), 1)
+        self.assertEqual(len({thread for generator in base.spawned for thread in generator.threads}),
+                         len(base.spawned))
+
+    def testSmallRequestsStayOnTheCallingThread(self):
+        base = RecordingGenerator()
+        for ticket in self.executor.generateTickets(LotteryType.LOTTARIO, 150, base):
+            ticket.numbers
+        self.assertEqual(base.threads, {threading.get_ident()})
+        self.assertEqual(base.spawned, [])
+
+    def testSeededBatchesMatchASingleThread(self):
+        for offset in (0, 37):
+            threaded = self.executor.generateTickets(LotteryType.DAILY_GRAND, 1050, seed=8, offset=offset)
+            single = TicketService().generateTickets(LotteryType.DAILY_GRAND, 1050, seed=8, offset=offset)
+            self.assertEqual([ticket.numbers for ticket in threaded], [ticket.numbers for ticket in single])
+
+    def testErrorsReachTheCaller(self):
+        with self.assertRaises(ValueError):
+            self.executor.generateTickets("nope", 1000)
+
+    def testReusableAfterClose(self):
+        self.executor.generateTickets(LotteryType.LOTTO_MAX, 500)
+        self.executor.close()
+        self.assertEqual(len(self.executor.generateTickets(LotteryType.LOTTO_MAX, 500)), 500)
+
+
+class SpawnTest(unittest.TestCase):
+    def testSpawnedTwistersAreIndependent(self):
+        base = MersenneTwisterGenerator()
+        first, second = base.spawn(), base.spawn()
+        self.assertIsNot(first.rng, second.rng)
+        self.assertNotEqual([first.randbelow(2 ** 32) for _ in range(4)],
+                            [second.randbelow(2 ** 32) for _ in range(4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import glob
+import json
+import os
+import random
+import tempfile
+import threading
+import unittest
+from src.server.services.tracing import Tracer, currentTrace, span
+from tests.support import runningDaemon, exchange
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class TracerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testUnsampledRequestsRecordNothing(self):
+        tracer = Tracer(self.directory.name, sampleRate=0.0)
+        trace, token = tracer.begin("quiet")
+        self.assertIsNone(trace)
+        self.assertIsNone(currentTrace())
+        with span("stage") as stage:
+            self.assertIsNotNone(stage)
+        self.assertIsNone(tracer.end(trace, token))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def testSampledTraceIsChromeJson(self):
+        tracer = Tracer(self.directory.name, sampleRate=1.0)
+        trace, token = tracer.begin("a/b c")
+        with span("outer", count=3):
+            worker = threading.Thread(target=lambda: trace.record("on worker", trace.start, 1000), name="worker")
+            worker.start()
+            worker.join()
+        with self.assertRaises(ValueError), span("failing"):
+            raise ValueError("boom")
+        path = tracer.end(trace, token)
+
+        self.assertIsNone(currentTrace())
+        self.assertEqual(os.path.basename(path).split("-")[1], "a_b_c")
+        document = load(path)
+        self.assertEqual(document["otherData"]["reason"], "sampled")
+        events = {event["name"]: event for event in document["traceEvents"]}
+        self.assertEqual(events["outer"]["args"], {"count": 3})
+        self.assertEqual(events["failing"]["args"], {"error": "ValueError: boom"})
+        self.assertEqual(events["request a/b c"]["ph"], "X")
+        self.assertNotEqual(events["on worker"]["tid"], events["outer"]["tid"])
+        self.assertIn({"name": "worker"}, [event["args"] for event in document["traceEvents"]
+                                           if event["name"] == "thread_name"])
+        self.assertTrue(all(event["dur"] >= 0 for event in document["traceEvents"] if event["ph"] == "X"))
+
+    def testSlowRequestsAreExportedWhateverTheSampling(self):
+        tracer = Tracer(self.directory.name, sampleRate=0.0, slowThresholdMs=0.0)
+        trace, token = tracer.begin("slow")
+        self.assertFalse(trace.sampled)
+        self.assertEqual(load(tracer.end(trace, token))["otherData"]["reason"], "slow")
+
+        tracer = Tracer(self.directory.name, sampleRate=0.0, slowThresholdMs=60_000)
+        trace, token = tracer.begin("fast")
+        self.assertIsNone(tracer.end(trace, token))
+        self.assertEqual(tracer.exported, 0)
+
+    def testSampleRate(self):
+        tracer = Tracer(self.directory.name, sampleRate=0.25, rng=random.Random(3))
+        sampled = 0
+        for _ in range(1000):
+            trace, token = tracer.begin()
+            sampled += trace is not None
+            tracer.end(trace, token)
+        self.assertAlmostEqual(sampled / 1000, 0.25, delta=0.05)
+        self.assertEqual(tracer.exported, sampled)
+        with self.assertRaises(ValueError):
+            Tracer(self.directory.name, sampleRate=1.5)
+
+    def testDaemonExportsItsStages(self):
+        tracer = Tracer(self.directory.name, sampleRate=1.0)
+        with runningDaemon(tracer=tracer) as (daemon, path):
+            exchange(path, json.dumps({"type": "max", "requestId": "traced", "count": 2}).encode() + b"\n")
+
+        paths = glob.glob(os.path.join(self.directory.name, "trace-traced-*.json"))
+        self.assertEqual(len(paths), 1)
+        names = {event["name"] for event in load(paths[0])["traceEvents"]}
+        self.assertTrue({"read request", "parse request", "dispatch", "send response"} <= names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import socket
+import stat
+import tempfile
+import unittest
+from src.server.presentation.socket.transports import TcpTransport, UnixTransport
+from src.client import transports as clientTransports
+from tests.support import freePort
+
+
+class UnixTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "daemon.sock")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testRoundTripWithFileMode(self):
+        transport = UnixTransport(self.path, mode=0o600)
+        listener = transport.listen(1)
+        try:
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+            client = clientTransports.UnixTransport(self.path).connect(timeout=1)
+            conn, _ = listener.accept()
+            with client, conn:
+                client.sendall(b"ping")
+                self.assertEqual(conn.recv(4), b"ping")
+        finally:
+            listener.close()
+            transport.close()
+        self.assertFalse(os.path.exists(self.path))
+
+    def testReplacesAStaleSocket(self):
+        UnixTransport(self.path).listen(1).close()
+        self.assertTrue(os.path.exists(self.path))
+        listener = UnixTransport(self.path).listen(1)
+        listener.close()
+
+    def testRefusesToReplaceOtherFiles(self):
+        with open(self.path, "w") as f:
+            f.write("data")
+        with self.assertRaisesRegex(RuntimeError, "non-socket"):
+            UnixTransport(self.path).listen(1)
+
+    def testDescribe(self):
+        self.assertEqual(UnixTransport(self.path).describe(), f"unix:{self.path}")
+
+
+class TcpTransportTest(unittest.TestCase):
+    def testRoundTripWithNoDelay(self):
+        port = freePort()
+        transport = TcpTransport(port, noDelay=True)
+        listener = transport.listen(1)
+        try:
+            client = clientTransports.TcpTransport(port, noDelay=True).connect(timeout=1)
+            conn, _ = listener.accept()
+            transport.configureConnection(conn)
+            with client, conn:
+                self.assertTrue(conn.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+                self.assertTrue(client.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+                client.sendall(b"ping")
+                self.assertEqual(conn.recv(4), b"ping")
+        finally:
+            listener.close()
+
+    def testRejectsPrivilegedPorts(self):
+        with self.assertRaises(ValueError):
+            TcpTransport(80)
+
+    def testConnectionRefused(self):
+        with self.assertRaises(ConnectionRefusedError):
+            clientTransports.TcpTransport(freePort()).connect(timeout=1)
+
+    def testDescribe(self):
+        self.assertEqual(TcpTransport(4000, "::1").describe(), "[::1]:4000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import random
+import unittest
+from itertools import combinations
+from math import exp
+from unittest import mock
+from src.server.models.randomness import GENERATORS, MersenneTwisterGenerator
+from src.server.services import TicketService, ValidationService, WinningCheckService
+from src.server.services.transients.LotteryType import LotteryType
+from src.server.services.validation import (BACKENDS, chiSquareSurvival, countIndex, gammaQ,
+                                            kolmogorovDistance, kolmogorovSurvival, pearson)
+
+
+class BiasedGenerator(MersenneTwisterGenerator):
+    """
+    Draws the smaller of two numbers, so low numbers come up too often.
+    """
+
+    def spawn(self):
+        return BiasedGenerator(random.Random())
+
+    def randbelow(self, n):
+        return min(super().randbelow(n), super().randbelow(n))
+
+
+class StatisticsTest(unittest.TestCase):
+    def testChiSquareCriticalValues(self):
+        self.assertAlmostEqual(chiSquareSurvival(3.841459, 1), 0.05, places=6)
+        self.assertAlmostEqual(chiSquareSurvival(18.307, 10), 0.05, places=4)
+        self.assertAlmostEqual(chiSquareSurvival(6.634897, 1), 0.01, places=6)
+        self.assertAlmostEqual(chiSquareSurvival(0.0, 5), 1.0)
+
+    def testGammaQ(self):
+        for x in (0.1, 1.0, 5.0, 30.0):
+            self.assertAlmostEqual(gammaQ(1, x), exp(-x), places=10)
+
+    def testKolmogorov(self):
+        # Asymptotic 5% critical value of sqrt(n) * D.
+        self.assertAlmostEqual(kolmogorovSurvival(1.358 / 1e3, 1_000_000), 0.05, places=3)
+        self.assertEqual(kolmogorovSurvival(0.0, 100), 1.0)
+        self.assertAlmostEqual(kolmogorovDistance([1, 1, 2], [0.5, 0.25, 0.25]), 0.25)
+        self.assertEqual(kolmogorovDistance([0, 0], [0.5, 0.5]), 0.0)
+
+    def testPearsonMergesSparseCells(self):
+        statistic, dof = pearson([10, 10], [10.0, 10.0])
+        self.assertEqual((statistic, dof), (0.0, 1))
+        statistic, dof = pearson([1, 2, 3, 14], [1.0, 2.0, 3.0, 14.0])
+        self.assertEqual(dof, 1)
+        statistic, dof = pearson([3, 4, 13], [2.0, 4.0, 14.0])
+        self.assertEqual(dof, 1)
+        self.assertAlmostEqual(statistic, 1 / 6 + 1 / 14)
+
+
+class CountIndexTest(unittest.TestCase):
+    def testMatchesNaiveCounting(self):
+        for type in LotteryType:
+            service = WinningCheckService()
+            tickets = TicketService().generateTickets(type, 700, seed=f"count-{type.value}")
+            counts = countIndex(service.indexTickets(type, tickets))
+
+            for poolIndex, pool in enumerate(service.poolsFor(type)):
+                numbers = list(range(pool.startNumber, pool.endNumber + 1))
+                drawn = [sorted(ticket.numbers[poolIndex]) for ticket in tickets]
+                frequency = [sum(number in row for row in drawn) for number in numbers]
+                positions = [[sum(row[position] == number for row in drawn) for number in numbers]
+                             for position in range(pool.pickCount)]
+                pairs = [sum(a in row and b in row for row in drawn) for a, b in combinations(numbers, 2)]
+
+                self.assertEqual(counts[poolIndex]["frequency"], frequency)
+                self.assertEqual(counts[poolIndex]["positions"], positions)
+                self.assertEqual(counts[poolIndex]["pairs"], pairs)
+
+
+class ValidationServiceTest(unittest.TestCase):
+    def testUniformBackendsPass(self):
+        service = ValidationService(workers=1, chunkSize=20000)
+        # "mt" is unseeded; a tiny alpha keeps its false failures out of the suite.
+        for backend, alpha in (("counter", 0.01), ("mt", 1e-6)):
+            report = service.validate(LotteryType.LOTTARIO, 40000, backend, seed=7, alpha=alpha)
+            self.assertTrue(report.passed, str(report))
+
+    def testBiasedBackendFails(self):
+        with mock.patch.dict(GENERATORS, biased=BiasedGenerator), \
+                mock.patch("src.server.services.ValidationService.BACKENDS", BACKENDS + ("biased",)):
+            report = ValidationService(workers=1).validate(LotteryType.LOTTARIO, 20000, "biased", alpha=1e-6)
+        self.assertFalse(report.passed)
+        self.assertIn("FAIL", str(report))
+
+    def testRejectsInvalidArguments(self):
+        service = ValidationService(workers=1)
+        for options in ({"tickets": 0}, {"backend": "nope"}, {"alpha": 0}, {"alpha": 1}):
+            arguments = dict({"type": LotteryType.LOTTO_MAX, "tickets": 10}, **options)
+            with self.assertRaises(ValueError):
+                service.validate(**arguments)
+        with self.assertRaises(ValueError):
+            ValidationService(chunkSize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import time
+import unittest
+from itertools import combinations
+from src.server.presentation import GenerateWheelController
+from src.server.services import WheelService
+from src.server.services.transients.LotteryType import LotteryType
+from src.server.services.wheeling import CoveringSearch
+from tests.support import runningDaemon, exchange
+
+NUMBERS = [2, 5, 9, 13, 17, 21, 26, 30, 34, 41]
+
+
+def guaranteeHolds(tickets, numbers, match, ifDrawn):
+    """
+    Brute force: every ifDrawn of the numbers share `match` with some ticket.
+    """
+    wheeled = [set(ticket.numbers[0]) for ticket in tickets]
+    return all(any(len(drawn & ticket) >= match for ticket in wheeled)
+               for drawn in map(set, combinations(numbers, ifDrawn)))
+
+
+class WheelServiceTest(unittest.TestCase):
+    def testGuaranteeHoldsByBruteForce(self):
+        for match, ifDrawn in ((2, 2), (3, 3), (3, 4), (4, 6)):
+            tickets, guarantee = WheelService().generateWheel(LotteryType.LOTTARIO, NUMBERS, match, ifDrawn,
+                                                              timeBudget=0.05)
+            self.assertTrue(guarantee["guaranteed"])
+            self.assertEqual(guarantee["tickets"], len(tickets))
+            self.assertTrue(guaranteeHolds(tickets, NUMBERS, match, ifDrawn), (match, ifDrawn))
+            for ticket in tickets:
+                self.assertTrue(set(ticket.numbers[0]) <= set(NUMBERS))
+
+    def testSameSeedSameWheel(self):
+        wheels = [WheelService().generateWheel(LotteryType.LOTTO_MAX, NUMBERS, 3, timeBudget=0.05, seed="s")[0]
+                  for _ in range(2)]
+        self.assertEqual(*[[ticket.numbers[0] for ticket in wheel] for wheel in wheels])
+
+    def testInvalidWheels(self):
+        service = WheelService()
+        for numbers, match, ifDrawn in ((NUMBERS[:5], 2, None), (NUMBERS + [46], 2, None), (NUMBERS, 3, 7)):
+            with self.assertRaises(ValueError):
+                service.generateWheel(LotteryType.LOTTARIO, numbers, match, ifDrawn)
+
+    def testTimeLimitBecomesAValueError(self):
+        with self.assertRaisesRegex(ValueError, "No wheel found within"):
+            WheelService().generateWheel(LotteryType.LOTTARIO, list(range(1, 21)), 4, timeLimit=0)
+
+    def testSearchChecksItsDeadline(self):
+        with self.assertRaises(TimeoutError):
+            CoveringSearch(20, 6, 4, deadline=time.monotonic())
+
+
+class GenerateWheelControllerTest(unittest.TestCase):
+    def request(self, **wheel):
+        return {"type": "lottario", "requestId": "w", "wheel": dict({"numbers": NUMBERS, "match": 3}, **wheel)}
+
+    def testRejectsOversizedWheels(self):
+        with self.assertRaisesRegex(ValueError, "too large"):
+            GenerateWheelController.fromRequest(self.request(numbers=list(range(1, 25)), match=4, **{"if": 6}))
+        GenerateWheelController.fromRequest(self.request(numbers=list(range(1, 21)), match=4))
+
+    def testRejectsInvalidFields(self):
+        for wheel in ({"numbers": []}, {"numbers": [1, 1, 2, 3, 4, 5, 6]}, {"match": 0},
+                      {"match": "x"}, {"timeBudget": 31}):
+            with self.assertRaises(ValueError):
+                GenerateWheelController.fromRequest(self.request(**wheel))
+
+    def testDaemonServesWheels(self):
+        with runningDaemon() as (daemon, path):
+            response = exchange(path, json.dumps(self.request(timeBudget=0)).encode() + b"\n").decode()
+        self.assertEqual(response.splitlines()[0], "Generation Request ID: w")
+        self.assertIn("Wheel Guarantee: 3 if 3 with", response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import random
+import tempfile
+import unittest
+from src.server.presentation import GenerateTicketController
+from src.server.services import TicketService, WinningCheckService
+from src.server.services.scoring import TicketIndex, PRIZE_TIERS
+from src.server.services.transients.LotteryType import LotteryType
+
+
+def naiveCheck(tickets, winningNumbers):
+    """
+    Count matches ticket by ticket: the reference for the bitset engine.
+    """
+    histograms = [{} for _ in winningNumbers]
+    matchesPerTicket = []
+    for numbers in tickets:
+        matches = tuple(len(set(pool) & set(winning)) for pool, winning in zip(numbers, winningNumbers))
+        matchesPerTicket.append(matches)
+        for histogram, count in zip(histograms, matches):
+            histogram[count] = histogram.get(count, 0) + 1
+    return histograms, matchesPerTicket
+
+
+class WinningCheckServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.service = WinningCheckService()
+
+    def draw(self, type, rng):
+        return [sorted(rng.sample(range(pool.startNumber, pool.endNumber + 1), pool.pickCount))
+                for pool in self.service.poolsFor(type)]
+
+    def testMatchesNaiveCounting(self):
+        rng = random.Random(7)
+        for type in LotteryType:
+            winning = self.draw(type, rng)
+            tickets = [ticket.numbers for ticket in TicketService().generateTickets(type, 3000, seed=type.value)]
+            # Add tickets at every match count so all tiers are exercised.
+            for _ in range(200):
+                ticket = self.draw(type, rng)
+                for pool, poolWinning in zip(ticket, winning):
+                    keep = rng.randrange(len(pool) + 1)
+                    pool[:keep] = poolWinning[:keep]
+                if all(len(set(pool)) == len(pool) for pool in ticket):
+                    tickets.append(ticket)
+
+            result = self.service.check(type, self.service.indexTickets(type, tickets), winning)
+            histograms, matchesPerTicket = naiveCheck(tickets, winning)
+
+            self.assertEqual(result.ticketCount, len(tickets))
+            for (_, histogram), expected in zip(result.matchHistograms, histograms):
+                self.assertEqual({k: v for k, v in histogram.items() if v}, expected, type)
+            for (tierName, count), (_, requirement) in zip(result.tierCounts, PRIZE_TIERS[type]):
+                self.assertEqual(count, matchesPerTicket.count(requirement), tierName)
+
+    def testSavedIndexScoresTheSame(self):
+        type = LotteryType.DAILY_GRAND
+        winning = [[3, 14, 15, 26, 49], [7]]
+        index = self.service.indexTickets(type, TicketService().generateTickets(type, 1000, seed=1))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tickets.idx")
+            index.save(path)
+            loaded = TicketIndex.load(path)
+            self.assertEqual(str(self.service.check(type, loaded, winning)),
+                             str(self.service.check(type, index, winning)))
+
+    def testIndexesResponseJournals(self):
+        journal = []
+        for requestId, type in (("a", "max"), ("b", "lottario"), ("c", "max")):
+            response = GenerateTicketController(requestId, type, 5, seed=requestId).execute()
+            journal.extend("".join(response.iterChunks()).splitlines())
+
+        index = self.service.indexJournal(LotteryType.LOTTO_MAX, journal)
+        self.assertEqual(index.count, 10)
+        expected = TicketService().generateTickets(LotteryType.LOTTO_MAX, 5, seed="a")
+        self.assertEqual(index.bitset(0, expected[0].numbers[0][0]) & 1, 1)
+
+    def testRejectsInvalidDraws(self):
+        index = self.service.indexTickets(LotteryType.LOTTARIO, [])
+        with self.assertRaisesRegex(ValueError, "unique winning"):
+            self.service.check(LotteryType.LOTTARIO, index, [[1, 1, 2, 3, 4, 5]])
+        with self.assertRaisesRegex(ValueError, "outside"):
+            self.service.check(LotteryType.LOTTARIO, index, [[1, 2, 3, 4, 5, 46]])
+        with self.assertRaisesRegex(ValueError, "different lottery type"):
+            self.service.check(LotteryType.LOTTO_MAX, index, [[1, 2, 3, 4, 5, 6, 7]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import asyncio
+import contextlib
+import os
+import socket
+import tempfile
+import threading
+import time
+from src.server.presentation.http import HttpGateway
+from src.server.presentation.socket import SocketDaemon
+from src.server.presentation.socket.transports import UnixTransport
+
+
+class RecordingLogger:
+    """
+    Stands in for the client's LoggingService and keeps the messages.
+    """
+
+    def __init__(self):
+        self.infos = []
+        self.errors = []
+
+    def printInfo(self, message):
+        self.infos.append(message)
+
+    def printError(self, message):
+        self.errors.append(message)
+
+    def clear(self):
+        pass
+
+
+def freePort():
+    """
+    Returns:
+        int: A TCP port nothing listens on at the moment.
+    """
+    with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def runningGateway(**options):
+    """
+    Run an HttpGateway on a free port with an event loop in a background thread.
+
+    Yields:
+        tuple: (the gateway, its port)
+    """
+    gateway = HttpGateway(port=freePort(), **options)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    serving = asyncio.run_coroutine_threadsafe(gateway.serve(), loop)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("localhost", gateway.port), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.01)
+    try:
+        yield gateway, gateway.port
+    finally:
+        serving.cancel()
+
+        async def cancelConnections():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancelConnections(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+@contextlib.contextmanager
+def runningDaemon(**options):
+    """
+    Run a SocketDaemon on a Unix socket in a background thread.
+
+    Yields:
+        tuple: (the daemon, the path of its socket)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "daemon.sock")
+        daemon = SocketDaemon("nobody", "nogroup", pidFile=os.devnull,
+                              transport=UnixTransport(path), **options)
+        thread = threading.Thread(target=daemon.run, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        try:
+            yield daemon, path
+        finally:
+            # accept() is not interrupted by closing the socket; a last
+            # (empty) connection wakes the loop up to see the flag.
+            daemon._daemonRunning = False
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+            thread.join(timeout=5)
+
+
+def exchange(path, *parts, shutdown=False, pause=0.0):
+    """
+    Send raw request bytes to a daemon socket and read the whole response.
+
+    Args:
+        path (str): The daemon's Unix socket.
+        parts (bytes): Pieces of the request, sent `pause` seconds apart.
+        shutdown (bool): Shut down the sending side after the request.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(path)
+        for position, part in enumerate(parts):
+            if position and pause:
+                time.sleep(pause)
+            sock.sendall(part)
+        if shutdown:
+            sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+@contextlib.contextmanager
+def scriptedServer(replies):
+    """
+    Answer the n-th connection with replies[n] after reading its request line.
+
+    Yields:
+        tuple: (the socket path, the list of requests received)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "scripted.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(len(replies))
+        requests = []
+
+        def serve():
+            for reply in replies:
+                conn, _ = listener.accept()
+                with conn:
+                    data = b""
+                    while not data.endswith(b"\n"):
+                        data += conn.recv(4096)
+                    requests.append(data)
+                    conn.sendall(reply)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            yield path, requests
+        finally:
+            listener.close()
+            thread.join(timeout=5)